@@ -1,8 +1,9 @@
 """Alembic environment configuration for Mind Scout database migrations."""
 
+import re
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, event, inspect, pool, text
 
 from alembic import context
 from mindscout.config import get_settings
@@ -14,7 +15,7 @@ config = context.config
 
 # Get database URL from Mind Scout settings
 settings = get_settings()
-config.set_main_option("sqlalchemy.url", settings.effective_database_url)
+config.set_main_option("sqlalchemy.url", settings.database_url)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -25,6 +26,13 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+# Memory settings applied for the duration of an online upgrade. Index builds
+# and backfills then sort in memory instead of spilling to temp files.
+MIGRATION_SESSION_SETTINGS = {
+    "maintenance_work_mem": "256MB",
+    "work_mem": "64MB",
+}
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -54,6 +62,13 @@ def run_migrations_online() -> None:
 
     In this scenario we need to create an Engine
     and associate a connection with the context.
+
+    All pending migrations run in a single transaction (PostgreSQL DDL is
+    transactional), so an upgrade commits once. The transaction runs with
+    MIGRATION_SESSION_SETTINGS applied via SET LOCAL. If any revision was
+    applied, planner statistics are then refreshed for the tables its
+    statements touched, so queries can use new columns and indexes right away;
+    a no-op upgrade does not analyze anything.
     """
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
@@ -62,10 +77,43 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
-
-        with context.begin_transaction():
-            context.run_migrations()
+        applied = []
+        statements = []
+
+        def record_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            on_version_apply=lambda step, **kwargs: applied.append(step),
+        )
+
+        event.listen(connection, "before_cursor_execute", record_statement)
+        try:
+            with context.begin_transaction():
+                for name, value in MIGRATION_SESSION_SETTINGS.items():
+                    connection.execute(text(f"SET LOCAL {name} = '{value}'"))
+                context.run_migrations()
+        finally:
+            event.remove(connection, "before_cursor_execute", record_statement)
+
+        if applied:
+            for table in _touched_tables(connection, statements):
+                connection.execute(text(f'ANALYZE "{table}"'))
+            connection.commit()
+
+
+def _touched_tables(connection, statements: list[str]) -> list[str]:
+    """Get the existing tables named in any of the given SQL statements."""
+    tables = []
+    for table in sorted(inspect(connection).get_table_names()):
+        if table == "alembic_version":
+            continue
+        pattern = re.compile(rf"\b{re.escape(table)}\b")
+        if any(pattern.search(statement) for statement in statements):
+            tables.append(table)
+    return tables
 
 
 if context.is_offline_mode():
@@ -0,0 +1,41 @@
+"""Add article feed sort index
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16
+
+Adds a composite index matching the default article list ordering
+(fetched_date DESC NULLS LAST, published_date DESC NULLS LAST, id DESC) so
+keyset-paginated reads can seek directly to the next page.
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, Sequence[str], None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the feed sort index."""
+    op.create_index(
+        "ix_articles_feed_sort",
+        "articles",
+        [
+            sa.text("fetched_date DESC NULLS LAST"),
+            sa.text("published_date DESC NULLS LAST"),
+            sa.text("id DESC"),
+        ],
+    )
+
+
+def downgrade() -> None:
+    """Drop the feed sort index."""
+    op.drop_index("ix_articles_feed_sort", table_name="articles")
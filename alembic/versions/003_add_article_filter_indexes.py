@@ -0,0 +1,44 @@
+"""Add article filter indexes
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+
+Adds indexes for the filtered article list queries:
+- ix_articles_source_fetched: newest articles for a given source
+- ix_articles_unread: partial index over unread articles only
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, Sequence[str], None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the filter indexes."""
+    op.create_index(
+        "ix_articles_source_fetched",
+        "articles",
+        ["source", sa.text("fetched_date DESC NULLS LAST")],
+    )
+    op.create_index(
+        "ix_articles_unread",
+        "articles",
+        [sa.text("fetched_date DESC NULLS LAST")],
+        postgresql_where=sa.text("is_read = false"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the filter indexes."""
+    op.drop_index("ix_articles_unread", table_name="articles")
+    op.drop_index("ix_articles_source_fetched", table_name="articles")
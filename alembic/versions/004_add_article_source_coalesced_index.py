@@ -0,0 +1,37 @@
+"""Add article source grouping index
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+Adds an expression index on (source, COALESCE(source_name, source)), the
+grouping key of the article sources listing, so it can be answered with an
+index-only scan.
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, Sequence[str], None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the source grouping index."""
+    op.create_index(
+        "ix_articles_source_coalesced",
+        "articles",
+        ["source", sa.text("COALESCE(source_name, source)")],
+    )
+
+
+def downgrade() -> None:
+    """Drop the source grouping index."""
+    op.drop_index("ix_articles_source_coalesced", table_name="articles")
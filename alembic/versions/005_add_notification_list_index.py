@@ -0,0 +1,37 @@
+"""Add notification list index
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+Adds a composite index on (is_read, created_date DESC, id DESC) matching the
+notification list ordering, so unread notifications can be paged by keyset
+without sorting.
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, Sequence[str], None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the notification list index."""
+    op.create_index(
+        "ix_notifications_read_created",
+        "notifications",
+        ["is_read", sa.text("created_date DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Drop the notification list index."""
+    op.drop_index("ix_notifications_read_created", table_name="notifications")
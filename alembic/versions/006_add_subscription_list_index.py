@@ -0,0 +1,36 @@
+"""Add subscription list index
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16
+
+Adds an index on (created_date DESC, id DESC) matching the subscription list
+ordering, so a page of subscriptions is read in index order without sorting.
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, Sequence[str], None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the subscription list index."""
+    op.create_index(
+        "ix_rss_feeds_created",
+        "rss_feeds",
+        [sa.text("created_date DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Drop the subscription list index."""
+    op.drop_index("ix_rss_feeds_created", table_name="rss_feeds")
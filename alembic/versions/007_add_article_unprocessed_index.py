@@ -0,0 +1,38 @@
+"""Add unprocessed article index
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+
+Adds a partial index over articles still awaiting LLM processing, so the
+batch job can find (and count up to a batch of) them without scanning the
+whole table.
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, Sequence[str], None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the unprocessed article index."""
+    op.create_index(
+        "ix_articles_unprocessed",
+        "articles",
+        ["id"],
+        postgresql_where=sa.text("processed = false"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the unprocessed article index."""
+    op.drop_index("ix_articles_unprocessed", table_name="articles")
@@ -0,0 +1,37 @@
+"""Add feed retry backoff columns
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+
+Adds rss_feeds.consecutive_failures and rss_feeds.next_retry_at so feeds that
+keep failing are skipped by refreshes until their backoff expires.
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, Sequence[str], None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the retry backoff columns."""
+    op.add_column(
+        "rss_feeds",
+        sa.Column("consecutive_failures", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("rss_feeds", sa.Column("next_retry_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop the retry backoff columns."""
+    op.drop_column("rss_feeds", "next_retry_at")
+    op.drop_column("rss_feeds", "consecutive_failures")
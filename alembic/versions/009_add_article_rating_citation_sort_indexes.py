@@ -0,0 +1,45 @@
+"""Add article rating and citation sort indexes
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+
+Adds indexes matching the "rating" and "citations" orderings of the MCP
+article listing, so a page is read from the index instead of sorting the
+whole table:
+- ix_articles_rating_sort: rating, then newest first
+- ix_articles_citations_sort: citation count, then newest first
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, Sequence[str], None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the sort indexes."""
+    op.create_index(
+        "ix_articles_rating_sort",
+        "articles",
+        [sa.text("rating DESC NULLS LAST"), sa.text("fetched_date DESC NULLS LAST")],
+    )
+    op.create_index(
+        "ix_articles_citations_sort",
+        "articles",
+        [sa.text("citation_count DESC NULLS LAST"), sa.text("fetched_date DESC NULLS LAST")],
+    )
+
+
+def downgrade() -> None:
+    """Drop the sort indexes."""
+    op.drop_index("ix_articles_citations_sort", table_name="articles")
+    op.drop_index("ix_articles_rating_sort", table_name="articles")
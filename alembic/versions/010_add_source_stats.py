@@ -0,0 +1,111 @@
+"""Add per-source article statistics
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+
+Adds the source_stats table holding per-source article, read and rating
+counts, maintained by statement-level triggers on articles, and fills it
+from the existing articles. Library statistics then read one row per source
+instead of aggregating every article.
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, Sequence[str], None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGGERS = {
+    "articles_source_stats_insert": "INSERT ON articles REFERENCING NEW TABLE AS new_rows",
+    "articles_source_stats_update": (
+        "UPDATE ON articles REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"
+    ),
+    "articles_source_stats_delete": "DELETE ON articles REFERENCING OLD TABLE AS old_rows",
+}
+
+
+def upgrade() -> None:
+    """Create source_stats, its triggers, and backfill it."""
+    op.create_table(
+        "source_stats",
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("read", sa.Integer(), nullable=False),
+        sa.Column("rated", sa.Integer(), nullable=False),
+        sa.Column("rating_sum", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("source"),
+    )
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_source_stats() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' THEN
+                IF NOT EXISTS (
+                    SELECT 1 FROM old_rows AS o JOIN new_rows AS n ON n.id = o.id
+                    WHERE (o.source, o.is_read, o.rating)
+                        IS DISTINCT FROM (n.source, n.is_read, n.rating)
+                ) THEN
+                    RETURN NULL;
+                END IF;
+            END IF;
+
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE source_stats AS s
+                SET total = s.total - o.total,
+                    read = s.read - o.read,
+                    rated = s.rated - o.rated,
+                    rating_sum = s.rating_sum - o.rating_sum
+                FROM (
+                    SELECT source, count(*) AS total, count(*) FILTER (WHERE is_read) AS read,
+                           count(rating) AS rated, coalesce(sum(rating), 0) AS rating_sum
+                    FROM old_rows
+                    GROUP BY source
+                ) AS o
+                WHERE s.source = o.source;
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO source_stats AS s (source, total, read, rated, rating_sum)
+                SELECT source, count(*), count(*) FILTER (WHERE is_read), count(rating),
+                       coalesce(sum(rating), 0)
+                FROM new_rows
+                GROUP BY source
+                ON CONFLICT (source) DO UPDATE
+                SET total = s.total + EXCLUDED.total,
+                    read = s.read + EXCLUDED.read,
+                    rated = s.rated + EXCLUDED.rated,
+                    rating_sum = s.rating_sum + EXCLUDED.rating_sum;
+            END IF;
+
+            RETURN NULL;
+        END
+        $$
+    """)
+    for name, event in TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {name} AFTER {event} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION update_source_stats()"
+        )
+    op.execute("""
+        INSERT INTO source_stats (source, total, read, rated, rating_sum)
+        SELECT source, count(*), count(*) FILTER (WHERE is_read), count(rating),
+               coalesce(sum(rating), 0)
+        FROM articles
+        GROUP BY source
+    """)
+
+
+def downgrade() -> None:
+    """Drop the triggers, their function, and source_stats."""
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON articles")
+    op.execute("DROP FUNCTION IF EXISTS update_source_stats()")
+    op.drop_table("source_stats")
@@ -0,0 +1,54 @@
+"""Align partial index predicates with the queries
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16
+
+Revisions 003 and 007 created ix_articles_unread and ix_articles_unprocessed
+with "= false" predicates, while the models and every query filter with
+"IS false". PostgreSQL only uses a partial index when it can prove the
+query's condition implies the index predicate, which it cannot do across
+the two spellings, so migrated databases never used these indexes. Both
+are recreated with the "IS false" predicate that create_all produces.
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, Sequence[str], None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _recreate_indexes(unread_predicate: str, unprocessed_predicate: str) -> None:
+    """Recreate both partial indexes with the given predicates."""
+    op.drop_index("ix_articles_unread", table_name="articles")
+    op.create_index(
+        "ix_articles_unread",
+        "articles",
+        [sa.text("fetched_date DESC NULLS LAST")],
+        postgresql_where=sa.text(unread_predicate),
+    )
+    op.drop_index("ix_articles_unprocessed", table_name="articles")
+    op.create_index(
+        "ix_articles_unprocessed",
+        "articles",
+        ["id"],
+        postgresql_where=sa.text(unprocessed_predicate),
+    )
+
+
+def upgrade() -> None:
+    """Recreate the partial indexes with IS false predicates."""
+    _recreate_indexes("is_read IS false", "processed IS false")
+
+
+def downgrade() -> None:
+    """Restore the = false predicates of revisions 003 and 007."""
+    _recreate_indexes("is_read = false", "processed = false")
@@ -0,0 +1,26 @@
+"""Run the Mind Scout API server.
+
+Usage: python -m backend
+"""
+
+import uvicorn
+
+from mindscout.config import get_settings
+
+
+def main():
+    """Start Uvicorn with the uvloop event loop and the httptools HTTP parser."""
+    settings = get_settings()
+    uvicorn.run(
+        "backend.main:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        workers=settings.api_workers,
+        loop="uvloop",
+        http="httptools",
+        log_level=settings.log_level.lower(),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,23 @@
 """Articles API endpoints."""
 
+import base64
 from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from slowapi import Limiter
 from slowapi.util import get_remote_address
-from sqlalchemy import func, select
+from sqlalchemy import RowMapping, func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.api.cache import response_cache
+from backend.api.responses import etag_response, json_etag_response, make_etag
 from mindscout.config import get_settings
 from mindscout.database import Article, get_async_db
 
 settings = get_settings()
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(key_func=get_remote_address, storage_uri=settings.rate_limit_storage_uri)
 
 router = APIRouter()
 
@@ -43,11 +46,36 @@ class ArticleResponse(BaseModel):
         from_attributes = True
 
 
+class ArticleSummaryResponse(BaseModel):
+    """Article as shown in the list view: no LLM summary, abstract truncated."""
+
+    id: int
+    title: str
+    authors: Optional[str]
+    abstract: Optional[str]
+    url: str
+    source: str
+    source_name: Optional[str]
+    published_date: Optional[datetime]
+    fetched_date: datetime
+    categories: Optional[str]
+    is_read: bool
+    rating: Optional[int]
+    citation_count: Optional[int]
+    has_implementation: bool
+    github_url: Optional[str]
+    topics: Optional[str]
+
+    class Config:
+        from_attributes = True
+
+
 class ArticleListResponse(BaseModel):
-    articles: list[ArticleResponse]
-    total: int
+    articles: list[ArticleSummaryResponse]
+    total: Optional[int] = None
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 class MarkReadRequest(BaseModel):
@@ -55,25 +83,91 @@ class MarkReadRequest(BaseModel):
 
 
 class RateArticleRequest(BaseModel):
-    rating: int  # 1-5
+    rating: int = Field(ge=1, le=5)
+
+
+# Largest OFFSET page-number pagination may scan; deeper pages must use a cursor
+MAX_PAGE_OFFSET = 10_000
+
+# The list view only shows the first couple of lines of the abstract
+ABSTRACT_PREVIEW_LENGTH = 500
+
+# Columns needed to render the list view; skips the summary and most of the abstract
+_LIST_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.authors,
+    func.left(Article.abstract, ABSTRACT_PREVIEW_LENGTH).label("abstract"),
+    Article.url,
+    Article.source,
+    Article.source_name,
+    Article.published_date,
+    Article.fetched_date,
+    Article.categories,
+    Article.is_read,
+    Article.rating,
+    Article.citation_count,
+    Article.has_implementation,
+    Article.github_url,
+    Article.topics,
+)
+
+
+# Stand-in for a NULL published_date in keyset comparisons. Sorting desc with
+# nulls last (or asc with nulls first) orders NULLs exactly like this value.
+# fetched_date is always populated by the model default, so it is compared as-is
+# and PostgreSQL can seek on the leading index column.
+_NULL_DATE = datetime.min
+
+
+def _encode_cursor(article: RowMapping) -> str:
+    """Encode an article row's feed sort key as an opaque pagination cursor."""
+    fetched = article["fetched_date"].isoformat() if article["fetched_date"] else ""
+    published = article["published_date"].isoformat() if article["published_date"] else ""
+    raw = f"{fetched}|{published}|{article['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, datetime, int]:
+    """Decode a pagination cursor into a (fetched_date, published_date, id) tuple.
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        fetched, published, article_id = raw.split("|")
+        return (
+            datetime.fromisoformat(fetched) if fetched else _NULL_DATE,
+            datetime.fromisoformat(published) if published else _NULL_DATE,
+            int(article_id),
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
 @router.get("/sources")
 @limiter.limit(f"{settings.rate_limit_requests}/minute")
 async def list_sources(request: Request, db: AsyncSession = Depends(get_async_db)):
-    """Get list of distinct source names for filtering."""
-    stmt = (
-        select(Article.source, Article.source_name, func.count(Article.id).label("count"))
-        .group_by(Article.source, Article.source_name)
-        .order_by(func.count(Article.id).desc())
-    )
-    result = await db.execute(stmt)
-    rows = result.all()
-
-    return [
-        {"source": r.source, "source_name": r.source_name or r.source, "count": r.count}
-        for r in rows
-    ]
+    """Get list of distinct source names for filtering.
+
+    The grouped count scans the whole table, so the result is cached for
+    ``settings.cache_ttl`` seconds and invalidated when new articles are fetched.
+    """
+    cached = response_cache.get("articles:sources")
+    if cached is None:
+        # Articles without a source_name are grouped under their source
+        source_name = func.coalesce(Article.source_name, Article.source)
+        stmt = (
+            select(Article.source, source_name.label("source_name"), func.count().label("count"))
+            .group_by(Article.source, source_name)
+            .order_by(func.count().desc())
+        )
+        result = await db.execute(stmt)
+        sources = [dict(r) for r in result.mappings()]
+        cached = response_cache.set("articles:sources", sources, ttl=settings.cache_ttl)
+
+    return etag_response(request, *cached)
 
 
 @router.get("", response_model=ArticleListResponse)
@@ -83,15 +177,37 @@ async def list_articles(
     db: AsyncSession = Depends(get_async_db),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
     unread_only: bool = False,
     source: Optional[str] = None,
     source_name: Optional[str] = None,
     sort_by: str = Query("fetched_date", pattern="^(fetched_date|published_date|rating)$"),
     sort_order: str = Query("desc", pattern="^(asc|desc)$"),
+    include_total: bool = Query(False, description="Also count all matching articles"),
 ):
-    """List articles with pagination and filters."""
-    # Build base query
-    stmt = select(Article)
+    """List articles with pagination and filters.
+
+    Pages can be requested either by number (``page``) or, for the default
+    fetched_date ordering, by passing the ``next_cursor`` of the previous
+    response as ``cursor``. Cursor pagination seeks directly to the next row
+    instead of scanning and discarding all preceding ones. Page numbers beyond
+    ``MAX_PAGE_OFFSET`` rows are rejected.
+
+    Counting every matching row costs a second query, so ``total`` is only
+    populated when ``include_total`` is set.
+    """
+    if cursor and sort_by == "rating":
+        raise HTTPException(
+            status_code=400, detail="Cursor pagination is not supported when sorting by rating"
+        )
+
+    if not cursor and (page - 1) * page_size > MAX_PAGE_OFFSET:
+        raise HTTPException(
+            status_code=400, detail="Deep pagination disabled; use the cursor parameter"
+        )
+
+    # Build base query, selecting only the columns the list view needs
+    stmt = select(*_LIST_COLUMNS)
 
     # Apply filters
     if unread_only:
@@ -103,10 +219,12 @@ async def list_articles(
     if source_name:
         stmt = stmt.where(Article.source_name == source_name)
 
-    # Count total before pagination
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await db.execute(count_stmt)
-    total = total_result.scalar()
+    # Count total before pagination, only when the client asks for it
+    total = None
+    if include_total:
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+        total_result = await db.execute(count_stmt)
+        total = total_result.scalar()
 
     # Apply sorting based on sort_by parameter
     if sort_by == "rating":
@@ -117,6 +235,18 @@ async def list_articles(
             stmt = stmt.order_by(Article.rating.asc().nullsfirst(), Article.id.asc())
     else:
         # Default: sort by fetched_date, then published_date
+        if cursor:
+            sort_key = tuple_(
+                Article.fetched_date,
+                func.coalesce(Article.published_date, _NULL_DATE),
+                Article.id,
+            )
+            cursor_key = tuple_(*_decode_cursor(cursor))
+            if sort_order == "desc":
+                stmt = stmt.where(sort_key < cursor_key)
+            else:
+                stmt = stmt.where(sort_key > cursor_key)
+
         if sort_order == "desc":
             stmt = stmt.order_by(
                 Article.fetched_date.desc().nullslast(),
@@ -130,18 +260,32 @@ async def list_articles(
                 Article.id.asc(),
             )
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    stmt = stmt.offset(offset).limit(page_size)
+    # Apply pagination, fetching one extra row to detect whether a next page exists
+    if not cursor:
+        stmt = stmt.offset((page - 1) * page_size)
+    stmt = stmt.limit(page_size + 1)
 
     result = await db.execute(stmt)
-    articles = result.scalars().all()
-
-    return ArticleListResponse(
-        articles=[ArticleResponse.model_validate(a) for a in articles],
-        total=total,
-        page=page,
-        page_size=page_size,
+    articles = result.mappings().all()
+
+    next_cursor = None
+    if len(articles) > page_size:
+        articles = articles[:page_size]
+        if sort_by != "rating":
+            next_cursor = _encode_cursor(articles[-1])
+
+    # Rows already have exactly the ArticleSummaryResponse fields, so serialize
+    # them directly rather than validating each one through Pydantic. The ETag
+    # lets clients revalidate an unchanged page with a 304.
+    return json_etag_response(
+        request,
+        {
+            "articles": [dict(a) for a in articles],
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+        },
     )
 
 
@@ -149,14 +293,13 @@ async def list_articles(
 @limiter.limit(f"{settings.rate_limit_requests}/minute")
 async def get_article(request: Request, article_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get a single article by ID."""
-    stmt = select(Article).where(Article.id == article_id)
-    result = await db.execute(stmt)
-    article = result.scalar_one_or_none()
+    article = await db.get(Article, article_id)
 
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
 
-    return ArticleResponse.model_validate(article)
+    body = ArticleResponse.model_validate(article).model_dump_json().encode()
+    return etag_response(request, body, make_etag(body))
 
 
 @router.post("/{article_id}/read")
@@ -168,17 +311,21 @@ async def mark_read(
     db: AsyncSession = Depends(get_async_db),
 ):
     """Mark article as read or unread."""
-    stmt = select(Article).where(Article.id == article_id)
-    result = await db.execute(stmt)
-    article = result.scalar_one_or_none()
+    stmt = (
+        update(Article)
+        .where(Article.id == article_id)
+        .values(is_read=body.is_read)
+        .returning(Article.is_read)
+    )
+    row = (await db.execute(stmt)).first()
 
-    if not article:
+    if row is None:
         raise HTTPException(status_code=404, detail="Article not found")
 
-    article.is_read = body.is_read
     await db.commit()
+    response_cache.invalidate("articles:")
 
-    return {"success": True, "is_read": article.is_read}
+    return {"success": True, "is_read": row.is_read}
 
 
 @router.post("/{article_id}/rate")
@@ -189,20 +336,24 @@ async def rate_article(
     body: RateArticleRequest,
     db: AsyncSession = Depends(get_async_db),
 ):
-    """Rate an article (1-5 stars)."""
-    if not 1 <= body.rating <= 5:
-        raise HTTPException(status_code=400, detail="Rating must be between 1 and 5")
+    """Rate an article (1-5 stars).
 
-    stmt = select(Article).where(Article.id == article_id)
-    result = await db.execute(stmt)
-    article = result.scalar_one_or_none()
+    The rating range is validated by RateArticleRequest, so out-of-range
+    values are rejected with 422 before touching the database.
+    """
+    stmt = (
+        update(Article)
+        .where(Article.id == article_id)
+        # Auto-mark as read when rated
+        .values(rating=body.rating, rated_date=datetime.utcnow(), is_read=True)
+        .returning(Article.rating)
+    )
+    row = (await db.execute(stmt)).first()
 
-    if not article:
+    if row is None:
         raise HTTPException(status_code=404, detail="Article not found")
 
-    article.rating = body.rating
-    article.rated_date = datetime.utcnow()
-    article.is_read = True  # Auto-mark as read when rated
     await db.commit()
+    response_cache.invalidate("articles:")
 
-    return {"success": True, "rating": article.rating}
+    return {"success": True, "rating": row.rating}
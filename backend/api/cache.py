@@ -0,0 +1,106 @@
+"""In-process response cache with ETag support for read-mostly endpoints."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+import orjson
+
+from backend.api.responses import make_etag
+
+# Entries kept before the least recently used ones are evicted. Search caches
+# one entry per distinct query string, so the cache has to be bounded.
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class ResponseCache:
+    """Thread-safe TTL cache of serialized JSON payloads.
+
+    Entries store the encoded body together with its ETag so cache hits
+    don't need to re-serialize or re-hash anything. At most max_entries are
+    kept; storing another evicts the least recently used entry.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: dict[str, threading.Lock] = {}
+
+    def get(self, key: str) -> Optional[tuple[bytes, str]]:
+        """Get a cached (body, etag) pair, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, body, etag = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return body, etag
+
+    def set(self, key: str, data: Any, ttl: Optional[float] = None) -> tuple[bytes, str]:
+        """Serialize and store data.
+
+        Args:
+            key: Cache key
+            data: JSON-serializable payload
+            ttl: Lifetime in seconds (None = never expires)
+
+        Returns:
+            Tuple of (body, etag)
+        """
+        body = orjson.dumps(data)
+        etag = make_etag(body)
+        expires_at = time.monotonic() + ttl if ttl is not None else float("inf")
+        with self._lock:
+            self._entries[key] = (expires_at, body, etag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return body, etag
+
+    def get_or_set(
+        self, key: str, compute: Callable[[], Any], ttl: Optional[float] = None
+    ) -> tuple[bytes, str]:
+        """Get a cached entry, computing and storing it on a miss.
+
+        Concurrent misses for the same key are coalesced: one caller runs
+        compute while the others wait for it and then share its result.
+
+        Args:
+            key: Cache key
+            compute: Callable returning the JSON-serializable payload
+            ttl: Lifetime in seconds (None = never expires)
+
+        Returns:
+            Tuple of (body, etag)
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another caller may have filled the entry while we waited
+            cached = self.get(key)
+            if cached is not None:
+                return cached
+            try:
+                return self.set(key, compute(), ttl=ttl)
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop all entries whose key starts with prefix (all entries by default)."""
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+
+response_cache = ResponseCache()
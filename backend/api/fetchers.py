@@ -7,13 +7,26 @@ from pydantic import BaseModel
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+from backend.api.cache import response_cache
+from backend.api.responses import etag_response
 from mindscout.config import ARXIV_FEEDS, DEFAULT_CATEGORIES, get_settings
 
 settings = get_settings()
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(key_func=get_remote_address, storage_uri=settings.rate_limit_storage_uri)
 
 router = APIRouter()
 
+CATEGORIES_CACHE_CONTROL = "public, max-age=86400"
+
+VALID_ARXIV_CATEGORIES = frozenset(ARXIV_FEEDS)
+
+ARXIV_CATEGORY_NAMES = {
+    "cs.AI": "Artificial Intelligence",
+    "cs.LG": "Machine Learning",
+    "cs.CL": "Computation and Language",
+    "cs.CV": "Computer Vision",
+}
+
 
 class ArxivFetchRequest(BaseModel):
     query: Optional[str] = None  # Keywords to search in all fields
@@ -36,6 +49,13 @@ class FetchResponse(BaseModel):
     message: str
 
 
+class ProcessResponse(BaseModel):
+    success: bool
+    batch_id: Optional[str] = None
+    article_count: int
+    message: str
+
+
 class CategoryResponse(BaseModel):
     code: str
     name: str
@@ -43,19 +63,23 @@ class CategoryResponse(BaseModel):
 
 
 @router.get("/arxiv/categories", response_model=list[CategoryResponse])
-def get_arxiv_categories():
-    """Get available arXiv categories."""
-    category_names = {
-        "cs.AI": "Artificial Intelligence",
-        "cs.LG": "Machine Learning",
-        "cs.CL": "Computation and Language",
-        "cs.CV": "Computer Vision",
-    }
+def get_arxiv_categories(request: Request):
+    """Get available arXiv categories.
+
+    The category list is static, so it is serialized once and clients may
+    reuse it for a day before revalidating against the ETag.
+    """
+    cached = response_cache.get("arxiv_categories")
+    if cached is None:
+        categories = [
+            CategoryResponse(code=code, name=ARXIV_CATEGORY_NAMES.get(code, code), url=url)
+            for code, url in ARXIV_FEEDS.items()
+        ]
+        cached = response_cache.set(
+            "arxiv_categories", [c.model_dump() for c in categories], ttl=None
+        )
 
-    return [
-        CategoryResponse(code=code, name=category_names.get(code, code), url=url)
-        for code, url in ARXIV_FEEDS.items()
-    ]
+    return etag_response(request, *cached, cache_control=CATEGORIES_CACHE_CONTROL)
 
 
 @router.post("/arxiv", response_model=FetchResponse)
@@ -82,7 +106,7 @@ def fetch_arxiv(request: Request, body: ArxivFetchRequest = None):
 
         if body.categories:
             # Validate categories
-            invalid = [c for c in body.categories if c not in ARXIV_FEEDS]
+            invalid = sorted(set(body.categories) - VALID_ARXIV_CATEGORIES)
             if invalid:
                 raise HTTPException(
                     status_code=400, detail=f"Invalid categories: {', '.join(invalid)}"
@@ -111,6 +135,8 @@ def fetch_arxiv(request: Request, body: ArxivFetchRequest = None):
             sort_by=sort_by,
             sort_order="descending",
         )
+        if new_count:
+            response_cache.invalidate("articles:")
 
         # Build description message
         parts = []
@@ -161,6 +187,8 @@ def fetch_semantic_scholar(request: Request, body: SemanticScholarFetchRequest):
         # Store in database
         new_count = fetcher.store_articles(articles)
         fetcher.close()
+        if new_count:
+            response_cache.invalidate("articles:")
 
         return FetchResponse(
             success=True,
@@ -171,24 +199,40 @@ def fetch_semantic_scholar(request: Request, body: SemanticScholarFetchRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/process", response_model=FetchResponse)
+@router.post("/process", response_model=ProcessResponse, status_code=202)
 @limiter.limit(f"{settings.rate_limit_process}/minute")
 def process_unprocessed(request: Request):
-    """Process unprocessed articles with LLM to extract topics/summaries."""
-    from mindscout.processors.content import ContentProcessor
+    """Queue unprocessed articles for LLM topic extraction.
 
-    try:
-        processor = ContentProcessor()
-        processed, failed = processor.process_batch(limit=50)
+    Returns immediately with the batch ID instead of holding the request open
+    for every LLM call. The batch is tracked in pending_batches and its
+    results are applied by the scheduler's batch check job, so this needs the
+    scheduler to be enabled. While an earlier batch is still in flight, that
+    batch is returned instead of submitting the same articles again.
+    """
+    from backend.scheduler.jobs import queue_processing_batch
 
-        return FetchResponse(
-            success=True,
-            new_articles=processed,
-            message=f"Processed {processed} articles ({failed} failed)",
+    if not settings.scheduler_enabled:
+        raise HTTPException(
+            status_code=409,
+            detail="Batch results are applied by the scheduler, which is disabled; "
+            "use /api/fetch/batch/create and /api/fetch/batch/{batch_id}/apply instead",
         )
+
+    try:
+        batch_id, article_count = queue_processing_batch(limit=50)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    if batch_id is None:
+        message = "No unprocessed articles"
+    else:
+        message = f"{article_count} articles queued for processing (batch {batch_id})"
+
+    return ProcessResponse(
+        success=True, batch_id=batch_id, article_count=article_count, message=message
+    )
+
 
 @router.post("/run-daily-job", response_model=FetchResponse)
 @limiter.limit(f"{settings.rate_limit_process}/minute")
@@ -3,13 +3,50 @@
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import delete, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from mindscout.database import Article, Notification, RSSFeed, get_session
+from backend.api.responses import json_response
+from mindscout.database import Article, Notification, RSSFeed, get_async_db
 
 router = APIRouter()
 
+# Rows updated per transaction when marking everything as read
+READ_ALL_BATCH_SIZE = 1000
+
+# Static statements are built once at import; handlers only add filters and
+# bound parameters, so each request reuses the compiled SQL from the cache.
+
+# Joins article and feed in the same query instead of two lookups per row,
+# loading only the columns the response needs
+_LIST_NOTIFICATIONS = (
+    select(
+        Notification.id,
+        Notification.type,
+        Notification.is_read,
+        Notification.created_date,
+        Notification.read_date,
+        Article.id.label("article_id"),
+        Article.title.label("article_title"),
+        Article.source.label("article_source"),
+        Article.url.label("article_url"),
+        Article.published_date.label("article_published_date"),
+        RSSFeed.id.label("feed_id"),
+        RSSFeed.title.label("feed_title"),
+        RSSFeed.url.label("feed_url"),
+    )
+    .join(Article, Article.id == Notification.article_id)
+    .outerjoin(RSSFeed, RSSFeed.id == Notification.feed_id)
+    .order_by(Notification.created_date.desc(), Notification.id.desc())
+)
+
+_COUNT_NOTIFICATIONS = select(
+    func.count(Notification.id).filter(Notification.is_read.is_(False)).label("unread"),
+    func.count(Notification.id).label("total"),
+)
+
 
 class ArticleSummary(BaseModel):
     id: int
@@ -47,149 +84,142 @@ class NotificationCountResponse(BaseModel):
 
 
 @router.get("", response_model=list[NotificationResponse])
-def list_notifications(unread_only: bool = False, limit: int = 50, offset: int = 0):
-    """List notifications, newest first."""
-    session = get_session()
-
-    try:
-        query = session.query(Notification).order_by(Notification.created_date.desc())
-
-        if unread_only:
-            query = query.filter(Notification.is_read.is_(False))
-
-        notifications = query.offset(offset).limit(limit).all()
-
-        results = []
-        for notif in notifications:
-            article = session.query(Article).filter(Article.id == notif.article_id).first()
-            feed = (
-                session.query(RSSFeed).filter(RSSFeed.id == notif.feed_id).first()
-                if notif.feed_id
-                else None
+async def list_notifications(
+    unread_only: bool = False,
+    limit: int = 50,
+    offset: int = 0,
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """List notifications, newest first.
+
+    For deep pages, pass the ``created_date`` and ``id`` of the last
+    notification already seen as ``before`` and ``before_id`` instead of an
+    offset; the database then seeks straight to the next page.
+    """
+    stmt = _LIST_NOTIFICATIONS
+
+    if unread_only:
+        stmt = stmt.where(Notification.is_read.is_(False))
+
+    if before is not None:
+        if before_id is not None:
+            # id breaks ties between notifications created in the same instant
+            stmt = stmt.where(
+                tuple_(Notification.created_date, Notification.id) < (before, before_id)
             )
-
-            if article:
-                results.append(
-                    NotificationResponse(
-                        id=notif.id,
-                        article=ArticleSummary(
-                            id=article.id,
-                            title=article.title,
-                            source=article.source,
-                            url=article.url,
-                            published_date=article.published_date,
-                        ),
-                        feed=(
-                            FeedSummary(id=feed.id, title=feed.title, url=feed.url)
-                            if feed
-                            else None
-                        ),
-                        type=notif.type,
-                        is_read=notif.is_read,
-                        created_date=notif.created_date,
-                        read_date=notif.read_date,
-                    )
-                )
-
-        return results
-
-    finally:
-        session.close()
+        else:
+            stmt = stmt.where(Notification.created_date < before)
+
+    result = await db.execute(stmt.offset(offset).limit(limit))
+
+    # Rows map straight onto NotificationResponse, so serialize them with orjson
+    return json_response(
+        [
+            {
+                "id": row.id,
+                "article": {
+                    "id": row.article_id,
+                    "title": row.article_title,
+                    "source": row.article_source,
+                    "url": row.article_url,
+                    "published_date": row.article_published_date,
+                },
+                "feed": (
+                    {"id": row.feed_id, "title": row.feed_title, "url": row.feed_url}
+                    if row.feed_id is not None
+                    else None
+                ),
+                "type": row.type,
+                "is_read": row.is_read,
+                "created_date": row.created_date,
+                "read_date": row.read_date,
+            }
+            for row in result
+        ]
+    )
 
 
 @router.get("/count", response_model=NotificationCountResponse)
-def get_notification_count():
+async def get_notification_count(db: AsyncSession = Depends(get_async_db)):
     """Get count of unread and total notifications."""
-    session = get_session()
-
-    try:
-        unread = session.query(Notification).filter(Notification.is_read.is_(False)).count()
-        total = session.query(Notification).count()
-
-        return NotificationCountResponse(unread=unread, total=total)
+    row = (await db.execute(_COUNT_NOTIFICATIONS)).one()
 
-    finally:
-        session.close()
+    return NotificationCountResponse(unread=row.unread, total=row.total)
 
 
 @router.post("/{notification_id}/read")
-def mark_notification_read(notification_id: int):
+async def mark_notification_read(notification_id: int, db: AsyncSession = Depends(get_async_db)):
     """Mark a notification as read."""
-    session = get_session()
-
-    try:
-        notification = (
-            session.query(Notification).filter(Notification.id == notification_id).first()
-        )
-        if not notification:
-            raise HTTPException(status_code=404, detail="Notification not found")
-
-        notification.is_read = True
-        notification.read_date = datetime.utcnow()
-        session.commit()
+    stmt = (
+        update(Notification)
+        .where(Notification.id == notification_id)
+        .values(is_read=True, read_date=datetime.utcnow())
+        .returning(Notification.id)
+    )
+    if (await db.execute(stmt)).first() is None:
+        raise HTTPException(status_code=404, detail="Notification not found")
 
-        return {"success": True, "is_read": True}
+    await db.commit()
 
-    finally:
-        session.close()
+    return {"success": True, "is_read": True}
 
 
 @router.post("/read-all")
-def mark_all_notifications_read():
-    """Mark all notifications as read."""
-    session = get_session()
-
-    try:
-        session.query(Notification).filter(Notification.is_read.is_(False)).update(
-            {Notification.is_read: True, Notification.read_date: datetime.utcnow()}
-        )
-        session.commit()
-
-        return {"success": True, "message": "All notifications marked as read"}
-
-    finally:
-        session.close()
+async def mark_all_notifications_read(db: AsyncSession = Depends(get_async_db)):
+    """Mark all notifications as read.
+
+    Rows are updated in batches of READ_ALL_BATCH_SIZE, each in its own
+    transaction, so a large backlog never holds row locks for long.
+    """
+    read_date = datetime.utcnow()
+    unread_ids = (
+        select(Notification.id)
+        .where(Notification.is_read.is_(False))
+        .limit(READ_ALL_BATCH_SIZE)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(Notification)
+        .where(Notification.id.in_(unread_ids))
+        .values(is_read=True, read_date=read_date)
+        .execution_options(synchronize_session=False)
+    )
+
+    while True:
+        updated = (await db.execute(stmt)).rowcount
+        await db.commit()
+        if updated < READ_ALL_BATCH_SIZE:
+            break
+
+    return {"success": True, "message": "All notifications marked as read"}
 
 
 @router.delete("/{notification_id}")
-def delete_notification(notification_id: int):
+async def delete_notification(notification_id: int, db: AsyncSession = Depends(get_async_db)):
     """Delete a notification."""
-    session = get_session()
-
-    try:
-        notification = (
-            session.query(Notification).filter(Notification.id == notification_id).first()
-        )
-        if not notification:
-            raise HTTPException(status_code=404, detail="Notification not found")
-
-        session.delete(notification)
-        session.commit()
+    stmt = delete(Notification).where(Notification.id == notification_id).returning(Notification.id)
+    if (await db.execute(stmt)).first() is None:
+        raise HTTPException(status_code=404, detail="Notification not found")
 
-        return {"success": True, "message": "Notification deleted"}
+    await db.commit()
 
-    finally:
-        session.close()
+    return {"success": True, "message": "Notification deleted"}
 
 
 @router.delete("")
-def clear_all_notifications(read_only: bool = True):
+async def clear_all_notifications(read_only: bool = True, db: AsyncSession = Depends(get_async_db)):
     """Clear notifications. By default, only clears read notifications."""
-    session = get_session()
-
-    try:
-        query = session.query(Notification)
-        if read_only:
-            query = query.filter(Notification.is_read)
-
-        deleted_count = query.delete()
-        session.commit()
-
-        return {
-            "success": True,
-            "deleted_count": deleted_count,
-            "message": f"Deleted {deleted_count} notifications",
-        }
-
-    finally:
-        session.close()
+    stmt = delete(Notification)
+    if read_only:
+        stmt = stmt.where(Notification.is_read)
+
+    deleted_count = (await db.execute(stmt)).rowcount
+    await db.commit()
+
+    return {
+        "success": True,
+        "deleted_count": deleted_count,
+        "message": f"Deleted {deleted_count} notifications",
+    }
@@ -1,16 +1,43 @@
 """Profile API endpoints."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Request
 from pydantic import BaseModel
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.api.cache import response_cache
+from backend.api.responses import etag_response
+from mindscout.config import get_settings
+from mindscout.database import Article, SourceStats, get_async_db
 from mindscout.profile import ProfileManager
 
+settings = get_settings()
+
 router = APIRouter()
 
 
+# Built once at import so each request reuses the compiled SQL from the cache.
+# Library totals come from source_stats, which triggers on articles keep
+# current, so they cost one row per source rather than a pass over the table.
+_SOURCE_STATS = select(
+    SourceStats.source,
+    SourceStats.total,
+    SourceStats.read,
+    SourceStats.rated,
+    SourceStats.rating_sum,
+).where(SourceStats.total > 0)
+
+# Recent activity (last 7 days) needs article timestamps; the fetched_date
+# index limits it to the articles in the window
+_RECENT_ACTIVITY = select(
+    func.count(Article.id).label("fetched"),
+    func.count(Article.id).filter(Article.is_read).label("read"),
+).where(Article.fetched_date >= bindparam("recent_date"))
+
+
 class ProfileResponse(BaseModel):
     interests: list[str]
     skill_level: str
@@ -80,6 +107,9 @@ def update_profile(request: UpdateProfileRequest):
         if request.daily_reading_goal is not None:
             manager.set_daily_goal(request.daily_reading_goal)
 
+        # Recommendations are scored against the profile
+        response_cache.invalidate("articles:recommendations")
+
         # Return updated profile
         profile = manager.get_or_create_profile()
         interests = manager.get_interests()
@@ -100,66 +130,51 @@ def update_profile(request: UpdateProfileRequest):
 
 
 @router.get("/stats", response_model=StatsResponse)
-def get_stats():
-    """Get reading statistics."""
-    from sqlalchemy import func
-
-    from mindscout.database import Article, get_session
-
-    session = get_session()
-
-    try:
-        # Total articles
-        total = session.query(Article).count()
-
-        # Read/unread counts
-        read_count = session.query(Article).filter(Article.is_read).count()
-        unread_count = total - read_count
-        read_pct = (read_count / total * 100) if total > 0 else 0
-
-        # Rated articles
-        rated_count = session.query(Article).filter(Article.rating.isnot(None)).count()
-
-        # Average rating
-        avg_rating = (
-            session.query(func.avg(Article.rating)).filter(Article.rating.isnot(None)).scalar()
+async def get_stats(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """Get reading statistics.
+
+    Totals are read from source_stats and only the recent activity counts
+    touch articles. The result is cached for ``settings.stats_cache_ttl``
+    seconds and invalidated when articles are fetched, read, or rated through
+    the API.
+    """
+    cached = response_cache.get("articles:stats")
+    if cached is None:
+        stats = await _compute_stats(db)
+        cached = response_cache.set(
+            "articles:stats", stats.model_dump(), ttl=settings.stats_cache_ttl
         )
 
-        # Articles by source
-        by_source = {}
-        source_counts = (
-            session.query(Article.source, func.count(Article.id)).group_by(Article.source).all()
-        )
-
-        for source, count in source_counts:
-            by_source[source] = count
-
-        # Recent activity (last 7 days)
-        from datetime import timedelta
-
-        recent_date = datetime.utcnow() - timedelta(days=7)
-
-        recent_fetched = session.query(Article).filter(Article.fetched_date >= recent_date).count()
-
-        recent_read = (
-            session.query(Article)
-            .filter(Article.is_read, Article.fetched_date >= recent_date)
-            .count()
-        )
-
-        return StatsResponse(
-            total_articles=total,
-            read_articles=read_count,
-            unread_articles=unread_count,
-            read_percentage=round(read_pct, 1),
-            rated_articles=rated_count,
-            average_rating=round(avg_rating, 2) if avg_rating else None,
-            articles_by_source=by_source,
-            recent_activity={
-                "fetched_last_7_days": recent_fetched,
-                "read_last_7_days": recent_read,
-            },
-        )
-
-    finally:
-        session.close()
+    return etag_response(request, *cached)
+
+
+async def _compute_stats(db: AsyncSession) -> StatsResponse:
+    """Read the reading statistics from source_stats and the recent window."""
+    sources = (await db.execute(_SOURCE_STATS)).all()
+    recent = (
+        await db.execute(_RECENT_ACTIVITY, {"recent_date": datetime.utcnow() - timedelta(days=7)})
+    ).one()
+
+    by_source = {r.source: r.total for r in sources}
+    total = sum(r.total for r in sources)
+    read_count = sum(r.read for r in sources)
+    rated_count = sum(r.rated for r in sources)
+    rating_sum = sum(r.rating_sum for r in sources)
+
+    unread_count = total - read_count
+    read_pct = (read_count / total * 100) if total > 0 else 0
+    avg_rating = rating_sum / rated_count if rated_count else None
+
+    return StatsResponse(
+        total_articles=total,
+        read_articles=read_count,
+        unread_articles=unread_count,
+        read_percentage=round(read_pct, 1),
+        rated_articles=rated_count,
+        average_rating=round(avg_rating, 2) if avg_rating else None,
+        articles_by_source=by_source,
+        recent_activity={
+            "fetched_last_7_days": recent.fetched,
+            "read_last_7_days": recent.read,
+        },
+    )
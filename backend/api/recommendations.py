@@ -1,16 +1,18 @@
 """Recommendations API endpoints."""
 
 from fastapi import APIRouter, Query, Request
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from backend.api.articles import ArticleResponse
+from backend.api.cache import response_cache
+from backend.api.responses import etag_response
 from mindscout.config import get_settings
 from mindscout.recommender import RecommendationEngine
 
 settings = get_settings()
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(key_func=get_remote_address, storage_uri=settings.rate_limit_storage_uri)
 
 router = APIRouter()
 
@@ -21,6 +23,10 @@ class RecommendationResponse(BaseModel):
     reasons: list[str]
 
 
+# Validates a whole result list (ORM articles included) in one call
+recommendation_list_adapter = TypeAdapter(list[RecommendationResponse])
+
+
 @router.get("", response_model=list[RecommendationResponse])
 @limiter.limit(f"{settings.rate_limit_requests}/minute")
 def get_recommendations(
@@ -29,25 +35,33 @@ def get_recommendations(
     days_back: int = Query(30, ge=1, le=365),
     min_score: float = Query(0.1, ge=0.0, le=1.0),
 ):
-    """Get personalized recommendations."""
-    engine = RecommendationEngine()
+    """Get personalized recommendations.
 
-    try:
-        recommendations = engine.get_recommendations(
-            limit=limit, days_back=days_back, min_score=min_score, unread_only=True
-        )
+    Results are cached for ``settings.search_cache_ttl`` seconds, and identical
+    concurrent requests share a single scoring pass.
+    """
+
+    def recommend() -> list[dict]:
+        engine = RecommendationEngine()
 
-        return [
-            RecommendationResponse(
-                article=ArticleResponse.model_validate(rec["article"]),
-                score=rec["score"],
-                reasons=rec["reasons"],
+        try:
+            recommendations = engine.get_recommendations(
+                limit=limit, days_back=days_back, min_score=min_score, unread_only=True
             )
-            for rec in recommendations
-        ]
 
-    finally:
-        engine.close()
+            return recommendation_list_adapter.dump_python(
+                recommendation_list_adapter.validate_python(recommendations, from_attributes=True)
+            )
+
+        finally:
+            engine.close()
+
+    cached = response_cache.get_or_set(
+        f"articles:recommendations:{limit}:{days_back}:{min_score}",
+        recommend,
+        ttl=settings.search_cache_ttl,
+    )
+    return etag_response(request, *cached)
 
 
 @router.get("/{article_id}/similar", response_model=list[RecommendationResponse])
@@ -68,14 +82,17 @@ def get_similar_articles(
             article_id=article_id, n_results=limit, min_similarity=min_similarity
         )
 
-        return [
-            RecommendationResponse(
-                article=ArticleResponse.model_validate(sim["article"]),
-                score=sim["similarity"],
-                reasons=[f"{sim['similarity']:.0%} similar"],
-            )
-            for sim in similar
-        ]
+        return recommendation_list_adapter.validate_python(
+            [
+                {
+                    "article": sim["article"],
+                    "score": sim["similarity"],
+                    "reasons": [f"{sim['similarity']:.0%} similar"],
+                }
+                for sim in similar
+            ],
+            from_attributes=True,
+        )
 
     finally:
         vector_store.close()
@@ -97,14 +114,7 @@ def semantic_recommendations(
             limit=limit, use_interests=use_interests, use_reading_history=use_reading_history
         )
 
-        return [
-            RecommendationResponse(
-                article=ArticleResponse.model_validate(rec["article"]),
-                score=rec["score"],
-                reasons=rec["reasons"],
-            )
-            for rec in recommendations
-        ]
+        return recommendation_list_adapter.validate_python(recommendations, from_attributes=True)
 
     finally:
         engine.close()
@@ -0,0 +1,72 @@
+"""Fast JSON responses for hot endpoints."""
+
+import hashlib
+from typing import Any, Optional
+
+import orjson
+from fastapi import Request, Response
+
+
+def make_etag(body: bytes) -> str:
+    """Compute a strong ETag for a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def json_response(content: Any, status_code: int = 200, headers: Optional[dict] = None) -> Response:
+    """Serialize content with orjson and return it as a JSON response.
+
+    Returning a Response directly skips FastAPI's response_model validation
+    and encoding, so only use this for data that already matches the
+    declared model, such as rows read straight from the database.
+
+    Args:
+        content: orjson-serializable payload (dicts, lists, datetimes, ...)
+        status_code: HTTP status code
+        headers: Optional extra response headers
+
+    Returns:
+        JSON response
+    """
+    return Response(
+        content=orjson.dumps(content),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+def etag_response(
+    request: Request, body: bytes, etag: str, cache_control: str = "no-cache"
+) -> Response:
+    """Build a JSON response for an encoded body, honouring If-None-Match.
+
+    Responses are marked ``no-cache`` by default so clients always revalidate,
+    which costs a round trip but never shows stale data after a write.
+
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        body: Encoded JSON body
+        etag: ETag of the body
+        cache_control: Cache-Control header value
+
+    Returns:
+        200 response with the body, or 304 if the client's copy is current
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def json_etag_response(request: Request, content: Any) -> Response:
+    """Serialize content with orjson and return it with an ETag.
+
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        content: orjson-serializable payload
+
+    Returns:
+        200 response with the payload, or 304 if the client's copy is current
+    """
+    body = orjson.dumps(content)
+    return etag_response(request, body, make_etag(body))
@@ -1,16 +1,18 @@
 """Search API endpoints."""
 
 from fastapi import APIRouter, Query, Request
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from backend.api.articles import ArticleResponse
+from backend.api.cache import response_cache
+from backend.api.responses import etag_response
 from mindscout.config import get_settings
 from mindscout.vectorstore import VectorStore
 
 settings = get_settings()
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(key_func=get_remote_address, storage_uri=settings.rate_limit_storage_uri)
 
 router = APIRouter()
 
@@ -20,6 +22,10 @@ class SearchResult(BaseModel):
     relevance: float
 
 
+# Validates a whole result list (ORM articles included) in one call
+search_result_list_adapter = TypeAdapter(list[SearchResult])
+
+
 @router.get("", response_model=list[SearchResult])
 @limiter.limit(f"{settings.rate_limit_requests}/minute")
 def semantic_search(
@@ -27,22 +33,29 @@ def semantic_search(
     q: str = Query(..., min_length=3, description="Search query"),
     limit: int = Query(10, ge=1, le=50),
 ):
-    """Perform semantic search for articles."""
-    vector_store = VectorStore()
+    """Perform semantic search for articles.
 
-    try:
-        results = vector_store.semantic_search(query=q, n_results=limit)
+    Results are cached for ``settings.search_cache_ttl`` seconds, and identical
+    concurrent searches share a single embedding and vector lookup.
+    """
+
+    def search() -> list[dict]:
+        vector_store = VectorStore()
 
-        return [
-            SearchResult(
-                article=ArticleResponse.model_validate(result["article"]),
-                relevance=result["relevance"],
+        try:
+            results = vector_store.semantic_search(query=q, n_results=limit)
+
+            return search_result_list_adapter.dump_python(
+                search_result_list_adapter.validate_python(results, from_attributes=True)
             )
-            for result in results
-        ]
 
-    finally:
-        vector_store.close()
+        finally:
+            vector_store.close()
+
+    cached = response_cache.get_or_set(
+        f"articles:search:{limit}:{q}", search, ttl=settings.search_cache_ttl
+    )
+    return etag_response(request, *cached)
 
 
 @router.get("/stats")
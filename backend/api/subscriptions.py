@@ -3,11 +3,18 @@
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-
+import requests
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from backend.api.cache import response_cache
+from backend.api.responses import etag_response, make_etag
 from mindscout.config import CURATED_FEEDS
-from mindscout.database import RSSFeed, get_session
+from mindscout.database import RSSFeed, get_db
+from mindscout.fetchers.rss import RSSFetcher, download_feed
 
 router = APIRouter()
 
@@ -46,165 +53,169 @@ class CuratedFeedResponse(BaseModel):
     description: str
 
 
-@router.get("", response_model=list[SubscriptionResponse])
-def list_subscriptions():
-    """List all RSS feed subscriptions."""
-    session = get_session()
+CURATED_CACHE_CONTROL = "public, max-age=86400"
 
-    try:
-        feeds = session.query(RSSFeed).order_by(RSSFeed.created_date.desc()).all()
-        return [SubscriptionResponse.model_validate(feed) for feed in feeds]
+# Validates and serializes a whole feed list in one call
+curated_feed_list_adapter = TypeAdapter(list[CuratedFeedResponse])
+
+_CURATED_FEEDS_BODY = curated_feed_list_adapter.dump_json(
+    curated_feed_list_adapter.validate_python(CURATED_FEEDS)
+)
+_CURATED_FEEDS_ETAG = make_etag(_CURATED_FEEDS_BODY)
 
-    finally:
-        session.close()
+
+@router.get("", response_model=list[SubscriptionResponse])
+def list_subscriptions(
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
+    """List RSS feed subscriptions, newest first.
+
+    Every subscription is returned unless a limit is given; limit and offset
+    let callers page through the list instead.
+
+    Rows are returned as-is; FastAPI validates them against the response
+    model (from attributes) and serializes straight to JSON bytes.
+    """
+    return (
+        db.query(RSSFeed)
+        .order_by(RSSFeed.created_date.desc(), RSSFeed.id.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
 
 
 @router.get("/curated", response_model=list[CuratedFeedResponse])
-def list_curated_feeds():
-    """Get list of curated/suggested RSS feeds."""
-    return [
-        CuratedFeedResponse(
-            url=feed["url"],
-            title=feed["title"],
-            category=feed["category"],
-            description=feed["description"],
-        )
-        for feed in CURATED_FEEDS
-    ]
+def list_curated_feeds(request: Request):
+    """Get list of curated/suggested RSS feeds.
+
+    The list is a constant, so it is serialized once at import time.
+    """
+    return etag_response(
+        request, _CURATED_FEEDS_BODY, _CURATED_FEEDS_ETAG, cache_control=CURATED_CACHE_CONTROL
+    )
 
 
 @router.post("", response_model=SubscriptionResponse)
-def create_subscription(request: SubscriptionCreate):
+def create_subscription(request: SubscriptionCreate, db: Session = Depends(get_db)):
     """Subscribe to a new RSS feed."""
-    import feedparser
-
-    session = get_session()
+    # Reject known feeds before downloading anything
+    if db.scalar(select(RSSFeed.id).where(RSSFeed.url == request.url)) is not None:
+        raise HTTPException(status_code=400, detail="Already subscribed to this feed")
 
+    # Validate the feed URL by fetching it
     try:
-        # Check if already subscribed
-        existing = session.query(RSSFeed).filter(RSSFeed.url == request.url).first()
-        if existing:
-            raise HTTPException(status_code=400, detail="Already subscribed to this feed")
-
-        # Validate the feed URL by fetching it
-        feed = feedparser.parse(request.url)
-        if feed.bozo and not feed.entries:
-            raise HTTPException(status_code=400, detail="Invalid RSS feed URL or feed is empty")
-
-        # Get title from feed if not provided
-        title = request.title
-        if not title and feed.feed.get("title"):
-            title = feed.feed.title
-
-        # Create subscription
-        subscription = RSSFeed(
+        feed = download_feed(request.url)
+    except requests.RequestException:
+        raise HTTPException(status_code=400, detail="Could not fetch RSS feed URL")
+    if feed.bozo and not feed.entries:
+        raise HTTPException(status_code=400, detail="Invalid RSS feed URL or feed is empty")
+
+    # Get title from feed if not provided
+    title = request.title
+    if not title and feed.feed.get("title"):
+        title = feed.feed.title
+
+    # Create subscription; the unique url constraint still rejects a feed
+    # subscribed concurrently since the check above
+    stmt = (
+        pg_insert(RSSFeed)
+        .values(
             url=request.url,
             title=title,
             category=request.category,
             is_active=True,
             check_interval=60,
         )
+        .on_conflict_do_nothing(index_elements=[RSSFeed.url])
+        .returning(RSSFeed)
+    )
+    subscription = db.execute(stmt).scalar_one_or_none()
+    if subscription is None:
+        raise HTTPException(status_code=400, detail="Already subscribed to this feed")
 
-        session.add(subscription)
-        session.commit()
-        session.refresh(subscription)
-
-        return SubscriptionResponse.model_validate(subscription)
+    # Build the response before committing, which would expire the returned row
+    response = SubscriptionResponse.model_validate(subscription)
+    db.commit()
 
-    finally:
-        session.close()
+    return response
 
 
 @router.get("/{subscription_id}", response_model=SubscriptionResponse)
-def get_subscription(subscription_id: int):
+def get_subscription(subscription_id: int, db: Session = Depends(get_db)):
     """Get a specific subscription."""
-    session = get_session()
+    subscription = db.get(RSSFeed, subscription_id)
+    if not subscription:
+        raise HTTPException(status_code=404, detail="Subscription not found")
 
-    try:
-        subscription = session.query(RSSFeed).filter(RSSFeed.id == subscription_id).first()
-        if not subscription:
-            raise HTTPException(status_code=404, detail="Subscription not found")
-
-        return SubscriptionResponse.model_validate(subscription)
-
-    finally:
-        session.close()
+    return SubscriptionResponse.model_validate(subscription)
 
 
 @router.put("/{subscription_id}", response_model=SubscriptionResponse)
-def update_subscription(subscription_id: int, request: SubscriptionUpdate):
-    """Update a subscription."""
-    session = get_session()
-
-    try:
-        subscription = session.query(RSSFeed).filter(RSSFeed.id == subscription_id).first()
-        if not subscription:
-            raise HTTPException(status_code=404, detail="Subscription not found")
-
-        if request.title is not None:
-            subscription.title = request.title
-        if request.category is not None:
-            subscription.category = request.category
-        if request.is_active is not None:
-            subscription.is_active = request.is_active
-        if request.check_interval is not None:
-            subscription.check_interval = request.check_interval
+def update_subscription(
+    subscription_id: int, request: SubscriptionUpdate, db: Session = Depends(get_db)
+):
+    """Update a subscription.
 
-        session.commit()
-        session.refresh(subscription)
+    The changed columns are written with UPDATE ... RETURNING, so the updated
+    row comes back without a separate lookup or refresh.
+    """
+    changes = request.model_dump(exclude_none=True)
+    if changes:
+        stmt = (
+            update(RSSFeed)
+            .where(RSSFeed.id == subscription_id)
+            .values(**changes)
+            .returning(RSSFeed)
+        )
+        subscription = db.execute(stmt).scalar_one_or_none()
+    else:
+        subscription = db.get(RSSFeed, subscription_id)
+    if not subscription:
+        raise HTTPException(status_code=404, detail="Subscription not found")
 
-        return SubscriptionResponse.model_validate(subscription)
+    response = SubscriptionResponse.model_validate(subscription)
+    db.commit()
 
-    finally:
-        session.close()
+    return response
 
 
 @router.delete("/{subscription_id}")
-def delete_subscription(subscription_id: int):
+def delete_subscription(subscription_id: int, db: Session = Depends(get_db)):
     """Unsubscribe from a feed."""
-    session = get_session()
+    subscription = db.get(RSSFeed, subscription_id)
+    if not subscription:
+        raise HTTPException(status_code=404, detail="Subscription not found")
 
-    try:
-        subscription = session.query(RSSFeed).filter(RSSFeed.id == subscription_id).first()
-        if not subscription:
-            raise HTTPException(status_code=404, detail="Subscription not found")
-
-        session.delete(subscription)
-        session.commit()
+    db.delete(subscription)
+    db.commit()
 
-        return {"success": True, "message": "Subscription deleted"}
-
-    finally:
-        session.close()
+    return {"success": True, "message": "Subscription deleted"}
 
 
 @router.post("/{subscription_id}/refresh")
-def refresh_subscription(subscription_id: int):
+def refresh_subscription(subscription_id: int, db: Session = Depends(get_db)):
     """Manually refresh a subscription and fetch new articles.
 
     Note: Notifications are created by the content processor when articles
     match user interests, not during feed refresh.
     """
-    from mindscout.fetchers.rss import RSSFetcher
-
-    session = get_session()
+    subscription = db.get(RSSFeed, subscription_id)
+    if not subscription:
+        raise HTTPException(status_code=404, detail="Subscription not found")
 
-    try:
-        subscription = session.query(RSSFeed).filter(RSSFeed.id == subscription_id).first()
-        if not subscription:
-            raise HTTPException(status_code=404, detail="Subscription not found")
-
-        # Fetch new articles
-        fetcher = RSSFetcher()
-        result = fetcher.fetch_feed(subscription)
+    # Fetch new articles
+    fetcher = RSSFetcher()
+    result = fetcher.fetch_feed(subscription)
+    if result["new_count"]:
+        response_cache.invalidate("articles:")
 
-        return {
-            "success": True,
-            "new_articles": result["new_count"],
-        }
-
-    finally:
-        session.close()
+    return {
+        "success": True,
+        "new_articles": result["new_count"],
+    }
 
 
 @router.post("/refresh-all")
@@ -214,25 +225,14 @@ def refresh_all_subscriptions():
     Note: Notifications are created by the content processor when articles
     match user interests, not during feed refresh.
     """
-    from mindscout.fetchers.rss import RSSFetcher
-
-    session = get_session()
-
-    try:
-        feeds = session.query(RSSFeed).filter(RSSFeed.is_active).all()
-
-        fetcher = RSSFetcher()
-        total_new = 0
-
-        for feed in feeds:
-            result = fetcher.fetch_feed(feed)
-            total_new += result["new_count"]
+    # Feeds are fetched concurrently, each in its own session
+    result = RSSFetcher().refresh_all_feeds()
 
-        return {
-            "success": True,
-            "feeds_checked": len(feeds),
-            "new_articles": total_new,
-        }
+    if result["new_count"]:
+        response_cache.invalidate("articles:")
 
-    finally:
-        session.close()
+    return {
+        "success": True,
+        "feeds_checked": result["feeds_checked"],
+        "new_articles": result["new_count"],
+    }
@@ -1,12 +1,18 @@
 """Background scheduler for Mind Scout."""
 
 from backend.scheduler.jobs import check_pending_batches_job, fetch_and_process_job
-from backend.scheduler.scheduler import scheduler, shutdown_scheduler, start_scheduler
+from backend.scheduler.scheduler import (
+    schedule_batch_check,
+    scheduler,
+    shutdown_scheduler,
+    start_scheduler,
+)
 
 __all__ = [
     "scheduler",
     "start_scheduler",
     "shutdown_scheduler",
+    "schedule_batch_check",
     "fetch_and_process_job",
     "check_pending_batches_job",
 ]
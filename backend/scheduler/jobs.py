@@ -1,23 +1,170 @@
 """Background job definitions for Mind Scout."""
 
+import asyncio
 import logging
+from collections import defaultdict
 from datetime import datetime
+from typing import Optional
 
-from mindscout.database import Article, PendingBatch, get_db_session
+from sqlalchemy import func, select, update
+
+from backend.api.cache import response_cache
+from backend.scheduler.scheduler import schedule_batch_check
+from mindscout.config import get_settings
+from mindscout.database import Article, PendingBatch, UserProfile, get_db_session
 
 logger = logging.getLogger(__name__)
 
+# Polling bounds for a pending batch. Batches usually finish within minutes,
+# so the first check comes soon after submission; after that a batch is
+# checked again after half its age, so long-running batches are polled less.
+MIN_BATCH_CHECK_DELAY_MINUTES = 5
+MAX_BATCH_CHECK_DELAY_MINUTES = 60
+
+# Advisory lock key held while checking for and submitting a processing batch
+BATCH_QUEUE_LOCK_KEY = 72_001
+
 
 def get_user_interests() -> list[str]:
-    """Get user interests from profile, return empty list if none."""
-    from mindscout.profile import ProfileManager
+    """Get user interests from profile, return empty list if none.
+
+    Reads only the interests column in a short-lived session rather than
+    loading the profile through a ProfileManager whose session stays open.
+    """
+    with get_db_session() as session:
+        interests = session.scalars(select(UserProfile.interests).limit(1)).first()
+    if not interests:
+        return []
+    # interests stored as comma-separated string
+    return [i.strip() for i in interests.split(",") if i.strip()]
+
+
+def queue_processing_batch(limit: int = 100) -> tuple[Optional[str], int]:
+    """Submit unprocessed articles as an async LLM batch and record it as pending.
+
+    The batch is processed off-box by Anthropic's Message Batches API;
+    check_pending_batches_job applies the results once it completes.
+
+    Articles stay unprocessed until then, so only one batch is in flight at a
+    time: while a pending or processing batch exists it is returned instead of
+    paying to submit the same articles again.
+
+    Args:
+        limit: Maximum number of articles to include in the batch
+
+    Returns:
+        Tuple of (batch_id, article_count). batch_id is None if there was
+        nothing to process.
+    """
+    from mindscout.processors.content import ContentProcessor
+
+    with get_db_session() as session:
+        # Serialize submissions, across API workers too, so concurrent
+        # requests cannot both find no batch in flight
+        session.execute(select(func.pg_advisory_xact_lock(BATCH_QUEUE_LOCK_KEY)))
+
+        unfinished = session.execute(
+            select(PendingBatch.batch_id, PendingBatch.article_count)
+            .where(PendingBatch.status.in_(["pending", "processing"]))
+            .order_by(PendingBatch.created_date)
+            .limit(1)
+        ).first()
+        if unfinished:
+            logger.info(f"Batch {unfinished.batch_id} is still in flight - not creating another")
+            return unfinished.batch_id, unfinished.article_count
+
+        # Count unprocessed articles, stopping at the batch size
+        unprocessed = select(Article.id).where(Article.processed.is_(False)).limit(limit)
+        article_count = session.scalar(select(func.count()).select_from(unprocessed.subquery()))
+
+        if article_count == 0:
+            logger.info("No unprocessed articles - skipping batch creation")
+            return None, 0
+
+        processor = ContentProcessor()
+        batch_id = processor.create_async_batch(limit=limit)
+
+        # Store pending batch in database
+        session.add(PendingBatch(batch_id=batch_id, article_count=article_count, status="pending"))
+
+    logger.info(f"Created async batch {batch_id} for {article_count} articles")
+    schedule_batch_check(MIN_BATCH_CHECK_DELAY_MINUTES)
+    return batch_id, article_count
+
+
+def _fetch_rss() -> dict:
+    """Refresh all RSS feeds (always - user explicitly subscribed)."""
+    result = {"feeds": 0, "articles": 0}
+    try:
+        from mindscout.fetchers.rss import RSSFetcher
 
-    pm = ProfileManager()
-    profile = pm.get_profile()
-    if profile and profile.interests:
-        # interests stored as comma-separated string
-        return [i.strip() for i in profile.interests.split(",") if i.strip()]
-    return []
+        rss_fetcher = RSSFetcher()
+        rss_result = rss_fetcher.refresh_all_feeds()
+        result["feeds"] = rss_result.get("feeds_checked", 0)
+        result["articles"] = rss_result.get("new_count", 0)
+        logger.info(f"RSS: {result['articles']} new from {result['feeds']} feeds")
+    except Exception as e:
+        logger.error(f"RSS fetch failed: {e}")
+    return result
+
+
+async def _fetch_arxiv(interests: list[str]) -> dict:
+    """Fetch arXiv papers for the top user interests.
+
+    Each interest is searched in its own worker thread. The fetcher's shared
+    rate limiter still spaces the requests out, but parsing and storing one
+    result overlaps with waiting on the next.
+    """
+    result = {"articles": 0}
+    try:
+        from mindscout.fetchers.arxiv_advanced import ArxivAdvancedFetcher
+
+        fetcher = ArxivAdvancedFetcher()
+    except Exception as e:
+        logger.error(f"arXiv fetch failed: {e}")
+        return result
+
+    # Search for each interest keyword (top 5)
+    top_interests = interests[:5]
+    counts = await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                fetcher.fetch_and_store,
+                keywords=interest,
+                max_results=20,
+                sort_by="submittedDate",
+                sort_order="descending",
+            )
+            for interest in top_interests
+        ),
+        return_exceptions=True,
+    )
+    for interest, count in zip(top_interests, counts):
+        if isinstance(count, Exception):
+            logger.error(f"arXiv fetch failed for {interest!r}: {count}")
+        else:
+            result["articles"] += count
+    logger.info(f"arXiv: {result['articles']} new articles for interests: {top_interests}")
+    return result
+
+
+def _fetch_semanticscholar(interests: list[str]) -> dict:
+    """Fetch Semantic Scholar papers for the top user interests."""
+    result = {"articles": 0}
+    try:
+        from mindscout.fetchers.semanticscholar import SemanticScholarFetcher
+
+        ss_fetcher = SemanticScholarFetcher()
+        # Search for combined interests (top 3 as OR query)
+        query = " OR ".join(interests[:3])
+        articles = ss_fetcher.fetch(query=query, limit=50, year="2024-2025")
+        ss_count = ss_fetcher.store_articles(articles)
+        ss_fetcher.close()
+        result["articles"] = ss_count
+        logger.info(f"Semantic Scholar: {ss_count} new articles for: {query}")
+    except Exception as e:
+        logger.error(f"Semantic Scholar fetch failed: {e}")
+    return result
 
 
 async def fetch_and_process_job() -> dict:
@@ -28,7 +175,8 @@ async def fetch_and_process_job() -> dict:
     - arXiv (based on user interests)
     - Semantic Scholar (based on user interests)
 
-    Then processes up to 50 new articles with LLM.
+    The sources are independent and network-bound, so they are fetched
+    concurrently, as are the per-interest arXiv searches. Then processes up to 50 new articles with LLM.
 
     Returns:
         Dictionary with fetch and process results
@@ -48,88 +196,30 @@ async def fetch_and_process_job() -> dict:
     if not interests:
         logger.warning("No user interests configured - skipping arXiv and Semantic Scholar fetch")
 
-    # 1. Refresh RSS feeds (always - user explicitly subscribed)
-    try:
-        from mindscout.fetchers.rss import RSSFetcher
-
-        rss_fetcher = RSSFetcher()
-        rss_result = rss_fetcher.refresh_all_feeds()
-        results["rss"]["feeds"] = rss_result.get("feeds_checked", 0)
-        results["rss"]["articles"] = rss_result.get("new_count", 0)
-        logger.info(f"RSS: {results['rss']['articles']} new from {results['rss']['feeds']} feeds")
-    except Exception as e:
-        logger.error(f"RSS fetch failed: {e}")
-
-    # 2. Fetch arXiv based on user interests
+    # 1-3. Refresh RSS feeds and search arXiv / Semantic Scholar concurrently
+    fetches = {"rss": asyncio.to_thread(_fetch_rss)}
     if interests:
-        try:
-            from mindscout.fetchers.arxiv_advanced import ArxivAdvancedFetcher
-
-            fetcher = ArxivAdvancedFetcher()
-            # Search for each interest keyword (top 5)
-            for interest in interests[:5]:
-                count = fetcher.fetch_and_store(
-                    keywords=interest,
-                    max_results=20,
-                    sort_by="submittedDate",
-                    sort_order="descending",
-                )
-                results["arxiv"]["articles"] += count
-            logger.info(
-                f"arXiv: {results['arxiv']['articles']} new articles "
-                f"for interests: {interests[:5]}"
-            )
-        except Exception as e:
-            logger.error(f"arXiv fetch failed: {e}")
+        fetches["arxiv"] = _fetch_arxiv(interests)
+        fetches["semanticscholar"] = asyncio.to_thread(_fetch_semanticscholar, interests)
+
+    # A failing source must not abort the others or the batch step below
+    outcomes = await asyncio.gather(*fetches.values(), return_exceptions=True)
+    for source, result in zip(fetches, outcomes):
+        if isinstance(result, Exception):
+            logger.error(f"{source} fetch failed: {result}")
+        else:
+            results[source] = result
 
-    # 3. Fetch Semantic Scholar based on user interests
-    if interests:
-        try:
-            from mindscout.fetchers.semanticscholar import SemanticScholarFetcher
-
-            ss_fetcher = SemanticScholarFetcher()
-            # Search for combined interests (top 3 as OR query)
-            query = " OR ".join(interests[:3])
-            articles = ss_fetcher.fetch(query=query, limit=50, year="2024-2025")
-            ss_count = ss_fetcher.store_articles(articles)
-            ss_fetcher.close()
-            results["semanticscholar"]["articles"] = ss_count
-            logger.info(f"Semantic Scholar: {ss_count} new articles for: {query}")
-        except Exception as e:
-            logger.error(f"Semantic Scholar fetch failed: {e}")
-
-    # 4. Create async batch for processing (50% cheaper)
+    # 4. Create async batch for processing (50% cheaper). Its results are only
+    # applied by the scheduler's batch check, so skip it when that never runs.
     try:
-        from mindscout.processors.content import ContentProcessor
-
-        # Check how many unprocessed articles we have
-        with get_db_session() as session:
-            unprocessed_count = (
-                session.query(Article).filter(Article.processed == False).count()  # noqa: E712
-            )
-
-        if unprocessed_count > 0:
-            processor = ContentProcessor()
-            batch_id = processor.create_async_batch(limit=100)
-
-            # Store pending batch in database
-            with get_db_session() as session:
-                pending = PendingBatch(
-                    batch_id=batch_id,
-                    article_count=min(unprocessed_count, 100),
-                    status="pending",
-                )
-                session.add(pending)
-
-            results["batch_id"] = batch_id
-            results["batch_articles"] = min(unprocessed_count, 100)
-            logger.info(
-                f"Created async batch {batch_id} for {min(unprocessed_count, 100)} articles"
-            )
+        if get_settings().scheduler_enabled:
+            batch_id, batch_articles = queue_processing_batch(limit=100)
         else:
-            logger.info("No unprocessed articles - skipping batch creation")
-            results["batch_id"] = None
-            results["batch_articles"] = 0
+            logger.info("Scheduler is disabled - skipping batch creation")
+            batch_id, batch_articles = None, 0
+        results["batch_id"] = batch_id
+        results["batch_articles"] = batch_articles
 
     except Exception as e:
         logger.error(f"Batch creation failed: {e}")
@@ -141,6 +231,8 @@ async def fetch_and_process_job() -> dict:
         + results["arxiv"]["articles"]
         + results["semanticscholar"]["articles"]
     )
+    if total_fetched:
+        response_cache.invalidate("articles:")
     logger.info(
         f"Daily job complete: {total_fetched} fetched, "
         f"batch created for {results.get('batch_articles', 0)} articles"
@@ -149,19 +241,33 @@ async def fetch_and_process_job() -> dict:
     return results
 
 
+def _update_batches(session, batch_ids: list[str], **values) -> None:
+    """Set the same column values on every pending batch in batch_ids."""
+    if batch_ids:
+        session.execute(
+            update(PendingBatch).where(PendingBatch.batch_id.in_(batch_ids)).values(**values)
+        )
+
+
+# Set while a batch check runs; the one-shot and fallback checks can come
+# due together and must not apply the same batch twice
+_batch_check_running = False
+
+
 async def check_pending_batches_job() -> dict:
     """Check pending batches and apply results when complete.
 
-    This job runs periodically to check if any async batches have completed
-    and applies their results to the database.
+    This job runs shortly after a batch is created and then again while any
+    batch is unfinished, backing off as the batches age (with an hourly
+    fallback run). Completed batches have their results applied to the
+    database. Batch statuses are polled concurrently and the resulting state
+    changes are written in bulk. A check that starts while another is still
+    running is skipped.
 
     Returns:
         Dictionary with batch processing results
     """
-    from mindscout.processors.content import ContentProcessor
-    from mindscout.processors.llm import LLMClient
-
-    logger.info("Checking pending batches...")
+    global _batch_check_running
 
     results = {
         "checked": 0,
@@ -171,66 +277,122 @@ async def check_pending_batches_job() -> dict:
         "articles_updated": 0,
     }
 
+    if _batch_check_running:
+        logger.info("Batch check already running - skipping")
+        return results
+
+    _batch_check_running = True
+    try:
+        await _check_pending_batches(results)
+    finally:
+        _batch_check_running = False
+    return results
+
+
+async def _check_pending_batches(results: dict):
+    """Poll pending batches and record the outcomes in results."""
+    from mindscout.processors.content import ContentProcessor
+    from mindscout.processors.llm import LLMClient
+
+    logger.info("Checking pending batches...")
+
     try:
         llm = LLMClient()
         processor = ContentProcessor()
     except Exception as e:
         logger.error(f"Failed to initialize LLM client: {e}")
-        return results
+        return
 
     # Get all pending batches
     with get_db_session() as session:
-        pending_batches = (
-            session.query(PendingBatch)
-            .filter(PendingBatch.status.in_(["pending", "processing"]))
-            .all()
-        )
+        pending = session.execute(
+            select(PendingBatch.batch_id, PendingBatch.created_date).where(
+                PendingBatch.status.in_(["pending", "processing"])
+            )
+        ).all()
+    batch_ids = [batch_id for batch_id, _ in pending]
+    created = dict(pending)
+    results["checked"] = len(batch_ids)
+
+    # Poll every batch at once; each status check is an independent API call
+    statuses = await asyncio.gather(
+        *(asyncio.to_thread(llm.get_batch_status, batch_id) for batch_id in batch_ids),
+        return_exceptions=True,
+    )
 
-        for batch in pending_batches:
-            results["checked"] += 1
+    completed, processing = [], []
+    failed = defaultdict(list)  # terminal status -> batch ids
+    errors = defaultdict(list)  # error message -> batch ids (status left for a retry)
+
+    for batch_id, status in zip(batch_ids, statuses):
+        if isinstance(status, Exception):
+            logger.error(f"Error checking batch {batch_id}: {status}")
+            errors[str(status)].append(batch_id)
+            results["failed"] += 1
+            continue
+
+        logger.info(
+            f"Batch {batch_id}: status={status['status']}, "
+            f"succeeded={status['counts']['succeeded']}"
+        )
 
+        if status["status"] == "ended":
+            # Batch complete - apply results
             try:
-                status = llm.get_batch_status(batch.batch_id)
-                logger.info(
-                    f"Batch {batch.batch_id}: status={status['status']}, "
-                    f"succeeded={status['counts']['succeeded']}"
+                updated, failed_count = await asyncio.to_thread(
+                    processor.apply_batch_results, batch_id
                 )
+            except Exception as e:
+                logger.error(f"Error applying batch {batch_id}: {e}")
+                errors[str(e)].append(batch_id)
+                results["failed"] += 1
+                continue
 
-                if status["status"] == "ended":
-                    # Batch complete - apply results
-                    updated, failed = processor.apply_batch_results(batch.batch_id)
-                    results["articles_updated"] += updated
-
-                    batch.status = "completed"
-                    batch.completed_date = datetime.utcnow()
-                    results["completed"] += 1
+            results["articles_updated"] += updated
+            completed.append(batch_id)
+            results["completed"] += 1
 
-                    logger.info(
-                        f"Batch {batch.batch_id} completed: "
-                        f"{updated} articles updated, {failed} failed"
-                    )
+            logger.info(
+                f"Batch {batch_id} completed: {updated} articles updated, {failed_count} failed"
+            )
 
-                elif status["status"] in ["failed", "expired", "canceled"]:
-                    batch.status = "failed"
-                    batch.error_message = f"Batch {status['status']}"
-                    batch.completed_date = datetime.utcnow()
-                    results["failed"] += 1
+        elif status["status"] in ["failed", "expired", "canceled"]:
+            failed[status["status"]].append(batch_id)
+            results["failed"] += 1
 
-                    logger.warning(f"Batch {batch.batch_id} {status['status']}")
+            logger.warning(f"Batch {batch_id} {status['status']}")
 
-                else:
-                    # Still processing
-                    batch.status = "processing"
-                    results["still_pending"] += 1
+        else:
+            # Still processing
+            processing.append(batch_id)
+            results["still_pending"] += 1
 
-            except Exception as e:
-                logger.error(f"Error checking batch {batch.batch_id}: {e}")
-                batch.error_message = str(e)
-                results["failed"] += 1
+    # Apply the state transitions with one UPDATE per outcome
+    now = datetime.utcnow()
+    with get_db_session() as session:
+        _update_batches(session, completed, status="completed", completed_date=now)
+        _update_batches(session, processing, status="processing")
+        for batch_status, ids in failed.items():
+            _update_batches(
+                session,
+                ids,
+                status="failed",
+                error_message=f"Batch {batch_status}",
+                completed_date=now,
+            )
+        for message, ids in errors.items():
+            _update_batches(session, ids, error_message=message)
+
+    # Check unfinished batches again, sooner while they are young
+    unfinished = processing + [batch_id for ids in errors.values() for batch_id in ids]
+    if unfinished:
+        oldest = min(created[batch_id] or now for batch_id in unfinished)
+        age_minutes = (now - oldest).total_seconds() / 60
+        schedule_batch_check(
+            min(max(age_minutes / 2, MIN_BATCH_CHECK_DELAY_MINUTES), MAX_BATCH_CHECK_DELAY_MINUTES)
+        )
 
     logger.info(
         f"Batch check complete: {results['completed']} completed, "
         f"{results['still_pending']} pending, {results['failed']} failed"
     )
-
-    return results
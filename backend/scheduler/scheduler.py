@@ -1,9 +1,11 @@
 """APScheduler configuration for background jobs."""
 
 import logging
+from datetime import datetime, timedelta, timezone
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from mindscout.config import get_settings
@@ -12,6 +14,44 @@ logger = logging.getLogger(__name__)
 
 scheduler = AsyncIOScheduler()
 
+# Batch checks are scheduled by the batches themselves (see
+# schedule_batch_check); the interval job is only a fallback, e.g. for
+# batches left pending across a restart
+BATCH_CHECK_FALLBACK_MINUTES = 60
+
+# Job id of the next one-shot batch check
+BATCH_CHECK_SOON_ID = "check_pending_batches_soon"
+
+
+def schedule_batch_check(delay_minutes: float):
+    """Check pending batches once, ``delay_minutes`` from now.
+
+    Only the earliest requested check is kept, so a new batch never pushes
+    back a check that is already due sooner. Does nothing when the scheduler
+    isn't running.
+
+    Args:
+        delay_minutes: Minutes until the check runs
+    """
+    if not scheduler.running:
+        return
+
+    from backend.scheduler.jobs import check_pending_batches_job
+
+    run_date = datetime.now(timezone.utc) + timedelta(minutes=delay_minutes)
+    job = scheduler.get_job(BATCH_CHECK_SOON_ID)
+    if job is not None and job.next_run_time <= run_date:
+        return
+
+    scheduler.add_job(
+        check_pending_batches_job,
+        DateTrigger(run_date=run_date),
+        id=BATCH_CHECK_SOON_ID,
+        name="Check pending batches (one-shot)",
+        replace_existing=True,
+    )
+    logger.info(f"Next batch check in {delay_minutes:.0f} min")
+
 
 def start_scheduler():
     """Start the background scheduler."""
@@ -32,10 +72,10 @@ def start_scheduler():
         replace_existing=True,
     )
 
-    # Check pending batches every 15 minutes
+    # Fallback check for pending batches; regular checks are one-shot jobs
     scheduler.add_job(
         check_pending_batches_job,
-        IntervalTrigger(minutes=15),
+        IntervalTrigger(minutes=BATCH_CHECK_FALLBACK_MINUTES),
         id="check_pending_batches",
         name="Check pending batches",
         replace_existing=True,
@@ -45,7 +85,7 @@ def start_scheduler():
     logger.info(
         f"Scheduler started - daily job at "
         f"{settings.scheduler_hour:02d}:{settings.scheduler_minute:02d}, "
-        f"batch check every 15 min"
+        f"fallback batch check every {BATCH_CHECK_FALLBACK_MINUTES} min"
     )
 
 
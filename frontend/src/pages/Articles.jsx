@@ -121,13 +121,15 @@ export default function Articles() {
         sort_order: sortOrder,
       })
 
+      // Counting is a separate query; only ask for it on the first page
+      if (page === 1) params.append('include_total', 'true')
       if (unreadOnly) params.append('unread_only', 'true')
       if (sourceName) params.append('source_name', sourceName)
 
       const response = await fetch(`${API_BASE}/articles?${params}`)
       const data = await response.json()
       setArticles(data.articles)
-      setTotal(data.total)
+      if (data.total != null) setTotal(data.total)
     } catch (error) {
       console.error('Error fetching articles:', error)
     }
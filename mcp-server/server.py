@@ -11,7 +11,7 @@ This MCP server enables Claude Desktop (and other MCP-compatible AI assistants)
 - Rate and track reading progress
 - Manage your profile and interests
 
-Tools (11 total):
+Tools (12 total):
 
 Search & Discovery:
 - search_papers: Semantic search through research papers using natural language
@@ -34,6 +34,9 @@ Profile & Settings:
 - get_profile: View user profile, interests, and comprehensive reading statistics
 - update_interests: Update research interests to improve recommendations
 
+Batching:
+- batch_execute: Run several of the tools above in one call
+
 Usage:
     Once installed in Claude Desktop, simply ask questions like:
     - "Fetch new transformer papers from arXiv"
@@ -43,8 +46,17 @@ Usage:
     - "I want to learn about RLHF" (triggers research planning workflow)
 """
 
+import asyncio
+import base64
+import hashlib
+import json
 import os
 import sys
+import threading
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal, Optional
 
@@ -59,14 +71,22 @@ load_dotenv(Path(__file__).parent.parent / ".env")
 
 import time  # noqa: E402
 
+import numpy as np  # noqa: E402
+from sqlalchemy import case, func, select, tuple_, update  # noqa: E402
+
 from mindscout.config import get_settings  # noqa: E402
-from mindscout.database import Article, UserProfile, get_session  # noqa: E402
+from mindscout.database import (  # noqa: E402
+    Article,
+    SourceStats,
+    UserProfile,
+    get_async_db_session,
+)
 from mindscout.fetchers.arxiv import fetch_arxiv  # noqa: E402
 from mindscout.fetchers.semanticscholar import SemanticScholarFetcher  # noqa: E402
 from mindscout.observability import init_phoenix  # noqa: E402
 from mindscout.recommender import RecommendationEngine  # noqa: E402
 from mindscout.research_planner import ResearchPlannerAgent  # noqa: E402
-from mindscout.vectorstore import VectorStore  # noqa: E402
+from mindscout.vectorstore import VectorStore, embed_query  # noqa: E402
 
 # Validate required environment variables
 if not os.getenv("ANTHROPIC_API_KEY"):
@@ -85,8 +105,152 @@ if not tracer:
         "Failed to initialize Phoenix tracing. Check your API key and network connection."
     )
 
+
+class _CachedToolListMCP(FastMCP):
+    """FastMCP server that builds its tools/list response once.
+
+    FastMCP turns every registered tool into a protocol Tool model on each
+    tools/list request. The tools here are all registered at import and do
+    not change afterwards, so the list is built on first use and reused
+    until a tool is added or removed.
+    """
+
+    _tool_list = None
+
+    async def list_tools(self):
+        """List the registered tools, reusing the list built last time."""
+        if self._tool_list is None:
+            self._tool_list = await super().list_tools()
+        return self._tool_list
+
+    def add_tool(self, *args, **kwargs):
+        """Register a tool and drop the cached tool list."""
+        self._tool_list = None
+        return super().add_tool(*args, **kwargs)
+
+    def remove_tool(self, *args, **kwargs):
+        """Remove a tool and drop the cached tool list."""
+        self._tool_list = None
+        return super().remove_tool(*args, **kwargs)
+
+
 # Initialize MCP server
-mcp = FastMCP("Mind Scout")
+mcp = _CachedToolListMCP("Mind Scout")
+
+# Session shared by the operations of a sequential batch_execute call
+_batch_session: ContextVar = ContextVar("batch_session", default=None)
+
+
+@asynccontextmanager
+async def _tool_session():
+    """Get the async database session for a tool call.
+
+    Database tools are coroutines so queries don't block the event loop and
+    the operations of a concurrent batch overlap. Inside a sequential batch
+    the batch's shared session is reused and each tool runs in a savepoint,
+    so a failing tool only undoes its own changes and the whole batch commits
+    once. Otherwise the tool gets its own session, committed when the tool
+    returns.
+    """
+    session = _batch_session.get()
+    if session is None:
+        async with get_async_db_session() as session:
+            yield session
+    else:
+        async with session.begin_nested():
+            yield session
+
+
+# Characters of abstract shown in article listings
+ABSTRACT_PREVIEW_LENGTH = 200
+
+# Rows fetched per round trip when streaming an article listing
+LIST_STREAM_CHUNK_SIZE = 50
+
+# to_char pattern for datetime.isoformat(); a zero fraction is stripped after
+# formatting, as isoformat() omits it
+SQL_ISO_FORMAT = 'YYYY-MM-DD"T"HH24:MI:SS.US'
+
+# Library statistics: source_stats is kept current by triggers on articles, so
+# this reads one row per source instead of aggregating every article
+_LIBRARY_STATS = select(
+    SourceStats.source,
+    SourceStats.total,
+    SourceStats.read,
+    SourceStats.rated,
+    SourceStats.rating_sum,
+).where(SourceStats.total > 0)
+
+
+# Most queries remembered by the search_papers semantic cache
+SEARCH_CACHE_MAX_ENTRIES = 1024
+
+
+class _SemanticSearchCache:
+    """Remembers search_papers results by query embedding.
+
+    Agents often repeat a search in slightly different words ("transformer
+    papers" vs "papers on transformers"). A query whose normalized embedding
+    is within ``similarity`` of a cached one reuses that query's results
+    instead of querying the vector store again.
+
+    Entries are tagged with the library version they were computed against;
+    ``bump_version`` makes every existing entry stale, including ones still
+    being computed while the library changed.
+    """
+
+    def __init__(self, max_entries: int, similarity: float, ttl: float):
+        self.max_entries = max_entries
+        self.similarity = similarity
+        self.ttl = ttl
+        self.version = 0
+        self._lock = threading.Lock()
+        self._embeddings: Optional[np.ndarray] = None
+        # (limit, papers, created, version) per row of _embeddings
+        self._entries: list[Optional[tuple]] = [None] * max_entries
+        self._next = 0
+
+    def bump_version(self):
+        """Invalidate all cached results after the library changed."""
+        with self._lock:
+            self.version += 1
+
+    def get(self, embedding: np.ndarray, limit: int) -> Optional[list[dict]]:
+        """Get cached results for a query similar to ``embedding``, if any."""
+        with self._lock:
+            if self._embeddings is None:
+                return None
+            scores = self._embeddings @ embedding
+            now = time.monotonic()
+            for i in np.argsort(-scores):
+                if scores[i] < self.similarity:
+                    break
+                entry = self._entries[i]
+                if entry is None:
+                    continue
+                entry_limit, papers, created, version = entry
+                if version == self.version and now - created < self.ttl and entry_limit >= limit:
+                    return papers[:limit]
+            return None
+
+    def set(self, embedding: np.ndarray, limit: int, papers: list[dict], version: int):
+        """Cache results computed against library ``version``."""
+        with self._lock:
+            if version != self.version:
+                return
+            if self._embeddings is None:
+                self._embeddings = np.zeros(
+                    (self.max_entries, embedding.shape[0]), dtype=np.float32
+                )
+            # Oldest entry is overwritten once the cache is full
+            self._embeddings[self._next] = embedding
+            self._entries[self._next] = (limit, papers, time.monotonic(), version)
+            self._next = (self._next + 1) % self.max_entries
+
+
+_search_cache = _SemanticSearchCache(
+    SEARCH_CACHE_MAX_ENTRIES, settings.search_cache_similarity, settings.search_cache_ttl
+)
 
 
 @mcp.tool()
@@ -100,11 +264,19 @@ def search_papers(query: str, limit: int = 10) -> list[dict]:
     Returns:
         List of papers with relevance scores, sorted by relevance
     """
+    embedding = embed_query(query)
+    cached = _search_cache.get(embedding, limit)
+    if cached is not None:
+        return cached
+
+    version = _search_cache.version
     vector_store = VectorStore()
 
     try:
         # Perform semantic search
-        results = vector_store.semantic_search(query=query, n_results=limit)
+        results = vector_store.semantic_search(
+            query=query, n_results=limit, query_embedding=embedding.tolist()
+        )
 
         papers = []
         for result in results:
@@ -127,21 +299,28 @@ def search_papers(query: str, limit: int = 10) -> list[dict]:
                 }
             )
 
+        _search_cache.set(embedding, limit, papers, version)
         return papers
 
     finally:
         vector_store.close()
 
 
-@mcp.tool()
-def get_recommendations(limit: int = 10) -> list[dict]:
-    """Get personalized paper recommendations based on your interests and reading history.
+# Library state recommendation scores depend on: new articles, read status
+# (only unread articles are recommended) and processing (topics)
+_RECOMMENDATION_INPUTS = select(
+    func.max(Article.id),
+    func.count(Article.id).filter(Article.is_read.is_(False)),
+    func.max(Article.processing_date),
+)
 
-    Args:
-        limit: Maximum number of recommendations (default: 10)
 
-    Returns:
-        List of recommended papers with match scores and reasons
+@lru_cache(maxsize=32)
+def _recommend_impl(profile_hash: str, library_version: tuple, limit: int) -> list[dict]:
+    """Score recommendations, memoized by profile and library version.
+
+    The arguments other than ``limit`` are only cache keys: a changed profile
+    or library gives a new key and so a fresh ranking.
     """
     engine = RecommendationEngine()
 
@@ -178,7 +357,33 @@ def get_recommendations(limit: int = 10) -> list[dict]:
 
 
 @mcp.tool()
-def get_article(article_id: int) -> dict:
+async def get_recommendations(limit: int = 10) -> list[dict]:
+    """Get personalized paper recommendations based on your interests and reading history.
+
+    Args:
+        limit: Maximum number of recommendations (default: 10)
+
+    Returns:
+        List of recommended papers with match scores and reasons
+    """
+    async with _tool_session() as session:
+        profile = await session.scalar(select(UserProfile).limit(1))
+        profile_fields = (
+            [profile.interests, profile.skill_level, profile.preferred_sources] if profile else []
+        )
+        library_state = tuple((await session.execute(_RECOMMENDATION_INPUTS)).one())
+
+    profile_hash = hashlib.blake2b(json.dumps(profile_fields).encode(), digest_size=8).hexdigest()
+    # The day is part of the version because recency scores and the 30-day
+    # window move with it; the in-process version covers ratings changed here
+    library_version = (*library_state, _search_cache.version, date.today())
+
+    # Scoring uses the sync recommendation engine, so it runs in a worker thread
+    return list(await asyncio.to_thread(_recommend_impl, profile_hash, library_version, limit))
+
+
+@mcp.tool()
+async def get_article(article_id: int) -> dict:
     """Get detailed information about a specific article.
 
     Args:
@@ -187,10 +392,8 @@ def get_article(article_id: int) -> dict:
     Returns:
         Complete article details including metadata and reading status
     """
-    session = get_session()
-
-    try:
-        article = session.query(Article).filter(Article.id == article_id).first()
+    async with _tool_session() as session:
+        article = await session.get(Article, article_id)
 
         if not article:
             return {"error": f"Article {article_id} not found"}
@@ -212,92 +415,160 @@ def get_article(article_id: int) -> dict:
             "fetched_date": article.fetched_date.isoformat() if article.fetched_date else None,
         }
 
-    finally:
-        session.close()
+
+def _encode_cursor(fetched_date: datetime, article_id: int) -> str:
+    """Encode the sort key of the last listed article as an opaque cursor."""
+    raw = f"{fetched_date.isoformat()}|{article_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a list_articles cursor into a (fetched_date, id) tuple.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        fetched, article_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(fetched), int(article_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor") from None
 
 
 @mcp.tool()
-def list_articles(
+async def list_articles(
     page: int = 1,
     page_size: int = 10,
     unread_only: bool = False,
     source: Optional[str] = None,
     sort_by: Literal["recent", "rating", "citations"] = "recent",
+    cursor: Optional[str] = None,
 ) -> dict:
     """Browse articles in the library with filtering and pagination.
 
+    For "recent" ordering, pass the next_cursor of the previous response as
+    cursor to continue from where it ended; unlike page numbers this stays
+    fast however deep you page, but the total is not counted.
+
     Args:
-        page: Page number (1-indexed, default: 1)
+        page: Page number (1-indexed, default: 1), ignored when cursor is given
         page_size: Articles per page (default: 10)
         unread_only: Show only unread articles (default: False)
         source: Filter by source (e.g., "arxiv", "semanticscholar")
         sort_by: Sort order - "recent", "rating", or "citations" (default: "recent")
+        cursor: next_cursor from a previous "recent" page
 
     Returns:
-        Paginated list of articles with total count
+        Paginated list of articles with total count and next_cursor
     """
-    session = get_session()
-
-    try:
-        # Base query
-        query = session.query(Article)
+    if cursor and sort_by != "recent":
+        return {"error": "cursor is only supported when sorting by recent"}
+
+    # Only the listed columns are selected (no ORM objects); the abstract is
+    # truncated and the published date formatted in SQL
+    stmt = select(
+        Article.id,
+        Article.title,
+        Article.authors,
+        case(
+            (
+                func.length(Article.abstract) > ABSTRACT_PREVIEW_LENGTH,
+                func.concat(func.substr(Article.abstract, 1, ABSTRACT_PREVIEW_LENGTH), "..."),
+            ),
+            else_=Article.abstract,
+        ).label("abstract"),
+        Article.url,
+        Article.source,
+        func.regexp_replace(
+            func.to_char(Article.published_date, SQL_ISO_FORMAT), r"\.0{6}$", ""
+        ).label("published_date"),
+        Article.fetched_date,
+        Article.citation_count,
+        Article.is_read,
+        Article.rating,
+    )
 
-        # Apply filters
-        if unread_only:
-            query = query.filter(Article.is_read.is_(False))
+    # Apply filters
+    if unread_only:
+        stmt = stmt.where(Article.is_read.is_(False))
 
-        if source:
-            query = query.filter(Article.source == source)
+    if source:
+        stmt = stmt.where(Article.source == source)
 
-        # Count total before pagination
-        total = query.count()
+    # Apply sorting; each ordering matches an index (fetched_date is always
+    # set, so NULLS LAST only keeps the order aligned with the index)
+    if sort_by == "rating":
+        stmt = stmt.order_by(
+            Article.rating.desc().nullslast(), Article.fetched_date.desc().nullslast()
+        )
+    elif sort_by == "citations":
+        stmt = stmt.order_by(
+            Article.citation_count.desc().nullslast(), Article.fetched_date.desc().nullslast()
+        )
+    else:  # recent
+        stmt = stmt.order_by(Article.fetched_date.desc().nullslast(), Article.id.desc())
 
-        # Apply sorting
-        if sort_by == "rating":
-            query = query.order_by(Article.rating.desc().nullslast(), Article.fetched_date.desc())
-        elif sort_by == "citations":
-            query = query.order_by(
-                Article.citation_count.desc().nullslast(), Article.fetched_date.desc()
+    async with _tool_session() as session:
+        total = None
+        if cursor:
+            # Seek past the previous page instead of scanning and skipping it
+            try:
+                cursor_key = _decode_cursor(cursor)
+            except ValueError as e:
+                return {"error": str(e)}
+            stmt = stmt.where(tuple_(Article.fetched_date, Article.id) < tuple_(*cursor_key))
+        else:
+            total = await session.scalar(
+                select(func.count()).select_from(stmt.with_only_columns(Article.id).subquery())
             )
-        else:  # recent
-            query = query.order_by(Article.fetched_date.desc())
+            stmt = stmt.offset((page - 1) * page_size)
 
-        # Apply pagination
-        offset = (page - 1) * page_size
-        articles = query.offset(offset).limit(page_size).all()
-
-        return {
-            "articles": [
+        # Rows are streamed from a server-side cursor in chunks and formatted
+        # as they arrive, so large pages never hold every row at once. One
+        # extra row tells whether there is a next page.
+        result = await session.stream(
+            stmt.limit(page_size + 1).execution_options(yield_per=LIST_STREAM_CHUNK_SIZE)
+        )
+        articles = []
+        has_more = False
+        last = None
+        async for r in result:
+            if len(articles) == page_size:
+                has_more = True
+                break
+            articles.append(
                 {
-                    "id": a.id,
-                    "title": a.title,
-                    "authors": a.authors,
-                    "abstract": (
-                        a.abstract[:200] + "..."
-                        if a.abstract and len(a.abstract) > 200
-                        else a.abstract
-                    ),
-                    "url": a.url,
-                    "source": a.source,
-                    "published_date": a.published_date.isoformat() if a.published_date else None,
-                    "citation_count": a.citation_count,
-                    "is_read": a.is_read,
-                    "rating": a.rating,
+                    "id": r.id,
+                    "title": r.title,
+                    "authors": r.authors,
+                    "abstract": r.abstract,
+                    "url": r.url,
+                    "source": r.source,
+                    "published_date": r.published_date,
+                    "citation_count": r.citation_count,
+                    "is_read": r.is_read,
+                    "rating": r.rating,
                 }
-                for a in articles
-            ],
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": (total + page_size - 1) // page_size,
-        }
+            )
+            last = r
+        await result.close()
 
-    finally:
-        session.close()
+    next_cursor = None
+    if has_more and sort_by == "recent":
+        next_cursor = _encode_cursor(last.fetched_date, last.id)
+
+    return {
+        "articles": articles,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": (total + page_size - 1) // page_size if total is not None else None,
+        "next_cursor": next_cursor,
+    }
 
 
 @mcp.tool()
-def rate_article(article_id: int, rating: int) -> dict:
+async def rate_article(article_id: int, rating: int) -> dict:
     """Rate a research paper from 1 to 5 stars.
 
     Args:
@@ -310,30 +581,31 @@ def rate_article(article_id: int, rating: int) -> dict:
     if not 1 <= rating <= 5:
         return {"error": "Rating must be between 1 and 5"}
 
-    session = get_session()
-
-    try:
-        article = session.query(Article).filter(Article.id == article_id).first()
-        if not article:
+    # A single UPDATE ... RETURNING instead of loading the article first
+    stmt = (
+        update(Article)
+        .where(Article.id == article_id)
+        .values(rating=rating, rated_date=datetime.utcnow())
+        .returning(Article.title)
+    )
+    async with _tool_session() as session:
+        row = (await session.execute(stmt)).first()
+        if row is None:
             return {"error": f"Article {article_id} not found"}
 
-        article.rating = rating
-        session.commit()
-
-        return {
-            "success": True,
-            "article_id": article_id,
-            "title": article.title,
-            "rating": rating,
-            "message": f"Rated '{article.title}' {rating} stars",
-        }
+    _search_cache.bump_version()
 
-    finally:
-        session.close()
+    return {
+        "success": True,
+        "article_id": article_id,
+        "title": row.title,
+        "rating": rating,
+        "message": f"Rated '{row.title}' {rating} stars",
+    }
 
 
 @mcp.tool()
-def mark_article_read(article_id: int, is_read: bool = True) -> dict:
+async def mark_article_read(article_id: int, is_read: bool = True) -> dict:
     """Mark a paper as read or unread.
 
     Args:
@@ -343,41 +615,39 @@ def mark_article_read(article_id: int, is_read: bool = True) -> dict:
     Returns:
         Success status and updated article info
     """
-    session = get_session()
-
-    try:
-        article = session.query(Article).filter(Article.id == article_id).first()
-        if not article:
+    stmt = (
+        update(Article)
+        .where(Article.id == article_id)
+        .values(is_read=is_read)
+        .returning(Article.title)
+    )
+    async with _tool_session() as session:
+        row = (await session.execute(stmt)).first()
+        if row is None:
             return {"error": f"Article {article_id} not found"}
 
-        article.is_read = is_read
-        session.commit()
+    _search_cache.bump_version()
 
-        status = "read" if is_read else "unread"
-        return {
-            "success": True,
-            "article_id": article_id,
-            "title": article.title,
-            "is_read": is_read,
-            "message": f"Marked '{article.title}' as {status}",
-        }
-
-    finally:
-        session.close()
+    status = "read" if is_read else "unread"
+    return {
+        "success": True,
+        "article_id": article_id,
+        "title": row.title,
+        "is_read": is_read,
+        "message": f"Marked '{row.title}' as {status}",
+    }
 
 
 @mcp.tool()
-def get_profile() -> dict:
+async def get_profile() -> dict:
     """View user profile, interests, and reading statistics.
 
     Returns:
         Profile information and comprehensive reading statistics
     """
-    session = get_session()
-
-    try:
+    async with _tool_session() as session:
         # Get or create profile
-        profile = session.query(UserProfile).first()
+        profile = await session.scalar(select(UserProfile).limit(1))
         if not profile:
             profile = UserProfile(
                 interests="",  # Stored as comma-separated string
@@ -386,19 +656,15 @@ def get_profile() -> dict:
                 daily_reading_goal=5,
             )
 
-        # Calculate statistics
-        all_articles = session.query(Article).all()
-        total_articles = len(all_articles)
-        read_articles = len([a for a in all_articles if a.is_read])
-        rated_articles = len([a for a in all_articles if a.rating is not None])
-
-        ratings = [a.rating for a in all_articles if a.rating is not None]
-        avg_rating = sum(ratings) / len(ratings) if ratings else None
+        # Library totals are summed from the per-source counts
+        rows = (await session.execute(_LIBRARY_STATS)).all()
+        total_articles = sum(r.total for r in rows)
+        read_articles = sum(r.read for r in rows)
+        rated_articles = sum(r.rated for r in rows)
+        avg_rating = sum(r.rating_sum for r in rows) / rated_articles if rated_articles else None
 
         # Articles by source
-        sources = {}
-        for article in all_articles:
-            sources[article.source] = sources.get(article.source, 0) + 1
+        sources = {r.source: r.total for r in rows}
 
         # Parse comma-separated strings to lists
         interests = [i.strip() for i in profile.interests.split(",")] if profile.interests else []
@@ -425,12 +691,9 @@ def get_profile() -> dict:
             },
         }
 
-    finally:
-        session.close()
-
 
 @mcp.tool()
-def update_interests(interests: list[str]) -> dict:
+async def update_interests(interests: list[str]) -> dict:
     """Update your research interests to improve recommendations.
 
     Args:
@@ -439,14 +702,12 @@ def update_interests(interests: list[str]) -> dict:
     Returns:
         Success status with updated interests
     """
-    session = get_session()
-
-    try:
+    async with _tool_session() as session:
         # Convert list to comma-separated string for storage
         interests_str = ",".join(interests)
 
         # Get or create profile
-        profile = session.query(UserProfile).first()
+        profile = await session.scalar(select(UserProfile).limit(1))
         if not profile:
             profile = UserProfile(
                 interests=interests_str,
@@ -458,17 +719,12 @@ def update_interests(interests: list[str]) -> dict:
         else:
             profile.interests = interests_str
 
-        session.commit()
-
         return {
             "success": True,
             "interests": interests,
             "message": f"Updated interests to: {', '.join(interests)}",
         }
 
-    finally:
-        session.close()
-
 
 @mcp.tool()
 def fetch_articles(
@@ -504,6 +760,8 @@ def fetch_articles(
                 categories = ["cs.AI", "cs.LG", "cs.CV", "cs.CL"]
 
             new_count = fetch_arxiv(categories=categories)
+            if new_count:
+                _search_cache.bump_version()
 
             return {
                 "success": True,
@@ -534,6 +792,8 @@ def fetch_articles(
 
                 # Save to database
                 new_count = fetcher.save_to_db(papers)
+                if new_count:
+                    _search_cache.bump_version()
 
                 return {
                     "success": True,
@@ -644,12 +904,103 @@ def execute_research_plan(
             plan_id=plan_id,
             selected_indices=selected_indices,
         )
+        if result.get("papers_added"):
+            _search_cache.bump_version()
         return result
 
     finally:
         agent.close()
 
 
+# Tools callable from batch_execute
+_BATCHABLE_TOOLS = {
+    tool.__name__: tool
+    for tool in (
+        search_papers,
+        get_recommendations,
+        get_article,
+        list_articles,
+        rate_article,
+        mark_article_read,
+        get_profile,
+        update_interests,
+        fetch_articles,
+        plan_research,
+        execute_research_plan,
+    )
+}
+
+
+async def _run_batched_tool(op: dict, semaphore: asyncio.Semaphore) -> dict:
+    """Run one batch_execute operation.
+
+    Database tools are awaited directly; the blocking tools (fetchers, vector
+    store, LLM calls) run in a worker thread.
+    """
+    name = op.get("tool")
+    tool = _BATCHABLE_TOOLS.get(name)
+    if tool is None:
+        return {"tool": name, "error": f"Unknown tool: {name}"}
+
+    async with semaphore:
+        try:
+            if asyncio.iscoroutinefunction(tool):
+                result = await tool(**op.get("args", {}))
+            else:
+                result = await asyncio.to_thread(tool, **op.get("args", {}))
+        except Exception as e:
+            return {"tool": name, "error": str(e)}
+
+    if isinstance(result, dict) and "error" in result:
+        return {"tool": name, "error": result["error"]}
+    return {"tool": name, "result": result}
+
+
+@mcp.tool()
+async def batch_execute(
+    ops: list[dict], max_concurrent: int = 8, stop_on_error: bool = False
+) -> list[dict]:
+    """Run several Mind Scout tools in one call.
+
+    Saves a round trip per tool when an assistant already knows the calls it
+    wants to make, e.g. rating, marking read and re-reading the same article.
+
+    Args:
+        ops: Operations to run, each {"tool": "<tool name>", "args": {...}}
+        max_concurrent: Maximum operations running at once (default: 8)
+        stop_on_error: Run operations in order, sharing one database
+            transaction, and stop at the first error instead of running
+            them concurrently (default: False)
+
+    Returns:
+        One {"tool", "result"} or {"tool", "error"} entry per operation, in order
+
+    Example:
+        batch_execute(ops=[
+            {"tool": "rate_article", "args": {"article_id": 42, "rating": 5}},
+            {"tool": "mark_article_read", "args": {"article_id": 42}},
+        ])
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+    if not stop_on_error:
+        return list(await asyncio.gather(*(_run_batched_tool(op, semaphore) for op in ops)))
+
+    # Sequential ops share one session and commit together at the end
+    results = []
+    async with get_async_db_session() as session:
+        token = _batch_session.set(session)
+        try:
+            for op in ops:
+                result = await _run_batched_tool(op, semaphore)
+                results.append(result)
+                if "error" in result:
+                    break
+        finally:
+            _batch_session.reset(token)
+    return results
+
+
 if __name__ == "__main__":
     # Run the MCP server
     mcp.run()
@@ -7,15 +7,18 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from mindscout.config import DEFAULT_CATEGORIES
-from mindscout.database import Article, Notification, RSSFeed, UserProfile, get_session, init_db
-from mindscout.fetchers.arxiv import fetch_arxiv
-
 console = Console()
 
+# Read-state markers for article tables, built once rather than per row
+READ_CELL = "[green]✓[/green]"
+UNREAD_CELL = "[yellow]○[/yellow]"
+
 
 def cmd_fetch(args):
     """Fetch new articles from arXiv."""
+    from mindscout.config import DEFAULT_CATEGORIES
+    from mindscout.fetchers.arxiv import fetch_arxiv
+
     categories = args.categories if args.categories else DEFAULT_CATEGORIES
 
     console.print(
@@ -159,13 +162,24 @@ def _search_semanticscholar(args):
 
 def cmd_list(args):
     """List articles in the database."""
-    session = get_session()
-
-    try:
-        query = session.query(Article)
+    from sqlalchemy.orm import load_only
+
+    from mindscout.database import Article, get_session
+
+    with get_session() as session:
+        # Only load the columns shown in the table, not abstracts and summaries
+        query = session.query(Article).options(
+            load_only(
+                Article.id,
+                Article.title,
+                Article.source,
+                Article.published_date,
+                Article.is_read,
+            )
+        )
 
         if args.unread:
-            query = query.filter_by(is_read=False)
+            query = query.filter(Article.is_read.is_(False))
 
         if args.source:
             query = query.filter_by(source=args.source)
@@ -190,29 +204,24 @@ def cmd_list(args):
             date_str = (
                 article.published_date.strftime("%Y-%m-%d") if article.published_date else "N/A"
             )
-            read_status = "✓" if article.is_read else "○"
-            read_color = "green" if article.is_read else "yellow"
 
             table.add_row(
                 str(article.id),
                 article.title[:80],
                 article.source,
                 date_str,
-                f"[{read_color}]{read_status}[/{read_color}]",
+                READ_CELL if article.is_read else UNREAD_CELL,
             )
 
         console.print(table)
 
-    finally:
-        session.close()
-
 
 def cmd_show(args):
     """Show details of a specific article."""
-    session = get_session()
+    from mindscout.database import Article, get_session
 
-    try:
-        article = session.query(Article).filter_by(id=args.article_id).first()
+    with get_session() as session:
+        article = session.get(Article, args.article_id)
 
         if not article:
             console.print(f"[bold red]Article {args.article_id} not found[/bold red]")
@@ -274,61 +283,64 @@ def cmd_show(args):
         panel = Panel("\n".join(content), title=f"Article {article.id}", border_style="blue")
         console.print(panel)
 
-    finally:
-        session.close()
-
 
 def cmd_read(args):
     """Mark an article as read."""
-    session = get_session()
+    from mindscout.database import Article, get_session
 
-    try:
-        article = session.query(Article).filter_by(id=args.article_id).first()
+    with get_session() as session:
+        # A single UPDATE; the article itself is never loaded
+        updated = (
+            session.query(Article)
+            .filter_by(id=args.article_id)
+            .update({Article.is_read: True}, synchronize_session=False)
+        )
 
-        if not article:
+        if not updated:
             console.print(f"[bold red]Article {args.article_id} not found[/bold red]")
             return
 
-        article.is_read = True
         session.commit()
         console.print(f"[bold green]✓[/bold green] Marked article {args.article_id} as read")
 
-    finally:
-        session.close()
-
 
 def cmd_unread(args):
     """Mark an article as unread."""
-    session = get_session()
+    from mindscout.database import Article, get_session
 
-    try:
-        article = session.query(Article).filter_by(id=args.article_id).first()
+    with get_session() as session:
+        # A single UPDATE; the article itself is never loaded
+        updated = (
+            session.query(Article)
+            .filter_by(id=args.article_id)
+            .update({Article.is_read: False}, synchronize_session=False)
+        )
 
-        if not article:
+        if not updated:
             console.print(f"[bold red]Article {args.article_id} not found[/bold red]")
             return
 
-        article.is_read = False
         session.commit()
         console.print(f"[bold green]✓[/bold green] Marked article {args.article_id} as unread")
 
-    finally:
-        session.close()
-
 
 def cmd_stats(args):
     """Show statistics about your article collection."""
-    session = get_session()
-
-    try:
-        total = session.query(Article).count()
-        unread = session.query(Article).filter_by(is_read=False).count()
-        read = session.query(Article).filter_by(is_read=True).count()
-
-        # Count by source
-        sources = {}
-        for article in session.query(Article).all():
-            sources[article.source] = sources.get(article.source, 0) + 1
+    from mindscout.database import SourceStats, get_session
+
+    with get_session() as session:
+        # Per-source counts are kept current by triggers on articles, so this
+        # reads one row per source instead of scanning the articles table;
+        # the library totals are summed from those rows
+        sources = (
+            session.query(SourceStats.source, SourceStats.total, SourceStats.read)
+            .filter(SourceStats.total > 0)
+            .order_by(SourceStats.total.desc())
+            .all()
+        )
+        total = sum(row.total for row in sources)
+        read = sum(row.read for row in sources)
+        unread = total - read
 
         table = Table(title="Mind Scout Statistics", show_header=True, header_style="bold cyan")
         table.add_column("Metric", style="bold")
@@ -339,14 +351,11 @@ def cmd_stats(args):
         table.add_row("Read", f"[green]{read}[/green]")
         table.add_row("", "")
 
-        for source, count in sources.items():
-            table.add_row(f"{source.capitalize()} Articles", str(count))
+        for row in sources:
+            table.add_row(f"{row.source.capitalize()} Articles", str(row.total))
 
         console.print(table)
 
-    finally:
-        session.close()
-
 
 def cmd_process(args):
     """Process articles with LLM (summarization and topic extraction)."""
@@ -459,66 +468,66 @@ def cmd_processing_stats(args):
 
 def cmd_clear(args):
     """Clear all data from the database and vector store."""
+    from mindscout.database import Article, Notification, RSSFeed, UserProfile, get_session
     from mindscout.vectorstore import VectorStore
 
-    session = get_session()
-
-    try:
-        # Get counts before deletion
-        article_count = session.query(Article).count()
-        notification_count = session.query(Notification).count()
-        feed_count = session.query(RSSFeed).count()
-        profile_count = session.query(UserProfile).count()
-
-        total_count = article_count + notification_count + feed_count + profile_count
-
-        if total_count == 0:
-            console.print("[yellow]Database is already empty[/yellow]")
-        else:
-            # Confirm deletion unless --force flag is used
-            if not args.force:
-                console.print("[bold yellow]Warning:[/bold yellow] This will delete:")
-                console.print(f"  - {article_count} articles")
-                console.print(f"  - {notification_count} notifications")
-                console.print(f"  - {feed_count} RSS feeds")
-                console.print(f"  - {profile_count} user profile(s)")
-                response = input("Are you sure? Type 'yes' to confirm: ")
-                if response.lower() != "yes":
-                    console.print("[yellow]Operation cancelled[/yellow]")
-                    return
+    with get_session() as session:
+        try:
+            # Get counts before deletion
+            article_count = session.query(Article).count()
+            notification_count = session.query(Notification).count()
+            feed_count = session.query(RSSFeed).count()
+            profile_count = session.query(UserProfile).count()
 
-            # Delete from all tables (order matters for foreign keys)
-            session.query(Notification).delete()
-            session.query(Article).delete()
-            session.query(RSSFeed).delete()
-            session.query(UserProfile).delete()
-            session.commit()
+            total_count = article_count + notification_count + feed_count + profile_count
 
-            console.print(f"[bold green]✓[/bold green] Cleared database ({total_count} records)")
+            if total_count == 0:
+                console.print("[yellow]Database is already empty[/yellow]")
+            else:
+                # Confirm deletion unless --force flag is used
+                if not args.force:
+                    console.print("[bold yellow]Warning:[/bold yellow] This will delete:")
+                    console.print(f"  - {article_count} articles")
+                    console.print(f"  - {notification_count} notifications")
+                    console.print(f"  - {feed_count} RSS feeds")
+                    console.print(f"  - {profile_count} user profile(s)")
+                    response = input("Are you sure? Type 'yes' to confirm: ")
+                    if response.lower() != "yes":
+                        console.print("[yellow]Operation cancelled[/yellow]")
+                        return
+
+                # Delete from all tables (order matters for foreign keys)
+                session.query(Notification).delete()
+                session.query(Article).delete()
+                session.query(RSSFeed).delete()
+                session.query(UserProfile).delete()
+                session.commit()
 
-        # Clear ChromaDB vector store
-        try:
-            vs = VectorStore()
-            chroma_count = vs.collection.count()
-            if chroma_count > 0:
-                # Delete and recreate collection
-                vs.client.delete_collection("articles")
-                vs.collection = vs.client.create_collection(
-                    name="articles", metadata={"hnsw:space": "cosine"}
-                )
                 console.print(
-                    f"[bold green]✓[/bold green] Cleared vector store ({chroma_count} embeddings)"
+                    f"[bold green]✓[/bold green] Cleared database ({total_count} records)"
                 )
-            else:
-                console.print("[yellow]Vector store is already empty[/yellow]")
-        except Exception as e:
-            console.print(f"[yellow]Warning: Could not clear vector store: {e}[/yellow]")
 
-    except Exception as e:
-        session.rollback()
-        console.print(f"[bold red]Error:[/bold red] {e}")
-    finally:
-        session.close()
+            # Clear ChromaDB vector store
+            try:
+                vs = VectorStore()
+                chroma_count = vs.collection.count()
+                if chroma_count > 0:
+                    # Delete and recreate collection
+                    vs.client.delete_collection("articles")
+                    vs.collection = vs.client.create_collection(
+                        name="articles", metadata={"hnsw:space": "cosine"}
+                    )
+                    console.print(
+                        f"[bold green]✓[/bold green] Cleared vector store ({chroma_count} embeddings)"
+                    )
+                else:
+                    console.print("[yellow]Vector store is already empty[/yellow]")
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not clear vector store: {e}[/yellow]")
+
+        except Exception as e:
+            session.rollback()
+            console.print(f"[bold red]Error:[/bold red] {e}")
 
 
 def cmd_profile(args):
@@ -597,34 +606,33 @@ def cmd_profile(args):
 
 def cmd_rate(args):
     """Rate an article."""
-    session = get_session()
+    from mindscout.database import Article, get_session
 
-    try:
-        article = session.query(Article).filter_by(id=args.article_id).first()
+    with get_session() as session:
+        try:
+            article = session.get(Article, args.article_id)
 
-        if not article:
-            console.print(f"[bold red]Article {args.article_id} not found[/bold red]")
-            return
+            if not article:
+                console.print(f"[bold red]Article {args.article_id} not found[/bold red]")
+                return
 
-        if args.rating < 1 or args.rating > 5:
-            console.print("[bold red]Rating must be between 1 and 5[/bold red]")
-            return
+            if args.rating < 1 or args.rating > 5:
+                console.print("[bold red]Rating must be between 1 and 5[/bold red]")
+                return
 
-        article.rating = args.rating
-        article.rated_date = datetime.utcnow()
-        session.commit()
+            article.rating = args.rating
+            article.rated_date = datetime.utcnow()
+            session.commit()
 
-        stars = "★" * args.rating + "☆" * (5 - args.rating)
-        console.print(
-            f"[bold green]✓[/bold green] Rated article {args.article_id}: {stars} ({args.rating}/5)"
-        )
-        console.print(f"[dim]{article.title[:80]}[/dim]")
+            stars = "★" * args.rating + "☆" * (5 - args.rating)
+            console.print(
+                f"[bold green]✓[/bold green] Rated article {args.article_id}: {stars} ({args.rating}/5)"
+            )
+            console.print(f"[dim]{article.title[:80]}[/dim]")
 
-    except Exception as e:
-        session.rollback()
-        console.print(f"[bold red]Error:[/bold red] {e}")
-    finally:
-        session.close()
+        except Exception as e:
+            session.rollback()
+            console.print(f"[bold red]Error:[/bold red] {e}")
 
 
 def cmd_recommend(args):
@@ -720,71 +728,71 @@ def cmd_recommend(args):
 
 def cmd_insights(args):
     """Show reading insights and analytics."""
-    session = get_session()
+    from mindscout.database import Article, get_session
 
-    try:
-        from mindscout.profile import ProfileManager
+    with get_session() as session:
+        try:
+            from mindscout.profile import ProfileManager
 
-        manager = ProfileManager()
+            manager = ProfileManager()
 
-        # Get profile
-        profile = manager.get_or_create_profile()
+            # Get profile
+            profile = manager.get_or_create_profile()
 
-        # Calculate stats
-        total_articles = session.query(Article).count()
-        read_count = session.query(Article).filter_by(is_read=True).count()
-        rated_count = session.query(Article).filter(Article.rating.isnot(None)).count()
+            # Calculate stats
+            total_articles = session.query(Article).count()
+            read_count = session.query(Article).filter_by(is_read=True).count()
+            rated_count = session.query(Article).filter(Article.rating.isnot(None)).count()
 
-        # Get rating breakdown
-        from sqlalchemy import func
+            # Get rating breakdown
+            from sqlalchemy import func
 
-        rating_dist = (
-            session.query(Article.rating, func.count(Article.id))
-            .filter(Article.rating.isnot(None))
-            .group_by(Article.rating)
-            .all()
-        )
+            rating_dist = (
+                session.query(Article.rating, func.count(Article.id))
+                .filter(Article.rating.isnot(None))
+                .group_by(Article.rating)
+                .all()
+            )
 
-        # Get source breakdown for read articles
-        source_dist = (
-            session.query(Article.source, func.count(Article.id))
-            .filter(Article.is_read)
-            .group_by(Article.source)
-            .all()
-        )
+            # Get source breakdown for read articles
+            source_dist = (
+                session.query(Article.source, func.count(Article.id))
+                .filter(Article.is_read)
+                .group_by(Article.source)
+                .all()
+            )
 
-        # Display insights
-        table = Table(title="Your Reading Insights", show_header=True, header_style="bold cyan")
-        table.add_column("Metric", style="bold")
-        table.add_column("Value", justify="right")
+            # Display insights
+            table = Table(title="Your Reading Insights", show_header=True, header_style="bold cyan")
+            table.add_column("Metric", style="bold")
+            table.add_column("Value", justify="right")
 
-        table.add_row("Total Articles in Library", str(total_articles))
-        table.add_row("Articles Read", f"[green]{read_count}[/green]")
-        table.add_row("Articles Rated", str(rated_count))
+            table.add_row("Total Articles in Library", str(total_articles))
+            table.add_row("Articles Read", f"[green]{read_count}[/green]")
+            table.add_row("Articles Rated", str(rated_count))
 
-        if total_articles > 0:
-            read_pct = (read_count / total_articles) * 100
-            table.add_row("Read Percentage", f"{read_pct:.1f}%")
+            if total_articles > 0:
+                read_pct = (read_count / total_articles) * 100
+                table.add_row("Read Percentage", f"{read_pct:.1f}%")
 
-        table.add_row("", "")
-        table.add_row("Daily Reading Goal", str(profile.daily_reading_goal))
+            table.add_row("", "")
+            table.add_row("Daily Reading Goal", str(profile.daily_reading_goal))
 
-        console.print(table)
+            console.print(table)
 
-        if rating_dist:
-            console.print("\n[bold cyan]Rating Distribution:[/bold cyan]")
-            for rating, count in sorted(rating_dist):
-                stars = "★" * int(rating)
-                console.print(f"  {stars}: {count} articles")
+            if rating_dist:
+                console.print("\n[bold cyan]Rating Distribution:[/bold cyan]")
+                for rating, count in sorted(rating_dist):
+                    stars = "★" * int(rating)
+                    console.print(f"  {stars}: {count} articles")
 
-        if source_dist:
-            console.print("\n[bold cyan]Read Articles by Source:[/bold cyan]")
-            for source, count in source_dist:
-                console.print(f"  {source}: {count} articles")
+            if source_dist:
+                console.print("\n[bold cyan]Read Articles by Source:[/bold cyan]")
+                for source, count in source_dist:
+                    console.print(f"  {source}: {count} articles")
 
-    finally:
-        session.close()
-        manager.close()
+        finally:
+            manager.close()
 
 
 def cmd_index(args):
@@ -814,64 +822,63 @@ def cmd_index(args):
 
 def cmd_similar(args):
     """Find articles similar to a given article."""
+    from mindscout.database import Article, get_session
     from mindscout.vectorstore import VectorStore
 
     vector_store = VectorStore()
-    session = get_session()
-
-    try:
-        # Get the reference article
-        article = session.query(Article).filter_by(id=args.article_id).first()
-
-        if not article:
-            console.print(f"[bold red]Article {args.article_id} not found[/bold red]")
-            return
-
-        console.print("[bold cyan]Finding articles similar to:[/bold cyan]")
-        console.print(f"[dim]{article.title}[/dim]\n")
-
-        # Find similar articles
-        similar = vector_store.find_similar(
-            args.article_id, n_results=args.limit, min_similarity=args.min_similarity
-        )
+    with get_session() as session:
+        try:
+            # Get the reference article
+            article = session.get(Article, args.article_id)
 
-        if not similar:
-            console.print("[yellow]No similar articles found. Try:[/yellow]")
-            console.print("  1. Lowering --min-similarity threshold")
-            console.print("  2. Indexing more articles: mindscout index")
-            return
+            if not article:
+                console.print(f"[bold red]Article {args.article_id} not found[/bold red]")
+                return
 
-        table = Table(
-            title=f"Similar Articles ({len(similar)} found)",
-            show_header=True,
-            header_style="bold cyan",
-        )
-        table.add_column("ID", style="dim", width=6)
-        table.add_column("Similarity", width=10, justify="right")
-        table.add_column("Title", style="bold", min_width=40)
-        table.add_column("Source", width=12)
+            console.print("[bold cyan]Finding articles similar to:[/bold cyan]")
+            console.print(f"[dim]{article.title}[/dim]\n")
 
-        for sim in similar:
-            sim_article = sim["article"]
-            similarity_str = f"{sim['similarity']:.0%}"
+            # Find similar articles
+            similar = vector_store.find_similar(
+                args.article_id, n_results=args.limit, min_similarity=args.min_similarity
+            )
 
-            # Color code similarity
-            if sim["similarity"] >= 0.7:
-                similarity_str = f"[bold green]{similarity_str}[/bold green]"
-            elif sim["similarity"] >= 0.5:
-                similarity_str = f"[yellow]{similarity_str}[/yellow]"
-            else:
-                similarity_str = f"[dim]{similarity_str}[/dim]"
+            if not similar:
+                console.print("[yellow]No similar articles found. Try:[/yellow]")
+                console.print("  1. Lowering --min-similarity threshold")
+                console.print("  2. Indexing more articles: mindscout index")
+                return
 
-            table.add_row(
-                str(sim_article.id), similarity_str, sim_article.title[:60], sim_article.source
+            table = Table(
+                title=f"Similar Articles ({len(similar)} found)",
+                show_header=True,
+                header_style="bold cyan",
             )
+            table.add_column("ID", style="dim", width=6)
+            table.add_column("Similarity", width=10, justify="right")
+            table.add_column("Title", style="bold", min_width=40)
+            table.add_column("Source", width=12)
+
+            for sim in similar:
+                sim_article = sim["article"]
+                similarity_str = f"{sim['similarity']:.0%}"
+
+                # Color code similarity
+                if sim["similarity"] >= 0.7:
+                    similarity_str = f"[bold green]{similarity_str}[/bold green]"
+                elif sim["similarity"] >= 0.5:
+                    similarity_str = f"[yellow]{similarity_str}[/yellow]"
+                else:
+                    similarity_str = f"[dim]{similarity_str}[/dim]"
 
-        console.print(table)
+                table.add_row(
+                    str(sim_article.id), similarity_str, sim_article.title[:60], sim_article.source
+                )
 
-    finally:
-        vector_store.close()
-        session.close()
+            console.print(table)
+
+        finally:
+            vector_store.close()
 
 
 def cmd_semantic_search(args):
@@ -923,161 +930,164 @@ def cmd_semantic_search(args):
 def cmd_subscribe(args):
     """Manage RSS feed subscriptions."""
     from mindscout.config import CURATED_FEEDS
-    from mindscout.database import RSSFeed
-
-    session = get_session()
+    from mindscout.database import RSSFeed, get_session
 
-    try:
-        if args.sub_command == "list":
-            feeds = session.query(RSSFeed).order_by(RSSFeed.created_date.desc()).all()
+    with get_session() as session:
+        try:
+            if args.sub_command == "list":
+                feeds = session.query(RSSFeed).order_by(RSSFeed.created_date.desc()).all()
 
-            if not feeds:
-                console.print("[yellow]No subscriptions yet.[/yellow]")
-                console.print("Add one with: mindscout subscribe add <url>")
-                console.print("Or browse suggestions: mindscout subscribe curated")
-                return
+                if not feeds:
+                    console.print("[yellow]No subscriptions yet.[/yellow]")
+                    console.print("Add one with: mindscout subscribe add <url>")
+                    console.print("Or browse suggestions: mindscout subscribe curated")
+                    return
 
-            table = Table(
-                title=f"Your Subscriptions ({len(feeds)} feeds)",
-                show_header=True,
-                header_style="bold cyan",
-            )
-            table.add_column("ID", style="dim", width=4)
-            table.add_column("Title", style="bold", min_width=25)
-            table.add_column("Category", width=12)
-            table.add_column("Last Checked", width=18)
-            table.add_column("Active", width=6, justify="center")
-
-            for feed in feeds:
-                last_checked = (
-                    feed.last_checked.strftime("%Y-%m-%d %H:%M") if feed.last_checked else "Never"
-                )
-                active = "[green]Yes[/green]" if feed.is_active else "[red]No[/red]"
-                table.add_row(
-                    str(feed.id),
-                    (feed.title or "Untitled")[:30],
-                    feed.category or "-",
-                    last_checked,
-                    active,
+                table = Table(
+                    title=f"Your Subscriptions ({len(feeds)} feeds)",
+                    show_header=True,
+                    header_style="bold cyan",
                 )
+                table.add_column("ID", style="dim", width=4)
+                table.add_column("Title", style="bold", min_width=25)
+                table.add_column("Category", width=12)
+                table.add_column("Last Checked", width=18)
+                table.add_column("Active", width=6, justify="center")
 
-            console.print(table)
+                for feed in feeds:
+                    last_checked = (
+                        feed.last_checked.strftime("%Y-%m-%d %H:%M")
+                        if feed.last_checked
+                        else "Never"
+                    )
+                    active = "[green]Yes[/green]" if feed.is_active else "[red]No[/red]"
+                    table.add_row(
+                        str(feed.id),
+                        (feed.title or "Untitled")[:30],
+                        feed.category or "-",
+                        last_checked,
+                        active,
+                    )
 
-        elif args.sub_command == "add":
-            import feedparser
+                console.print(table)
 
-            # Check if already subscribed
-            existing = session.query(RSSFeed).filter(RSSFeed.url == args.url).first()
-            if existing:
-                console.print(
-                    f"[yellow]Already subscribed to this feed:[/yellow] {existing.title or args.url}"
-                )
-                return
+            elif args.sub_command == "add":
+                import feedparser
 
-            console.print("[bold blue]Validating feed...[/bold blue]")
+                # Check if already subscribed
+                existing = session.query(RSSFeed).filter(RSSFeed.url == args.url).first()
+                if existing:
+                    console.print(
+                        f"[yellow]Already subscribed to this feed:[/yellow] {existing.title or args.url}"
+                    )
+                    return
 
-            # Validate feed
-            feed = feedparser.parse(args.url)
-            if feed.bozo and not feed.entries:
-                console.print("[bold red]Error:[/bold red] Invalid RSS feed or feed is empty")
-                return
+                console.print("[bold blue]Validating feed...[/bold blue]")
 
-            # Get title from feed if not provided
-            title = args.title
-            if not title and feed.feed.get("title"):
-                title = feed.feed.title
+                # Validate feed
+                feed = feedparser.parse(args.url)
+                if feed.bozo and not feed.entries:
+                    console.print("[bold red]Error:[/bold red] Invalid RSS feed or feed is empty")
+                    return
 
-            # Create subscription
-            subscription = RSSFeed(
-                url=args.url, title=title, category=args.category, is_active=True
-            )
-            session.add(subscription)
-            session.commit()
+                # Get title from feed if not provided
+                title = args.title
+                if not title and feed.feed.get("title"):
+                    title = feed.feed.title
 
-            console.print(f"[bold green]✓[/bold green] Subscribed to: {title or args.url}")
+                # Create subscription
+                subscription = RSSFeed(
+                    url=args.url, title=title, category=args.category, is_active=True
+                )
+                session.add(subscription)
+                session.commit()
 
-        elif args.sub_command == "remove":
-            feed = session.query(RSSFeed).filter(RSSFeed.id == args.feed_id).first()
-            if not feed:
-                console.print(f"[bold red]Subscription {args.feed_id} not found[/bold red]")
-                return
+                console.print(f"[bold green]✓[/bold green] Subscribed to: {title or args.url}")
 
-            title = feed.title or feed.url
-            session.delete(feed)
-            session.commit()
+            elif args.sub_command == "remove":
+                feed = session.query(RSSFeed).filter(RSSFeed.id == args.feed_id).first()
+                if not feed:
+                    console.print(f"[bold red]Subscription {args.feed_id} not found[/bold red]")
+                    return
 
-            console.print(f"[bold green]✓[/bold green] Unsubscribed from: {title}")
+                title = feed.title or feed.url
+                session.delete(feed)
+                session.commit()
 
-        elif args.sub_command == "curated":
-            console.print("[bold cyan]Suggested RSS Feeds[/bold cyan]\n")
+                console.print(f"[bold green]✓[/bold green] Unsubscribed from: {title}")
 
-            # Group by category
-            by_category = {}
-            for feed in CURATED_FEEDS:
-                cat = feed["category"]
-                if cat not in by_category:
-                    by_category[cat] = []
-                by_category[cat].append(feed)
+            elif args.sub_command == "curated":
+                console.print("[bold cyan]Suggested RSS Feeds[/bold cyan]\n")
 
-            # Show subscribed URLs for comparison
-            subscribed_urls = {f.url for f in session.query(RSSFeed).all()}
+                # Group by category
+                by_category = {}
+                for feed in CURATED_FEEDS:
+                    cat = feed["category"]
+                    if cat not in by_category:
+                        by_category[cat] = []
+                    by_category[cat].append(feed)
 
-            for category, feeds in sorted(by_category.items()):
-                console.print(f"\n[bold]{category.replace('_', ' ').title()}[/bold]")
-                for feed in feeds:
-                    subscribed = "[green]✓[/green]" if feed["url"] in subscribed_urls else " "
-                    console.print(f"  {subscribed} {feed['title']}")
-                    console.print(f"      [dim]{feed['description']}[/dim]")
-                    console.print(f"      [dim]{feed['url']}[/dim]")
+                # Show subscribed URLs for comparison
+                subscribed_urls = {f.url for f in session.query(RSSFeed).all()}
 
-            console.print("\n[dim]Add a feed: mindscout subscribe add <url>[/dim]")
+                for category, feeds in sorted(by_category.items()):
+                    console.print(f"\n[bold]{category.replace('_', ' ').title()}[/bold]")
+                    for feed in feeds:
+                        subscribed = "[green]✓[/green]" if feed["url"] in subscribed_urls else " "
+                        console.print(f"  {subscribed} {feed['title']}")
+                        console.print(f"      [dim]{feed['description']}[/dim]")
+                        console.print(f"      [dim]{feed['url']}[/dim]")
 
-        elif args.sub_command == "refresh":
-            from mindscout.fetchers.rss import RSSFetcher
+                console.print("\n[dim]Add a feed: mindscout subscribe add <url>[/dim]")
 
-            fetcher = RSSFetcher()
+            elif args.sub_command == "refresh":
+                from mindscout.fetchers.rss import RSSFetcher
 
-            if args.feed_id:
-                # Refresh specific feed
-                feed = session.query(RSSFeed).filter(RSSFeed.id == args.feed_id).first()
-                if not feed:
-                    console.print(f"[bold red]Subscription {args.feed_id} not found[/bold red]")
-                    return
+                fetcher = RSSFetcher()
 
-                console.print(f"[bold blue]Refreshing:[/bold blue] {feed.title or feed.url}")
-                result = fetcher.fetch_feed(feed)
-                console.print(
-                    f"[bold green]✓[/bold green] Found {result['new_count']} new articles"
-                )
+                if args.feed_id:
+                    # Refresh specific feed
+                    feed = session.query(RSSFeed).filter(RSSFeed.id == args.feed_id).first()
+                    if not feed:
+                        console.print(f"[bold red]Subscription {args.feed_id} not found[/bold red]")
+                        return
 
-            else:
-                # Refresh all feeds
-                feeds = session.query(RSSFeed).filter(RSSFeed.is_active).all()
-                if not feeds:
-                    console.print("[yellow]No active subscriptions to refresh[/yellow]")
-                    return
+                    console.print(f"[bold blue]Refreshing:[/bold blue] {feed.title or feed.url}")
+                    result = fetcher.fetch_feed(feed)
+                    console.print(
+                        f"[bold green]✓[/bold green] Found {result['new_count']} new articles"
+                    )
 
-                console.print(f"[bold blue]Refreshing {len(feeds)} subscriptions...[/bold blue]")
+                else:
+                    # Refresh all feeds
+                    feeds = session.query(RSSFeed).filter(RSSFeed.is_active).all()
+                    if not feeds:
+                        console.print("[yellow]No active subscriptions to refresh[/yellow]")
+                        return
 
-                total_new = 0
-                for feed in feeds:
-                    try:
-                        result = fetcher.fetch_feed(feed)
-                        if result["new_count"] > 0:
-                            console.print(
-                                f"  [green]+{result['new_count']}[/green] {feed.title or feed.url}"
-                            )
-                        total_new += result["new_count"]
-                    except Exception as e:
-                        console.print(f"  [red]Error[/red] {feed.title or feed.url}: {e}")
-
-                console.print(f"\n[bold green]✓[/bold green] Found {total_new} new articles total")
+                    console.print(
+                        f"[bold blue]Refreshing {len(feeds)} subscriptions...[/bold blue]"
+                    )
 
-    except Exception as e:
-        session.rollback()
-        console.print(f"[bold red]Error:[/bold red] {e}")
-    finally:
-        session.close()
+                    total_new = 0
+                    for feed in feeds:
+                        try:
+                            result = fetcher.fetch_feed(feed)
+                            if result["new_count"] > 0:
+                                console.print(
+                                    f"  [green]+{result['new_count']}[/green] {feed.title or feed.url}"
+                                )
+                            total_new += result["new_count"]
+                        except Exception as e:
+                            console.print(f"  [red]Error[/red] {feed.title or feed.url}: {e}")
+
+                    console.print(
+                        f"\n[bold green]✓[/bold green] Found {total_new} new articles total"
+                    )
+
+        except Exception as e:
+            session.rollback()
+            console.print(f"[bold red]Error:[/bold red] {e}")
 
 
 def cmd_evaluate(args):
@@ -1181,105 +1191,105 @@ def cmd_evaluate(args):
 
 def cmd_notifications(args):
     """Manage notifications."""
-    from mindscout.database import Notification, RSSFeed
-
-    session = get_session()
+    from mindscout.database import Article, Notification, RSSFeed, get_session
 
-    try:
-        if args.notif_command == "list":
-            query = session.query(Notification).order_by(Notification.created_date.desc())
+    with get_session() as session:
+        try:
+            if args.notif_command == "list":
+                query = session.query(Notification).order_by(Notification.created_date.desc())
 
-            if args.unread:
-                query = query.filter(Notification.is_read.is_(False))
+                if args.unread:
+                    query = query.filter(Notification.is_read.is_(False))
 
-            notifications = query.limit(args.limit).all()
+                notifications = query.limit(args.limit).all()
 
-            if not notifications:
-                if args.unread:
-                    console.print("[green]No unread notifications![/green]")
-                else:
-                    console.print("[yellow]No notifications yet.[/yellow]")
-                return
+                if not notifications:
+                    if args.unread:
+                        console.print("[green]No unread notifications![/green]")
+                    else:
+                        console.print("[yellow]No notifications yet.[/yellow]")
+                    return
 
-            unread_count = (
-                session.query(Notification).filter(Notification.is_read.is_(False)).count()
-            )
-            console.print(f"[bold cyan]Notifications[/bold cyan] ({unread_count} unread)\n")
-
-            for notif in notifications:
-                article = session.query(Article).filter(Article.id == notif.article_id).first()
-                feed = (
-                    session.query(RSSFeed).filter(RSSFeed.id == notif.feed_id).first()
-                    if notif.feed_id
-                    else None
+                unread_count = (
+                    session.query(Notification).filter(Notification.is_read.is_(False)).count()
                 )
+                console.print(f"[bold cyan]Notifications[/bold cyan] ({unread_count} unread)\n")
 
-                status = "[dim]read[/dim]" if notif.is_read else "[bold yellow]NEW[/bold yellow]"
-                feed_name = feed.title if feed else "Unknown feed"
-                time_str = notif.created_date.strftime("%Y-%m-%d %H:%M")
+                for notif in notifications:
+                    article = session.get(Article, notif.article_id)
+                    feed = session.get(RSSFeed, notif.feed_id) if notif.feed_id else None
 
-                console.print(f"{status} [{time_str}] from {feed_name}")
-                console.print(
-                    f"  [bold]{article.title[:70]}[/bold]"
-                    if article
-                    else "  [dim]Article not found[/dim]"
-                )
-                console.print(f"  [dim]ID: {notif.id} | Article: {notif.article_id}[/dim]\n")
-
-        elif args.notif_command == "count":
-            unread = session.query(Notification).filter(Notification.is_read.is_(False)).count()
-            total = session.query(Notification).count()
-            console.print(f"Notifications: {unread} unread / {total} total")
-
-        elif args.notif_command == "read":
-            if args.all:
-                count = (
-                    session.query(Notification)
-                    .filter(Notification.is_read.is_(False))
-                    .update({Notification.is_read: True, Notification.read_date: datetime.utcnow()})
-                )
-                session.commit()
-                console.print(f"[bold green]✓[/bold green] Marked {count} notifications as read")
-            else:
-                notif = (
-                    session.query(Notification)
-                    .filter(Notification.id == args.notification_id)
-                    .first()
-                )
-                if not notif:
-                    console.print(
-                        f"[bold red]Notification {args.notification_id} not found[/bold red]"
+                    status = (
+                        "[dim]read[/dim]" if notif.is_read else "[bold yellow]NEW[/bold yellow]"
                     )
-                    return
+                    feed_name = feed.title if feed else "Unknown feed"
+                    time_str = notif.created_date.strftime("%Y-%m-%d %H:%M")
 
-                notif.is_read = True
-                notif.read_date = datetime.utcnow()
-                session.commit()
-                console.print(
-                    f"[bold green]✓[/bold green] Marked notification {args.notification_id} as read"
-                )
+                    console.print(f"{status} [{time_str}] from {feed_name}")
+                    console.print(
+                        f"  [bold]{article.title[:70]}[/bold]"
+                        if article
+                        else "  [dim]Article not found[/dim]"
+                    )
+                    console.print(f"  [dim]ID: {notif.id} | Article: {notif.article_id}[/dim]\n")
+
+            elif args.notif_command == "count":
+                unread = session.query(Notification).filter(Notification.is_read.is_(False)).count()
+                total = session.query(Notification).count()
+                console.print(f"Notifications: {unread} unread / {total} total")
+
+            elif args.notif_command == "read":
+                if args.all:
+                    count = (
+                        session.query(Notification)
+                        .filter(Notification.is_read.is_(False))
+                        .update(
+                            {Notification.is_read: True, Notification.read_date: datetime.utcnow()}
+                        )
+                    )
+                    session.commit()
+                    console.print(
+                        f"[bold green]✓[/bold green] Marked {count} notifications as read"
+                    )
+                else:
+                    notif = (
+                        session.query(Notification)
+                        .filter(Notification.id == args.notification_id)
+                        .first()
+                    )
+                    if not notif:
+                        console.print(
+                            f"[bold red]Notification {args.notification_id} not found[/bold red]"
+                        )
+                        return
+
+                    notif.is_read = True
+                    notif.read_date = datetime.utcnow()
+                    session.commit()
+                    console.print(
+                        f"[bold green]✓[/bold green] Marked notification {args.notification_id} as read"
+                    )
 
-        elif args.notif_command == "clear":
-            if args.all:
-                count = session.query(Notification).delete()
-            else:
-                count = session.query(Notification).filter(Notification.is_read).delete()
+            elif args.notif_command == "clear":
+                if args.all:
+                    count = session.query(Notification).delete()
+                else:
+                    count = session.query(Notification).filter(Notification.is_read).delete()
 
-            session.commit()
-            console.print(f"[bold green]✓[/bold green] Cleared {count} notifications")
+                session.commit()
+                console.print(f"[bold green]✓[/bold green] Cleared {count} notifications")
 
-    except Exception as e:
-        session.rollback()
-        console.print(f"[bold red]Error:[/bold red] {e}")
-    finally:
-        session.close()
+        except Exception as e:
+            session.rollback()
+            console.print(f"[bold red]Error:[/bold red] {e}")
 
 
 def main():
-    """Main entry point for Mind Scout CLI."""
-    # Initialize database
-    init_db()
+    """Main entry point for Mind Scout CLI.
 
+    Database and fetcher modules are imported by the commands that use them,
+    so --help, --version and argument errors return without loading them.
+    """
     # Create main parser
     parser = argparse.ArgumentParser(
         prog="mindscout", description="Mind Scout - Your AI research assistant"
@@ -1578,6 +1588,9 @@ def main():
 
     # Execute command
     if hasattr(args, "func"):
+        from mindscout.database import init_db
+
+        init_db()
         args.func(args)
     else:
         parser.print_help()
@@ -45,6 +45,17 @@ class Settings(BaseSettings):
     # PostgreSQL connection pool settings
     db_pool_size: int = Field(default=5, description="Database connection pool size")
     db_max_overflow: int = Field(default=10, description="Max connections beyond pool size")
+    db_pool_recycle: int = Field(
+        default=1800, description="Seconds before a pooled connection is replaced"
+    )
+    db_query_cache_size: int = Field(
+        default=1200, description="Compiled SQL statements cached per engine"
+    )
+    db_synchronous_commit: bool = Field(
+        default=True,
+        description="Wait for the WAL flush on commit; False speeds up small writes but a "
+        "server crash can lose the last few commits",
+    )
 
     # API Keys
     anthropic_api_key: Optional[str] = Field(
@@ -54,6 +65,10 @@ class Settings(BaseSettings):
     # API Settings
     api_host: str = Field(default="0.0.0.0", description="API server host")
     api_port: int = Field(default=8000, description="API server port")
+    api_workers: int = Field(
+        default=1,
+        description="Uvicorn worker processes; each runs its own scheduler and response cache",
+    )
     cors_origins: str = Field(
         default="http://localhost:5173,http://localhost:3000",
         description="Comma-separated list of allowed CORS origins",
@@ -64,6 +79,22 @@ class Settings(BaseSettings):
     rate_limit_process: int = Field(
         default=10, description="Maximum process requests per minute (LLM calls)"
     )
+    rate_limit_storage_uri: str = Field(
+        default="memory://",
+        description="Rate limit counter storage; use redis://host:port to share across workers",
+    )
+
+    # Response caching
+    cache_ttl: int = Field(default=300, description="Seconds to cache read-mostly API responses")
+    stats_cache_ttl: int = Field(default=30, description="Seconds to cache reading statistics")
+    search_cache_ttl: int = Field(
+        default=60, description="Seconds to cache semantic search and recommendation results"
+    )
+    search_cache_similarity: float = Field(
+        default=0.95,
+        description="Cosine similarity at which the MCP server reuses the results of an "
+        "earlier, paraphrased search query",
+    )
 
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
@@ -74,6 +105,10 @@ class Settings(BaseSettings):
     )
     scheduler_hour: int = Field(default=6, description="Hour to run daily job (0-23)")
     scheduler_minute: int = Field(default=0, description="Minute to run daily job (0-59)")
+    feed_parse_processes: int = Field(
+        default=0,
+        description="Worker processes for parsing downloaded feeds; 0 parses in the calling thread",
+    )
 
     # Phoenix Observability
     phoenix_enabled: bool = Field(
@@ -1,10 +1,26 @@
 """Database models and operations for Mind Scout."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
 from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text, create_engine
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    create_engine,
+    event,
+    func,
+    inspect,
+    orm,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, relationship, sessionmaker
 
@@ -74,6 +90,39 @@ class Article(Base):
     # Human-readable source name (e.g., "arXiv cs.AI", "Lex Fridman Podcast")
     source_name = Column(String)
 
+    __table_args__ = (
+        # Matches the default article list ordering for keyset pagination
+        Index(
+            "ix_articles_feed_sort",
+            fetched_date.desc().nullslast(),
+            published_date.desc().nullslast(),
+            id.desc(),
+        ),
+        # Grouping key of the sources listing
+        Index("ix_articles_source_coalesced", source, func.coalesce(source_name, source)),
+        # Newest articles for a single source
+        Index("ix_articles_source_fetched", source, fetched_date.desc().nullslast()),
+        # Unread feed; partial so read articles don't bloat the index
+        Index(
+            "ix_articles_unread",
+            fetched_date.desc().nullslast(),
+            postgresql_where=is_read.is_(False),
+        ),
+        # Articles still waiting for LLM processing; shrinks as they are processed
+        Index("ix_articles_unprocessed", id, postgresql_where=processed.is_(False)),
+        # Top-rated and most-cited orderings of the MCP article listing
+        Index(
+            "ix_articles_rating_sort",
+            rating.desc().nullslast(),
+            fetched_date.desc().nullslast(),
+        ),
+        Index(
+            "ix_articles_citations_sort",
+            citation_count.desc().nullslast(),
+            fetched_date.desc().nullslast(),
+        ),
+    )
+
     def __repr__(self):
         return f"<Article {self.source_id}: {self.title[:50]}>"
 
@@ -120,16 +169,127 @@ class RSSFeed(Base):
     last_etag = Column(String)
     # Last-Modified header value
     last_modified = Column(String)
+    # Failed fetches in a row, and when the feed may be tried again after them
+    consecutive_failures = Column(Integer, default=0, nullable=False, server_default="0")
+    next_retry_at = Column(DateTime)
     # Metadata
     created_date = Column(DateTime, default=datetime.utcnow)
 
     # Relationship to notifications
     notifications = relationship("Notification", back_populates="feed")
 
+    __table_args__ = (
+        # Matches the subscription list ordering
+        Index("ix_rss_feeds_created", created_date.desc(), id.desc()),
+    )
+
     def __repr__(self):
         return f"<RSSFeed {self.title or self.url}>"
 
 
+class SourceStats(Base):
+    """Per-source article counts, kept current by triggers on articles.
+
+    Lets library statistics be read in O(number of sources) instead of
+    aggregating the whole articles table. Rows are never deleted, so a source
+    whose articles are all gone has a total of 0.
+    """
+
+    __tablename__ = "source_stats"
+
+    source = Column(String, primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
+    read = Column(Integer, nullable=False, default=0)
+    rated = Column(Integer, nullable=False, default=0)
+    # Sum of ratings, so the average rating is rating_sum / rated
+    rating_sum = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<SourceStats {self.source}: {self.total}>"
+
+
+# Statement-level triggers see each statement's changed rows as transition
+# tables, so a bulk insert updates each source's row once rather than once
+# per article. Updates that don't touch source, is_read or rating are skipped.
+_SOURCE_STATS_FUNCTION = """
+CREATE OR REPLACE FUNCTION update_source_stats() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        IF NOT EXISTS (
+            SELECT 1 FROM old_rows AS o JOIN new_rows AS n ON n.id = o.id
+            WHERE (o.source, o.is_read, o.rating) IS DISTINCT FROM (n.source, n.is_read, n.rating)
+        ) THEN
+            RETURN NULL;
+        END IF;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE source_stats AS s
+        SET total = s.total - o.total,
+            read = s.read - o.read,
+            rated = s.rated - o.rated,
+            rating_sum = s.rating_sum - o.rating_sum
+        FROM (
+            SELECT source, count(*) AS total, count(*) FILTER (WHERE is_read) AS read,
+                   count(rating) AS rated, coalesce(sum(rating), 0) AS rating_sum
+            FROM old_rows
+            GROUP BY source
+        ) AS o
+        WHERE s.source = o.source;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO source_stats AS s (source, total, read, rated, rating_sum)
+        SELECT source, count(*), count(*) FILTER (WHERE is_read), count(rating),
+               coalesce(sum(rating), 0)
+        FROM new_rows
+        GROUP BY source
+        ON CONFLICT (source) DO UPDATE
+        SET total = s.total + EXCLUDED.total,
+            read = s.read + EXCLUDED.read,
+            rated = s.rated + EXCLUDED.rated,
+            rating_sum = s.rating_sum + EXCLUDED.rating_sum;
+    END IF;
+
+    RETURN NULL;
+END
+$$
+"""
+
+_SOURCE_STATS_TRIGGERS = {
+    "articles_source_stats_insert": "INSERT ON articles REFERENCING NEW TABLE AS new_rows",
+    "articles_source_stats_update": (
+        "UPDATE ON articles REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"
+    ),
+    "articles_source_stats_delete": "DELETE ON articles REFERENCING OLD TABLE AS old_rows",
+}
+
+# Counts for articles that existed before the triggers did
+_SOURCE_STATS_BACKFILL = """
+INSERT INTO source_stats (source, total, read, rated, rating_sum)
+SELECT source, count(*), count(*) FILTER (WHERE is_read), count(rating), coalesce(sum(rating), 0)
+FROM articles
+GROUP BY source
+ON CONFLICT (source) DO NOTHING
+"""
+
+# Installed after create_all so schemas created without Alembic (tests,
+# init_db) get the triggers too
+event.listen(Base.metadata, "after_create", DDL(_SOURCE_STATS_FUNCTION))
+for _name, _event in _SOURCE_STATS_TRIGGERS.items():
+    event.listen(Base.metadata, "after_create", DDL(f"DROP TRIGGER IF EXISTS {_name} ON articles"))
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(
+            f"CREATE TRIGGER {_name} AFTER {_event} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION update_source_stats()"
+        ),
+    )
+event.listen(Base.metadata, "after_create", DDL(_SOURCE_STATS_BACKFILL))
+
+
 class PendingBatch(Base):
     """Tracks pending async LLM batches for processing."""
 
@@ -176,6 +336,11 @@ class Notification(Base):
     article = relationship("Article")
     feed = relationship("RSSFeed", back_populates="notifications")
 
+    __table_args__ = (
+        # Matches the notification list ordering for keyset pagination
+        Index("ix_notifications_read_created", is_read, created_date.desc(), id.desc()),
+    )
+
     def __repr__(self):
         return f"<Notification article_id={self.article_id} read={self.is_read}>"
 
@@ -198,17 +363,38 @@ def _get_async_database_url(sync_url: str) -> str:
 
 
 def _get_engine_options() -> dict:
-    """Get PostgreSQL connection pool settings."""
+    """Get PostgreSQL connection pool and statement cache settings."""
     return {
         "pool_size": settings.db_pool_size,
         "max_overflow": settings.db_max_overflow,
         "pool_pre_ping": True,  # Verify connections before using
+        "pool_recycle": settings.db_pool_recycle,  # Avoid server/proxy idle timeouts
+        # Room for every filter/sort variant of the hot queries so they
+        # aren't recompiled after being evicted
+        "query_cache_size": settings.db_query_cache_size,
     }
 
 
+def _get_connect_args(is_async: bool = False) -> dict:
+    """Get driver connect arguments applying per-connection server settings.
+
+    Args:
+        is_async: Whether the arguments are for asyncpg rather than psycopg2
+
+    Returns:
+        Keyword arguments passed through to the DBAPI connect call
+    """
+    if settings.db_synchronous_commit:
+        return {}
+    if is_async:
+        return {"server_settings": {"synchronous_commit": "off"}}
+    return {"options": "-c synchronous_commit=off"}
+
+
 # Synchronous database engine and session (for existing code)
 engine = create_engine(
     settings.database_url,
+    connect_args=_get_connect_args(),
     **_get_engine_options(),
 )
 Session = sessionmaker(bind=engine)
@@ -231,6 +417,7 @@ def get_async_engine():
         _async_engine = create_async_engine(
             _async_db_url,
             echo=False,
+            connect_args=_get_connect_args(is_async=True),
             **_get_engine_options(),
         )
     return _async_engine
@@ -252,8 +439,15 @@ def get_async_session_local():
 
 
 def init_db():
-    """Initialize the database schema."""
-    Base.metadata.create_all(engine)
+    """Initialize the database schema.
+
+    create_all checks each table with its own query, so a single catalog
+    lookup is done first and create_all only runs when tables are missing.
+    This keeps startup to one round trip once the schema exists.
+    """
+    existing = set(inspect(engine).get_table_names())
+    if not existing.issuperset(Base.metadata.tables):
+        Base.metadata.create_all(engine)
 
 
 async def init_async_db():
@@ -262,6 +456,30 @@ async def init_async_db():
         await conn.run_sync(Base.metadata.create_all)
 
 
+def insert_articles(session, rows: list[dict]) -> int:
+    """Insert articles in a single statement, skipping ones that already exist.
+
+    Uses INSERT ... ON CONFLICT (source_id) DO NOTHING, so rows whose
+    source_id is already stored (or repeated within rows) are ignored.
+
+    Args:
+        session: Sync database session
+        rows: Article column dictionaries
+
+    Returns:
+        Number of articles actually inserted
+    """
+    if not rows:
+        return 0
+
+    stmt = (
+        pg_insert(Article)
+        .on_conflict_do_nothing(index_elements=[Article.source_id])
+        .returning(Article.id)
+    )
+    return len(session.execute(stmt, rows).all())
+
+
 def get_session():
     """Get a database session.
 
@@ -292,6 +510,22 @@ def get_db_session():
         session.close()
 
 
+def get_db() -> Generator[orm.Session, None, None]:
+    """FastAPI dependency for sync database sessions.
+
+    For endpoints that stay sync because they call blocking code (feed
+    parsing, fetchers). The session is committed on success, rolled back on
+    error, and closed after the response.
+
+    Usage in FastAPI:
+        @router.get("/subscriptions")
+        def list_subscriptions(db: orm.Session = Depends(get_db)):
+            return db.query(RSSFeed).all()
+    """
+    with get_db_session() as session:
+        yield session
+
+
 @asynccontextmanager
 async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Async context manager for database sessions.
@@ -1,11 +1,15 @@
 """arXiv RSS feed fetcher."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import feedparser
 
 from mindscout.config import ARXIV_FEEDS, DEFAULT_CATEGORIES
-from mindscout.database import Article, get_session
+from mindscout.database import get_session, insert_articles
+
+# Category feeds downloaded in parallel by fetch_arxiv
+MAX_CONCURRENT_CATEGORIES = 8
 
 
 def parse_arxiv_id(link: str) -> str:
@@ -77,26 +81,21 @@ def fetch_arxiv(categories: list[str] = None) -> int:
     if categories is None:
         categories = DEFAULT_CATEGORIES
 
+    if not categories:
+        return 0
+
+    # Category feeds are independent and network-bound, so download them at
+    # once; map keeps the results in category order
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_CATEGORIES, len(categories))) as pool:
+        fetched = list(pool.map(fetch_arxiv_category, categories))
+
     session = get_session()
     new_count = 0
 
     try:
-        for category in categories:
-            articles = fetch_arxiv_category(category)
-
-            for article_data in articles:
-                # Check if article already exists
-                existing = (
-                    session.query(Article).filter_by(source_id=article_data["source_id"]).first()
-                )
-
-                if existing:
-                    continue
-
-                # Create new article
-                article = Article(**article_data)
-                session.add(article)
-                new_count += 1
+        for articles in fetched:
+            # Existing articles (including ones seen in an earlier category) are skipped
+            new_count += insert_articles(session, articles)
 
         session.commit()
     except Exception as e:
@@ -1,6 +1,7 @@
 """Advanced arXiv API fetcher with search and filtering capabilities."""
 
 import logging
+import threading
 import time
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
@@ -8,7 +9,8 @@ from typing import Optional
 
 import requests
 
-from mindscout.database import Article, get_db_session
+from mindscout.database import get_db_session, insert_articles
+from mindscout.fetchers.base import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -29,10 +31,25 @@ class ArxivAdvancedFetcher:
     """Advanced arXiv fetcher using the arXiv API for complex queries."""
 
     BASE_URL = "http://export.arxiv.org/api/query"
+    # arXiv asks clients to leave about 3 seconds between requests
+    MIN_REQUEST_INTERVAL = 3.0
+
+    # Shared across instances so concurrent fetchers still respect the limit
+    _last_request_time = 0.0
+    _request_lock = threading.Lock()
 
     def __init__(self):
         """Initialize the advanced fetcher."""
-        self.session = requests.Session()
+        self.session = get_http_session()
+
+    def _wait_for_rate_limit(self):
+        """Sleep only as long as needed to keep MIN_REQUEST_INTERVAL between requests."""
+        cls = ArxivAdvancedFetcher
+        with cls._request_lock:
+            wait = cls._last_request_time + self.MIN_REQUEST_INTERVAL - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            cls._last_request_time = time.monotonic()
 
     def build_query(
         self,
@@ -130,16 +147,14 @@ class ArxivAdvancedFetcher:
 
         for retry in range(max_retries):
             try:
+                # Be nice to arXiv API - space requests out instead of
+                # sleeping after every successful response
+                self._wait_for_rate_limit()
                 response = self.session.get(self.BASE_URL, params=params, timeout=30)
                 response.raise_for_status()
 
                 # Parse XML response
-                articles = self._parse_feed(response.text)
-
-                # Be nice to arXiv API - rate limit
-                time.sleep(3)
-
-                return articles
+                return self._parse_feed(response.text)
 
             except requests.exceptions.HTTPError as e:
                 if e.response.status_code == 429:
@@ -289,22 +304,8 @@ class ArxivAdvancedFetcher:
             sort_order=sort_order,
         )
 
-        new_count = 0
-
         with get_db_session() as session:
-            for article_data in articles:
-                # Check if already exists
-                existing = (
-                    session.query(Article).filter_by(source_id=article_data["source_id"]).first()
-                )
-
-                if existing:
-                    continue
-
-                # Create new article
-                article = Article(**article_data)
-                session.add(article)
-                new_count += 1
+            new_count = insert_articles(session, articles)
 
         logger.info(f"Stored {new_count} new arXiv articles (fetched {len(articles)} total)")
         return new_count
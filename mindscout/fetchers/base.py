@@ -2,11 +2,42 @@
 
 import logging
 from abc import ABC, abstractmethod
+from functools import cache
+from typing import Optional
 
-from mindscout.database import Article, get_db_session
+import requests
+from requests.adapters import HTTPAdapter
+
+from mindscout.database import Article, get_db_session, insert_articles
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections kept per host by the shared HTTP sessions
+HTTP_POOL_SIZE = 10
+
+
+@cache
+def get_http_session(user_agent: Optional[str] = None) -> requests.Session:
+    """Get a process-wide HTTP session for the given User-Agent.
+
+    Fetchers are created per request or job run, so sharing the session lets
+    them reuse pooled keep-alive connections instead of opening a new TCP/TLS
+    connection to the same API every time.
+
+    Args:
+        user_agent: Optional User-Agent header sent with every request
+
+    Returns:
+        Shared requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if user_agent:
+        session.headers["User-Agent"] = user_agent
+    return session
+
 
 class BaseFetcher(ABC):
     """Abstract base class for content fetchers."""
@@ -37,26 +68,28 @@ class BaseFetcher(ABC):
         Returns:
             Number of new articles added
         """
-        new_count = 0
+        if not articles:
+            return 0
 
         with get_db_session() as session:
+            # Look up all already-stored articles in one query
+            source_ids = [a["source_id"] for a in articles]
+            existing = {
+                article.source_id: article
+                for article in session.query(Article).filter(Article.source_id.in_(source_ids))
+            }
+
+            new_articles = []
             for article_data in articles:
-                # Check if already exists
-                existing = (
-                    session.query(Article)
-                    .filter_by(source_id=article_data["source_id"], source=article_data["source"])
-                    .first()
-                )
-
-                if existing:
+                if article_data["source_id"] in existing:
                     # Update existing article with new metadata if available
-                    self._update_article(existing, article_data)
+                    self._update_article(existing[article_data["source_id"]], article_data)
                     continue
 
-                # Create new article
-                article = Article(**article_data)
-                session.add(article)
-                new_count += 1
+                new_articles.append(article_data)
+
+            # Insert all new articles in one statement
+            new_count = insert_articles(session, new_articles)
 
         logger.info(f"Stored {new_count} new articles from {self.source_name}")
         return new_count
@@ -2,25 +2,144 @@
 
 import hashlib
 import logging
-from datetime import datetime
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 import feedparser
 import requests
+from sqlalchemy import or_, select
 
-from mindscout.database import Article, RSSFeed, get_db_session
-from mindscout.fetchers.base import BaseFetcher
+from mindscout.config import get_settings
+from mindscout.database import RSSFeed, get_db_session, insert_articles
+from mindscout.fetchers.base import BaseFetcher, get_http_session
 
 logger = logging.getLogger(__name__)
 
+USER_AGENT = "MindScout/0.6 (RSS Reader)"
+
+# Seconds to wait for a feed server before giving up
+FEED_TIMEOUT = 10
+
+# Feeds fetched in parallel by refresh_all_feeds
+MAX_CONCURRENT_FEEDS = 8
+
+# Cap on the exponential backoff applied to feeds that keep failing
+MAX_RETRY_BACKOFF_MINUTES = 60
+
+
+@lru_cache(maxsize=1)
+def _get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """Get the shared feed-parsing process pool, or None if parsing stays in-thread.
+
+    Parsing feed XML is pure-Python CPU work that holds the GIL, so large
+    refreshes running in threads slow down the API's event loop. Workers are
+    spawned rather than forked because the API process is multi-threaded.
+    """
+    workers = get_settings().feed_parse_processes
+    if workers <= 0:
+        return None
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _parse_feed(content: bytes, headers: dict) -> feedparser.FeedParserDict:
+    """Parse downloaded feed bytes.
+
+    Args:
+        content: Raw feed body
+        headers: Response headers with lower-cased names, as feedparser expects
+
+    Returns:
+        Parsed feed
+    """
+    parsed = feedparser.parse(content, response_headers=headers)
+    # Parser exceptions don't reliably pickle back from a worker process
+    if parsed.get("bozo_exception") is not None:
+        parsed["bozo_exception"] = str(parsed["bozo_exception"])
+    return parsed
+
+
+def _not_modified(response: requests.Response) -> feedparser.FeedParserDict:
+    """Build the empty result returned for a feed that has not changed."""
+    return feedparser.FeedParserDict(
+        bozo=False,
+        entries=[],
+        feed=feedparser.FeedParserDict(),
+        headers=response.headers,
+        status=304,
+        etag=response.headers.get("ETag"),
+        modified=response.headers.get("Last-Modified"),
+    )
+
+
+def download_feed(
+    url: str, etag: Optional[str] = None, modified: Optional[str] = None
+) -> feedparser.FeedParserDict:
+    """Download and parse a feed over the shared keep-alive HTTP session.
+
+    Unlike feedparser.parse(url), this reuses pooled connections and
+    negotiates compressed transfer, which RSS/Atom XML shrinks well under.
+    As with feedparser, the result carries ``status`` and, when the server
+    sent them, ``etag`` and ``modified`` for the next conditional request.
+    Feeds known only by Last-Modified are probed with a HEAD first.
+
+    Args:
+        url: RSS/Atom feed URL
+        etag: ETag from the previous fetch, sent as If-None-Match
+        modified: Last-Modified from the previous fetch, sent as If-Modified-Since
+
+    Returns:
+        Parsed feed; empty with status 304 if the feed is unchanged
+
+    Raises:
+        requests.RequestException: If the feed could not be downloaded
+    """
+    http = get_http_session(USER_AGENT)
+
+    # Without an ETag, a HEAD is a cheap way to spot an unchanged feed on
+    # servers that send Last-Modified but ignore If-Modified-Since
+    if modified and not etag:
+        try:
+            probe = http.head(url, timeout=FEED_TIMEOUT, allow_redirects=True)
+        except requests.RequestException:
+            probe = None
+        if probe is not None and probe.ok and probe.headers.get("Last-Modified") == modified:
+            return _not_modified(probe)
+
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+
+    response = http.get(url, headers=headers, timeout=FEED_TIMEOUT)
+    if response.status_code == 304:
+        return _not_modified(response)
+
+    response.raise_for_status()
+    response_headers = {name.lower(): value for name, value in response.headers.items()}
+    pool = _get_parse_pool()
+    if pool is None:
+        parsed = _parse_feed(response.content, response_headers)
+    else:
+        parsed = pool.submit(_parse_feed, response.content, response_headers).result()
+
+    parsed["status"] = response.status_code
+    if response.headers.get("ETag"):
+        parsed["etag"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        parsed["modified"] = response.headers["Last-Modified"]
+    return parsed
+
 
 class RSSFetcher(BaseFetcher):
     """Generic RSS/Atom feed fetcher."""
 
     def __init__(self):
         super().__init__("rss")
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "MindScout/0.6 (RSS Reader)"})
+        self.session = get_http_session(USER_AGENT)
 
     def fetch(self, url: str, **kwargs) -> list[dict]:
         """Fetch articles from an RSS feed URL.
@@ -31,7 +150,7 @@ class RSSFetcher(BaseFetcher):
         Returns:
             List of article dictionaries
         """
-        feed = feedparser.parse(url)
+        feed = download_feed(url)
         articles = []
 
         for entry in feed.entries:
@@ -145,7 +264,7 @@ class RSSFetcher(BaseFetcher):
             Dictionary with counts: {"new_count": int}
         """
         with get_db_session() as session:
-            db_feed = session.query(RSSFeed).filter_by(id=feed.id).first()
+            db_feed = session.get(RSSFeed, feed.id)
             if not db_feed:
                 raise ValueError(f"Feed with id {feed.id} not found")
             return self._fetch_feed_impl(db_feed, session)
@@ -160,15 +279,33 @@ class RSSFetcher(BaseFetcher):
         Returns:
             Dictionary with counts: {"new_count": int}
         """
-        new_count = 0
-
         logger.info(f"Fetching RSS feed: {db_feed.title or db_feed.url}")
 
-        # Parse the feed
-        parsed = feedparser.parse(db_feed.url)
+        # Conditional GET: servers answer 304 with no body if the feed is unchanged
+        try:
+            parsed = download_feed(
+                db_feed.url, etag=db_feed.last_etag, modified=db_feed.last_modified
+            )
+        except requests.RequestException as e:
+            # Back off exponentially so refreshes stop waiting on a broken feed
+            db_feed.last_checked = datetime.utcnow()
+            db_feed.consecutive_failures = (db_feed.consecutive_failures or 0) + 1
+            backoff = min(MAX_RETRY_BACKOFF_MINUTES, 2**db_feed.consecutive_failures)
+            db_feed.next_retry_at = db_feed.last_checked + timedelta(minutes=backoff)
+            logger.warning(
+                f"Could not fetch feed {db_feed.title or db_feed.url} "
+                f"(failure {db_feed.consecutive_failures}, retry in {backoff} min): {e}"
+            )
+            return {"new_count": 0}
 
         # Update feed metadata
         db_feed.last_checked = datetime.utcnow()
+        db_feed.consecutive_failures = 0
+        db_feed.next_retry_at = None
+        if getattr(parsed, "status", None) == 304:
+            logger.info(f"Feed not modified: {db_feed.title or db_feed.url}")
+            return {"new_count": 0}
+
         if hasattr(parsed, "etag"):
             db_feed.last_etag = parsed.etag
         if hasattr(parsed, "modified"):
@@ -194,24 +331,8 @@ class RSSFetcher(BaseFetcher):
             logger.info(f"No new articles from {source_name}")
             return {"new_count": 0}
 
-        # Get existing source_ids in one query
-        source_ids = [a["source_id"] for a in articles_to_add]
-        existing_ids = {
-            row[0]
-            for row in session.query(Article.source_id)
-            .filter(Article.source_id.in_(source_ids))
-            .all()
-        }
-
-        # Only add articles that don't exist
-        for article_data in articles_to_add:
-            if article_data["source_id"] in existing_ids:
-                continue
-
-            article = Article(**article_data)
-            session.add(article)
-            existing_ids.add(article_data["source_id"])  # Prevent duplicates within same batch
-            new_count += 1
+        # Entries already stored (or repeated in this feed) are skipped by the insert
+        new_count = insert_articles(session, articles_to_add)
 
         logger.info(f"Fetched {new_count} new articles from {source_name}")
         return {
@@ -219,7 +340,7 @@ class RSSFetcher(BaseFetcher):
         }
 
     def refresh_all_feeds(self) -> dict:
-        """Refresh all active feed subscriptions.
+        """Refresh all active feed subscriptions that are not backing off.
 
         Returns:
             Dictionary with total counts
@@ -227,18 +348,30 @@ class RSSFetcher(BaseFetcher):
         total_new = 0
         feeds_checked = 0
 
-        # Get feed IDs first, then fetch each in its own session
+        # Get feed IDs first, then fetch each in its own session. Feeds backing
+        # off after failed fetches are left until their retry time.
+        now = datetime.utcnow()
         with get_db_session() as session:
-            feed_ids = [feed.id for feed in session.query(RSSFeed).filter(RSSFeed.is_active).all()]
-
-        for feed_id in feed_ids:
-            try:
-                result = self.fetch_feed_by_id(feed_id)
-                total_new += result["new_count"]
-                feeds_checked += 1
-            except Exception as e:
-                logger.error(f"Error fetching feed id={feed_id}: {e}")
-                continue
+            feed_ids = session.scalars(
+                select(RSSFeed.id).where(
+                    RSSFeed.is_active,
+                    or_(RSSFeed.next_retry_at.is_(None), RSSFeed.next_retry_at <= now),
+                )
+            ).all()
+
+        if not feed_ids:
+            return {"feeds_checked": 0, "new_count": 0}
+
+        # Feeds are independent and network-bound, so fetch several at once
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_FEEDS, len(feed_ids))) as pool:
+            futures = {pool.submit(self.fetch_feed_by_id, feed_id): feed_id for feed_id in feed_ids}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                    total_new += result["new_count"]
+                    feeds_checked += 1
+                except Exception as e:
+                    logger.error(f"Error fetching feed id={futures[future]}: {e}")
 
         logger.info(f"Refreshed {feeds_checked} feeds, found {total_new} new articles")
         return {
@@ -256,7 +389,7 @@ class RSSFetcher(BaseFetcher):
             Dictionary with counts: {"new_count": int}
         """
         with get_db_session() as session:
-            feed = session.query(RSSFeed).filter_by(id=feed_id).first()
+            feed = session.get(RSSFeed, feed_id)
             if not feed:
                 raise ValueError(f"Feed with id {feed_id} not found")
             return self._fetch_feed_impl(feed, session)
@@ -7,10 +7,15 @@ from typing import Optional
 
 import requests
 
-from mindscout.fetchers.base import BaseFetcher
+from mindscout.fetchers.base import BaseFetcher, get_http_session
 
 logger = logging.getLogger(__name__)
 
+USER_AGENT = "MindScout/0.2 (Research Assistant; mailto:user@example.com)"
+
+# Maximum IDs accepted by the /paper/batch endpoint per request
+PAPER_BATCH_SIZE = 500
+
 
 class SemanticScholarAPIError(Exception):
     """Exception raised for Semantic Scholar API errors."""
@@ -32,11 +37,8 @@ class SemanticScholarFetcher(BaseFetcher):
     def __init__(self):
         """Initialize Semantic Scholar fetcher."""
         super().__init__("semanticscholar")
-        self.session = requests.Session()
-        # Add headers for better rate limiting
-        self.session.headers.update(
-            {"User-Agent": "MindScout/0.2 (Research Assistant; mailto:user@example.com)"}
-        )
+        # User-Agent with contact info for better rate limiting
+        self.session = get_http_session(USER_AGENT)
 
     def fetch(
         self,
@@ -276,6 +278,45 @@ class SemanticScholarFetcher(BaseFetcher):
 
         return None
 
+    def get_papers_by_arxiv_ids(self, arxiv_ids: list[str]) -> dict[str, dict]:
+        """Get citation data for many arXiv papers using the batch endpoint.
+
+        Looks up up to PAPER_BATCH_SIZE papers per request instead of one
+        request per paper.
+
+        Args:
+            arxiv_ids: arXiv IDs (e.g., ["2301.12345", ...])
+
+        Returns:
+            Dictionary mapping arXiv ID to citation data, for papers that were found
+        """
+        results = {}
+
+        for start in range(0, len(arxiv_ids), PAPER_BATCH_SIZE):
+            chunk = arxiv_ids[start : start + PAPER_BATCH_SIZE]
+            try:
+                response = self.session.post(
+                    f"{self.BASE_URL}/paper/batch",
+                    params={"fields": "paperId,citationCount,influentialCitationCount"},
+                    json={"ids": [f"arXiv:{arxiv_id}" for arxiv_id in chunk]},
+                    timeout=30,
+                )
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Semantic Scholar batch lookup failed: {e}")
+                continue
+
+            # Results are returned in request order, with null for unknown IDs
+            for arxiv_id, paper in zip(chunk, response.json()):
+                if paper and "paperId" in paper:
+                    results[arxiv_id] = {
+                        "source_id": paper["paperId"],
+                        "citation_count": paper.get("citationCount", 0),
+                        "influential_citations": paper.get("influentialCitationCount", 0),
+                    }
+
+        return results
+
     def save_to_db(self, articles: list[dict]) -> int:
         """Save articles to database (alias for store_articles).
 
@@ -288,9 +329,11 @@ class SemanticScholarFetcher(BaseFetcher):
         return self.store_articles(articles)
 
     def close(self):
-        """Close the requests session."""
-        if hasattr(self, "session"):
-            self.session.close()
+        """Release fetcher resources.
+
+        The HTTP session is shared across fetchers and stays open so its
+        pooled connections can be reused.
+        """
 
 
 def enrich_arxiv_papers_with_citations(limit: int = 100) -> int:
@@ -316,20 +359,15 @@ def enrich_arxiv_papers_with_citations(limit: int = 100) -> int:
             .all()
         )
 
-        for paper in papers:
-            # Extract arXiv ID from source_id
-            arxiv_id = paper.source_id
-
-            # Get citation data
-            citation_data = fetcher.get_paper_by_arxiv_id(arxiv_id)
+        # arXiv IDs are stored as source_id
+        citations = fetcher.get_papers_by_arxiv_ids([paper.source_id for paper in papers])
 
+        for paper in papers:
+            citation_data = citations.get(paper.source_id)
             if citation_data:
                 paper.citation_count = citation_data["citation_count"]
                 paper.influential_citations = citation_data["influential_citations"]
                 updated += 1
 
-            # Rate limiting
-            time.sleep(1)
-
     logger.info(f"Enriched {updated} arXiv papers with citation data")
     return updated
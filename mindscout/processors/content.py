@@ -4,6 +4,8 @@ import json
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy.orm import load_only
+
 from mindscout.database import Article, Notification, UserProfile, get_session
 from mindscout.processors.llm import LLMClient
 
@@ -111,12 +113,13 @@ class ContentProcessor:
             query = session.query(Article)
 
             if only_unprocessed and not force:
-                query = query.filter(Article.processed == False)  # noqa: E712
+                query = query.filter(Article.processed.is_(False))
 
             if limit:
                 query = query.limit(limit)
 
             articles = query.all()
+            user_interests = self._get_user_interests(session)
 
             # Process in batches
             for i in range(0, len(articles), batch_size):
@@ -145,13 +148,13 @@ class ContentProcessor:
                         processed_count += 1
 
                         # Create interest-based notification
-                        self._create_interest_notification(article, session)
+                        self._create_interest_notification(article, session, user_interests)
                     else:
                         # Fall back to individual processing if batch failed
                         success = self.process_article(article, force=force)
                         if success:
                             processed_count += 1
-                            self._create_interest_notification(article, session)
+                            self._create_interest_notification(article, session, user_interests)
                         else:
                             failed_count += 1
 
@@ -192,18 +195,19 @@ class ContentProcessor:
             query = session.query(Article)
 
             if only_unprocessed and not force:
-                query = query.filter(Article.processed == False)  # noqa: E712
+                query = query.filter(Article.processed.is_(False))
 
             if limit:
                 query = query.limit(limit)
 
             articles = query.all()
+            user_interests = self._get_user_interests(session)
 
             for article in articles:
                 success = self.process_article(article, force=force)
                 if success:
                     processed_count += 1
-                    self._create_interest_notification(article, session)
+                    self._create_interest_notification(article, session, user_interests)
                 else:
                     if not (article.processed and not force):
                         failed_count += 1
@@ -236,7 +240,7 @@ class ContentProcessor:
             self._ensure_llm()
 
             # Get unprocessed articles
-            query = session.query(Article).filter(Article.processed == False)  # noqa: E712
+            query = session.query(Article).filter(Article.processed.is_(False))
 
             if limit:
                 query = query.limit(limit)
@@ -282,8 +286,16 @@ class ContentProcessor:
             # Get batch results
             results = self.llm.get_batch_results(batch_id)
 
+            # Load all referenced articles and the user's interests up front
+            article_ids = [int(article_id) for article_id in results]
+            articles = {
+                article.id: article
+                for article in session.query(Article).filter(Article.id.in_(article_ids))
+            }
+            user_interests = self._get_user_interests(session)
+
             for article_id, topics in results.items():
-                article = session.query(Article).filter_by(id=int(article_id)).first()
+                article = articles.get(int(article_id))
                 if not article:
                     failed_count += 1
                     continue
@@ -295,7 +307,7 @@ class ContentProcessor:
                     updated_count += 1
 
                     # Create notification if matches interests
-                    self._create_interest_notification(article, session)
+                    self._create_interest_notification(article, session, user_interests)
                 else:
                     failed_count += 1
 
@@ -322,11 +334,12 @@ class ContentProcessor:
             processed = session.query(Article).filter(Article.processed).count()  # noqa: E712
             unprocessed = total - processed
 
-            # Get topics distribution
+            # Get topics distribution, streaming just the topics column
             all_topics = []
-            for article in session.query(Article).filter(Article.topics.isnot(None)).all():
+            query = session.query(Article.topics).filter(Article.topics.isnot(None))
+            for (topics_json,) in query.yield_per(500):
                 try:
-                    topics = json.loads(article.topics)
+                    topics = json.loads(topics_json)
                     all_topics.extend(topics)
                 except json.JSONDecodeError:
                     pass
@@ -348,23 +361,37 @@ class ContentProcessor:
         finally:
             session.close()
 
-    def _create_interest_notification(self, article: Article, session) -> bool:
-        """Create notification if article topics match user interests.
+    @staticmethod
+    def _get_user_interests(session) -> set[str]:
+        """Load the user's interests as a set of lowercase strings.
 
         Args:
-            article: Article that was just processed
             session: Database session to use
 
         Returns:
-            True if notification was created, False otherwise
+            Set of interests (empty if no profile or interests are set)
         """
-        # Get user profile
         profile = session.query(UserProfile).first()
         if not profile or not profile.interests:
-            return False
+            return set()
+        return {i.strip().lower() for i in profile.interests.split(",") if i.strip()}
+
+    def _create_interest_notification(
+        self, article: Article, session, user_interests: Optional[set[str]] = None
+    ) -> bool:
+        """Create notification if article topics match user interests.
 
-        # Parse user interests
-        user_interests = {i.strip().lower() for i in profile.interests.split(",") if i.strip()}
+        Args:
+            article: Article that was just processed
+            session: Database session to use
+            user_interests: Pre-loaded interests from _get_user_interests, so
+                batch callers only read the profile once. Loaded if omitted.
+
+        Returns:
+            True if notification was created, False otherwise
+        """
+        if user_interests is None:
+            user_interests = self._get_user_interests(session)
         if not user_interests:
             return False
 
@@ -403,15 +430,30 @@ class ContentProcessor:
             limit: Maximum number of results
 
         Returns:
-            List of matching articles
+            List of matching articles, with only id, title and topics loaded
         """
         session = get_session()
 
         try:
             articles = []
-            query = session.query(Article).filter(Article.topics.isnot(None))
-
-            for article in query.all():
+            query = (
+                session.query(Article)
+                .options(load_only(Article.id, Article.title, Article.topics))
+                .filter(Article.topics.isnot(None))
+            )
+            # Topics are stored as JSON text, so an ASCII topic (escaped the
+            # way json.dumps writes it) can be matched against the raw text in
+            # SQL and only candidate rows come back. Non-ASCII characters are
+            # stored as \u escapes, which ILIKE cannot match case-insensitively,
+            # so those searches rely on the check below alone. A candidate can
+            # also match across two topics, so each one is checked properly.
+            if topic.isascii():
+                query = query.filter(
+                    Article.topics.icontains(json.dumps(topic)[1:-1], autoescape=True)
+                )
+
+            # Stream rows so we stop reading as soon as enough matches are found
+            for article in query.yield_per(100):
                 try:
                     topics = json.loads(article.topics)
                     # Case-insensitive partial match
@@ -1,37 +1,70 @@
 """Vector database integration for semantic search."""
 
 import os
+from functools import cache
 from typing import Optional
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
 
 from mindscout.config import DATA_DIR
 from mindscout.database import Article, get_session
 
+# Articles embedded per model call when indexing
+INDEX_BATCH_SIZE = 64
+
+
+@cache
+def _get_collection(chroma_path: str):
+    """Get the articles collection for a ChromaDB directory, opening it once per process."""
+    os.makedirs(chroma_path, exist_ok=True)
+
+    # Initialize ChromaDB client with persistent storage
+    client = chromadb.PersistentClient(
+        path=chroma_path, settings=Settings(anonymized_telemetry=False)
+    )
+
+    # Get or create collection
+    collection = client.get_or_create_collection(
+        name="articles", metadata={"hnsw:space": "cosine"}  # Use cosine similarity
+    )
+    return client, collection
+
+
+@cache
+def _get_embedding_model() -> SentenceTransformer:
+    """Load the embedding model (lightweight and good quality) once per process."""
+    return SentenceTransformer("all-MiniLM-L6-v2")
+
+
+def embed_query(text: str) -> np.ndarray:
+    """Embed a search query as an L2-normalized vector.
+
+    Normalized vectors make cosine similarity a plain dot product and give the
+    same ranking in the cosine-space collection as the raw embedding.
+
+    Args:
+        text: Query text
+
+    Returns:
+        Unit-length float32 embedding
+    """
+    return _get_embedding_model().encode(text, convert_to_numpy=True, normalize_embeddings=True)
+
 
 class VectorStore:
     """Manages vector embeddings and semantic search using ChromaDB."""
 
     def __init__(self):
-        """Initialize vector store with ChromaDB and embedding model."""
-        # Create chroma directory
-        chroma_path = os.path.join(DATA_DIR, "chroma")
-        os.makedirs(chroma_path, exist_ok=True)
-
-        # Initialize ChromaDB client with persistent storage
-        self.client = chromadb.PersistentClient(
-            path=chroma_path, settings=Settings(anonymized_telemetry=False)
-        )
+        """Initialize vector store with ChromaDB and embedding model.
 
-        # Get or create collection
-        self.collection = self.client.get_or_create_collection(
-            name="articles", metadata={"hnsw:space": "cosine"}  # Use cosine similarity
-        )
-
-        # Initialize embedding model (lightweight and good quality)
-        self.model = SentenceTransformer("all-MiniLM-L6-v2")
+        The Chroma client and embedding model are shared across instances, so
+        only the database session is created per store.
+        """
+        self.client, self.collection = _get_collection(os.path.join(DATA_DIR, "chroma"))
+        self.model = _get_embedding_model()
 
         self.session = get_session()
 
@@ -47,6 +80,45 @@ class VectorStore:
         embedding = self.model.encode(text, convert_to_numpy=True)
         return embedding.tolist()
 
+    def _load_articles(self, doc_ids: list[str]) -> dict[int, Article]:
+        """Load the articles behind a list of Chroma document ids in one query.
+
+        Args:
+            doc_ids: Chroma document ids (article ids as strings)
+
+        Returns:
+            Mapping of article id to article, for ids still in the database
+        """
+        if not doc_ids:
+            return {}
+        ids = [int(doc_id) for doc_id in doc_ids]
+        return {
+            article.id: article
+            for article in self.session.query(Article).filter(Article.id.in_(ids))
+        }
+
+    @staticmethod
+    def _article_document(article: Article) -> tuple[str, dict]:
+        """Build the indexed text and metadata for an article.
+
+        Args:
+            article: Article to describe
+
+        Returns:
+            Tuple of (document text, metadata)
+        """
+        # Create document text from title and abstract
+        text = f"{article.title}\n\n{article.abstract or ''}"
+        metadata = {
+            "article_id": article.id,
+            "source": article.source,
+            "title": article.title,
+        }
+        # Chroma rejects None metadata values, so a missing date is left out
+        if article.published_date:
+            metadata["published_date"] = article.published_date.isoformat()
+        return text, metadata
+
     def add_article(self, article: Article) -> bool:
         """Add an article to the vector store.
 
@@ -57,8 +129,7 @@ class VectorStore:
             True if added successfully
         """
         try:
-            # Create document text from title and abstract
-            text = f"{article.title}\n\n{article.abstract or ''}"
+            text, metadata = self._article_document(article)
 
             # Generate embedding
             embedding = self.embed_text(text)
@@ -68,16 +139,7 @@ class VectorStore:
                 ids=[str(article.id)],
                 embeddings=[embedding],
                 documents=[text],
-                metadatas=[
-                    {
-                        "article_id": article.id,
-                        "source": article.source,
-                        "title": article.title,
-                        "published_date": (
-                            article.published_date.isoformat() if article.published_date else None
-                        ),
-                    }
-                ],
+                metadatas=[metadata],
             )
             return True
 
@@ -85,6 +147,33 @@ class VectorStore:
             print(f"Error adding article {article.id} to vector store: {e}")
             return False
 
+    def _add_articles(self, articles: list[Article]) -> int:
+        """Embed and add several articles with one model call and one insert.
+
+        If the batch is rejected, the articles are retried one at a time so a
+        single bad article doesn't keep the rest out of the index.
+
+        Args:
+            articles: Articles to add
+
+        Returns:
+            Number of articles added
+        """
+        documents = [self._article_document(article) for article in articles]
+        try:
+            embeddings = self.model.encode([text for text, _ in documents], convert_to_numpy=True)
+            self.collection.add(
+                ids=[str(article.id) for article in articles],
+                embeddings=embeddings.tolist(),
+                documents=[text for text, _ in documents],
+                metadatas=[metadata for _, metadata in documents],
+            )
+            return len(articles)
+
+        except Exception as e:
+            print(f"Error adding batch to vector store, retrying one at a time: {e}")
+            return sum(self.add_article(article) for article in articles)
+
     def index_articles(self, limit: Optional[int] = None, force: bool = False) -> int:
         """Index articles in the vector store.
 
@@ -99,7 +188,8 @@ class VectorStore:
         existing_ids = set()
         if not force:
             try:
-                results = self.collection.get()
+                # Ids only; documents and embeddings aren't needed here
+                results = self.collection.get(include=[])
                 existing_ids = set(results["ids"])
             except Exception:
                 pass
@@ -117,11 +207,10 @@ class VectorStore:
 
         articles = query.all()
 
-        # Index articles
+        # Index articles, embedding them in batches
         indexed = 0
-        for article in articles:
-            if self.add_article(article):
-                indexed += 1
+        for start in range(0, len(articles), INDEX_BATCH_SIZE):
+            indexed += self._add_articles(articles[start : start + INDEX_BATCH_SIZE])
 
         return indexed
 
@@ -139,7 +228,7 @@ class VectorStore:
             List of similar articles with similarity scores
         """
         # Get the query article
-        article = self.session.query(Article).filter_by(id=article_id).first()
+        article = self.session.get(Article, article_id)
         if not article:
             return []
 
@@ -153,6 +242,9 @@ class VectorStore:
                 n_results=n_results + 1,  # +1 because it might include itself
             )
 
+            # Load every hit at once rather than one query per result
+            articles = self._load_articles(results["ids"][0])
+
             similar_articles = []
             for _i, (doc_id, distance) in enumerate(
                 zip(results["ids"][0], results["distances"][0])
@@ -168,8 +260,7 @@ class VectorStore:
                 if similarity < min_similarity:
                     continue
 
-                # Get full article from database
-                similar_article = self.session.query(Article).filter_by(id=int(doc_id)).first()
+                similar_article = articles.get(int(doc_id))
                 if similar_article:
                     similar_articles.append(
                         {
@@ -185,7 +276,11 @@ class VectorStore:
             return []
 
     def semantic_search(
-        self, query: str, n_results: int = 10, filters: Optional[dict] = None
+        self,
+        query: str,
+        n_results: int = 10,
+        filters: Optional[dict] = None,
+        query_embedding: Optional[list[float]] = None,
     ) -> list[dict]:
         """Perform semantic search for articles.
 
@@ -193,13 +288,15 @@ class VectorStore:
             query: Natural language search query
             n_results: Number of results to return
             filters: Optional metadata filters
+            query_embedding: Precomputed embedding of ``query``, to avoid embedding it twice
 
         Returns:
             List of articles with relevance scores
         """
         try:
             # Generate embedding for query
-            query_embedding = self.embed_text(query)
+            if query_embedding is None:
+                query_embedding = self.embed_text(query)
 
             # Search
             results = self.collection.query(
@@ -208,14 +305,16 @@ class VectorStore:
                 where=filters if filters else None,
             )
 
+            # Load every hit at once rather than one query per result
+            articles = self._load_articles(results["ids"][0])
+
             search_results = []
             for _i, (doc_id, distance) in enumerate(
                 zip(results["ids"][0], results["distances"][0])
             ):
                 similarity = 1 - distance
 
-                # Get full article from database
-                article = self.session.query(Article).filter_by(id=int(doc_id)).first()
+                article = articles.get(int(doc_id))
                 if article:
                     search_results.append(
                         {
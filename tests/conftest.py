@@ -76,6 +76,7 @@ def isolated_test_db(tmp_path, monkeypatch):
         conn.execute(text("DROP TABLE IF EXISTS rss_feeds CASCADE"))
         conn.execute(text("DROP TABLE IF EXISTS user_profile CASCADE"))
         conn.execute(text("DROP TABLE IF EXISTS articles CASCADE"))
+        conn.execute(text("DROP TABLE IF EXISTS source_stats CASCADE"))
         conn.commit()
 
     test_session_factory = sessionmaker(bind=test_engine)
@@ -122,9 +123,13 @@ def test_app(isolated_test_db):
     This fixture creates a fresh async engine for each test to avoid
     event loop conflicts with TestClient.
     """
+    from backend.api.cache import response_cache
     from backend.main import app
     from mindscout.database import get_async_db
 
+    # Cached responses would otherwise leak between isolated databases
+    response_cache.invalidate()
+
     sync_url, async_url = get_test_database_url()
 
     # Create a fresh async engine for this test
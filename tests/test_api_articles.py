@@ -90,19 +90,45 @@ class TestListSources:
             assert "source_name" in source
             assert "count" in source
 
+    def test_list_sources_groups_missing_source_name(self, client, sample_articles, db_session):
+        """Test that articles without a source_name are grouped under their source."""
+        db_session.add(
+            Article(
+                source_id="test-ss-4",
+                title="Test Article 4",
+                url="https://example.com/4",
+                source="semanticscholar",
+                source_name=None,
+            )
+        )
+        db_session.commit()
+
+        response = client.get("/api/articles/sources")
+        data = {s["source_name"]: s["count"] for s in response.json()}
+        assert data == {"arXiv cs.AI": 2, "semanticscholar": 2}
+
     def test_list_sources_empty(self, client, isolated_test_db):
         """Test listing sources when no articles exist."""
         response = client.get("/api/articles/sources")
         assert response.status_code == 200
         assert response.json() == []
 
+    def test_list_sources_not_modified(self, client, sample_articles):
+        """Test that a matching If-None-Match returns 304."""
+        response = client.get("/api/articles/sources")
+        etag = response.headers["etag"]
+
+        response = client.get("/api/articles/sources", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
 
 class TestListArticles:
     """Test GET /api/articles endpoint."""
 
     def test_list_articles_default(self, client, sample_articles):
         """Test listing articles with default parameters."""
-        response = client.get("/api/articles")
+        response = client.get("/api/articles?include_total=true")
         assert response.status_code == 200
 
         data = response.json()
@@ -111,9 +137,52 @@ class TestListArticles:
         assert data["page_size"] == 20
         assert len(data["articles"]) == 3
 
+    def test_list_articles_total_omitted_by_default(self, client, sample_articles):
+        """Test that total is only counted on request."""
+        response = client.get("/api/articles")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["total"] is None
+        assert len(data["articles"]) == 3
+
+    def test_list_articles_omits_summary_and_truncates_abstract(
+        self, client, sample_articles, db_session
+    ):
+        """Test that the list view returns a trimmed article payload."""
+        from backend.api.articles import ABSTRACT_PREVIEW_LENGTH
+
+        article = db_session.query(Article).filter_by(source_id="test-arxiv-1").first()
+        article.abstract = "x" * (ABSTRACT_PREVIEW_LENGTH + 100)
+        article.summary = "LLM summary"
+        db_session.commit()
+
+        response = client.get("/api/articles?source_name=arXiv cs.AI")
+        assert response.status_code == 200
+
+        listed = {a["title"]: a for a in response.json()["articles"]}["Test Article 1"]
+        assert "summary" not in listed
+        assert len(listed["abstract"]) == ABSTRACT_PREVIEW_LENGTH
+
+    def test_list_articles_serializes_dates(self, client, sample_articles):
+        """Test that dates are returned as ISO 8601 strings."""
+        response = client.get("/api/articles?source_name=semanticscholar")
+        assert response.headers["content-type"] == "application/json"
+
+        article = response.json()["articles"][0]
+        assert article["published_date"] == "2024-02-10T00:00:00"
+        assert article["fetched_date"] == "2024-02-15T00:00:00"
+
+    def test_list_articles_not_modified(self, client, sample_articles):
+        """Test that an unchanged page is revalidated with 304."""
+        etag = client.get("/api/articles").headers["etag"]
+
+        response = client.get("/api/articles", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
     def test_list_articles_pagination(self, client, sample_articles):
         """Test pagination."""
-        response = client.get("/api/articles?page=1&page_size=2")
+        response = client.get("/api/articles?page=1&page_size=2&include_total=true")
         assert response.status_code == 200
 
         data = response.json()
@@ -124,7 +193,7 @@ class TestListArticles:
 
     def test_list_articles_unread_only(self, client, sample_articles):
         """Test filtering unread articles."""
-        response = client.get("/api/articles?unread_only=true")
+        response = client.get("/api/articles?unread_only=true&include_total=true")
         assert response.status_code == 200
 
         data = response.json()
@@ -133,7 +202,7 @@ class TestListArticles:
 
     def test_list_articles_filter_by_source(self, client, sample_articles):
         """Test filtering by source."""
-        response = client.get("/api/articles?source=arxiv")
+        response = client.get("/api/articles?source=arxiv&include_total=true")
         assert response.status_code == 200
 
         data = response.json()
@@ -142,7 +211,7 @@ class TestListArticles:
 
     def test_list_articles_filter_by_source_name(self, client, sample_articles):
         """Test filtering by source_name."""
-        response = client.get("/api/articles?source_name=semanticscholar")
+        response = client.get("/api/articles?source_name=semanticscholar&include_total=true")
         assert response.status_code == 200
 
         data = response.json()
@@ -159,6 +228,49 @@ class TestListArticles:
         # First article should be the one with rating
         assert data["articles"][0]["rating"] == 5
 
+    def test_list_articles_cursor_pagination(self, client, sample_articles):
+        """Test following next_cursor walks the remaining articles."""
+        response = client.get("/api/articles?page_size=2")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert [a["title"] for a in data["articles"]] == ["Test Article 3", "Test Article 2"]
+        assert data["next_cursor"] is not None
+
+        response = client.get(f"/api/articles?page_size=2&cursor={data['next_cursor']}")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert [a["title"] for a in data["articles"]] == ["Test Article 1"]
+        assert data["next_cursor"] is None
+
+    def test_list_articles_cursor_ascending(self, client, sample_articles):
+        """Test cursor pagination in ascending order."""
+        first = client.get("/api/articles?page_size=1&sort_order=asc").json()
+        second = client.get(
+            f"/api/articles?page_size=1&sort_order=asc&cursor={first['next_cursor']}"
+        ).json()
+
+        assert first["articles"][0]["title"] == "Test Article 1"
+        assert second["articles"][0]["title"] == "Test Article 2"
+
+    def test_list_articles_rejects_deep_pages(self, client, sample_articles):
+        """Test that page numbers past the offset cap are rejected."""
+        response = client.get("/api/articles?page=1000&page_size=100")
+        assert response.status_code == 400
+        assert "cursor" in response.json()["detail"]
+
+    def test_list_articles_invalid_cursor(self, client, sample_articles):
+        """Test that a malformed cursor is rejected."""
+        response = client.get("/api/articles?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    def test_list_articles_cursor_with_rating_sort(self, client, sample_articles):
+        """Test that cursors are not supported with rating sort."""
+        first = client.get("/api/articles?page_size=1").json()
+        response = client.get(f"/api/articles?sort_by=rating&cursor={first['next_cursor']}")
+        assert response.status_code == 400
+
 
 class TestGetArticle:
     """Test GET /api/articles/{article_id} endpoint."""
@@ -180,6 +292,19 @@ class TestGetArticle:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
+    def test_get_article_etag_changes_after_update(self, client, sample_articles):
+        """Test that the ETag revalidates until the article changes."""
+        etag = client.get("/api/articles/1").headers["etag"]
+
+        response = client.get("/api/articles/1", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        client.post("/api/articles/1/read", json={"is_read": True})
+
+        response = client.get("/api/articles/1", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["is_read"] is True
+
 
 class TestMarkArticleRead:
     """Test POST /api/articles/{article_id}/read endpoint."""
@@ -233,14 +358,12 @@ class TestRateArticle:
     def test_rate_article_invalid_rating_too_low(self, client, sample_articles):
         """Test rating with value < 1."""
         response = client.post("/api/articles/1/rate", json={"rating": 0})
-        assert response.status_code == 400
-        assert "between 1 and 5" in response.json()["detail"]
+        assert response.status_code == 422
 
     def test_rate_article_invalid_rating_too_high(self, client, sample_articles):
         """Test rating with value > 5."""
         response = client.post("/api/articles/1/rate", json={"rating": 6})
-        assert response.status_code == 400
-        assert "between 1 and 5" in response.json()["detail"]
+        assert response.status_code == 422
 
     def test_rate_article_not_found(self, client, sample_articles):
         """Test rating non-existent article."""
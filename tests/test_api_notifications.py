@@ -143,6 +143,21 @@ class TestListNotifications:
         data = response.json()
         assert len(data) == 2
 
+    def test_list_notifications_keyset_pagination(self, client, sample_notifications):
+        """Test paging with the last seen created_date and id."""
+        first = client.get("/api/notifications?limit=2").json()
+        last = first[-1]
+
+        response = client.get(
+            "/api/notifications",
+            params={"limit": 2, "before": last["created_date"], "before_id": last["id"]},
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        assert [n["article"]["title"] for n in first] == ["Article 3", "Article 2"]
+        assert [n["article"]["title"] for n in data] == ["Article 1"]
+
 
 class TestNotificationCount:
     """Test GET /api/notifications/count endpoint."""
@@ -203,6 +218,18 @@ class TestMarkAllNotificationsRead:
         count_response = client.get("/api/notifications/count")
         assert count_response.json()["unread"] == 0
 
+    def test_mark_all_read_in_batches(self, client, sample_notifications, monkeypatch):
+        """Test that read-all keeps going until every batch is done."""
+        from backend.api import notifications
+
+        monkeypatch.setattr(notifications, "READ_ALL_BATCH_SIZE", 1)
+
+        response = client.post("/api/notifications/read-all")
+        assert response.status_code == 200
+
+        count_response = client.get("/api/notifications/count")
+        assert count_response.json()["unread"] == 0
+
 
 class TestDeleteNotification:
     """Test DELETE /api/notifications/{id} endpoint."""
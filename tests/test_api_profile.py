@@ -225,6 +225,25 @@ class TestGetProfileStats:
         assert data["articles_by_source"]["arxiv"] == 3
         assert data["articles_by_source"]["semanticscholar"] == 2
 
+    def test_get_stats_refreshed_after_rating(self, client, sample_articles_for_stats):
+        """Test that cached statistics are invalidated when an article is rated."""
+        assert client.get("/api/profile/stats").json()["rated_articles"] == 2
+
+        unread_id = sample_articles_for_stats["articles"][2].id
+        client.post(f"/api/articles/{unread_id}/rate", json={"rating": 3})
+
+        data = client.get("/api/profile/stats").json()
+        assert data["rated_articles"] == 3
+        assert data["read_articles"] == 4
+
+    def test_get_stats_not_modified(self, client, sample_articles_for_stats):
+        """Test that unchanged statistics are revalidated with 304."""
+        etag = client.get("/api/profile/stats").headers["etag"]
+
+        response = client.get("/api/profile/stats", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
     def test_get_stats_empty_db(self, client, clean_db):
         """Test getting statistics with no articles."""
         # Create empty profile
@@ -71,6 +71,30 @@ class TestListSubscriptions:
         assert data[0]["category"] == "news"
         assert data[0]["is_active"] is False
 
+    def test_list_subscriptions_paginated(self, client, sample_feeds):
+        """Test that limit and offset page through subscriptions in order."""
+        all_ids = [f["id"] for f in client.get("/api/subscriptions").json()]
+
+        first = client.get("/api/subscriptions", params={"limit": 2}).json()
+        rest = client.get("/api/subscriptions", params={"limit": 2, "offset": 2}).json()
+
+        assert [f["id"] for f in first + rest] == all_ids
+        assert len(first) == 2
+
+    def test_list_subscriptions_unpaginated_by_default(self, client, isolated_test_db):
+        """Test that every subscription is listed when no limit is given."""
+        session = get_session()
+        session.add_all(
+            RSSFeed(url=f"https://example.com/feed{i}.xml", title=f"Feed {i}") for i in range(120)
+        )
+        session.commit()
+        session.close()
+
+        response = client.get("/api/subscriptions")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 120
+
 
 class TestGetCuratedFeeds:
     """Test GET /api/subscriptions/curated endpoint."""
@@ -90,21 +114,26 @@ class TestGetCuratedFeeds:
         assert "category" in first_feed
         assert "description" in first_feed
 
+    def test_get_curated_feeds_not_modified(self, client, isolated_test_db):
+        """Test that a matching If-None-Match returns 304."""
+        etag = client.get("/api/subscriptions/curated").headers["ETag"]
+
+        response = client.get("/api/subscriptions/curated", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
 
 class TestCreateSubscription:
     """Test POST /api/subscriptions endpoint."""
 
     def test_create_subscription_success(self, client, isolated_test_db):
         """Test creating a new subscription with valid feed."""
-        # Mock feedparser to return valid feed
+        # Mock the feed download to return a valid feed
         mock_feed = MagicMock()
         mock_feed.bozo = False
         mock_feed.entries = [{"title": "Test Entry"}]
         mock_feed.feed.get.return_value = "Mocked Feed Title"
 
-        import feedparser
-
-        with patch.object(feedparser, "parse", return_value=mock_feed):
+        with patch("backend.api.subscriptions.download_feed", return_value=mock_feed):
             response = client.post(
                 "/api/subscriptions",
                 json={
@@ -129,9 +158,7 @@ class TestCreateSubscription:
         mock_feed.feed.get.return_value = "Auto Detected Title"
         mock_feed.feed.title = "Auto Detected Title"
 
-        import feedparser
-
-        with patch.object(feedparser, "parse", return_value=mock_feed):
+        with patch("backend.api.subscriptions.download_feed", return_value=mock_feed):
             response = client.post(
                 "/api/subscriptions", json={"url": "https://example.com/auto-title.xml"}
             )
@@ -145,9 +172,7 @@ class TestCreateSubscription:
         mock_feed.bozo = True
         mock_feed.entries = []
 
-        import feedparser
-
-        with patch.object(feedparser, "parse", return_value=mock_feed):
+        with patch("backend.api.subscriptions.download_feed", return_value=mock_feed):
             response = client.post(
                 "/api/subscriptions", json={"url": "https://example.com/invalid.xml"}
             )
@@ -155,15 +180,29 @@ class TestCreateSubscription:
         assert response.status_code == 400
         assert "Invalid RSS feed" in response.json()["detail"]
 
-    def test_create_subscription_duplicate(self, client, sample_feeds):
-        """Test creating duplicate subscription."""
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.entries = [{"title": "Test"}]
+    def test_create_subscription_unreachable_feed(self, client, isolated_test_db):
+        """Test creating subscription when the feed cannot be downloaded."""
+        import requests
 
-        import feedparser
+        with patch(
+            "backend.api.subscriptions.download_feed",
+            side_effect=requests.ConnectionError("unreachable"),
+        ):
+            response = client.post(
+                "/api/subscriptions", json={"url": "https://example.com/down.xml"}
+            )
+
+        assert response.status_code == 400
+        assert "Could not fetch" in response.json()["detail"]
 
-        with patch.object(feedparser, "parse", return_value=mock_feed):
+    def test_create_subscription_duplicate(self, client, sample_feeds):
+        """Test that a duplicate is rejected without downloading the feed."""
+        import requests
+
+        with patch(
+            "backend.api.subscriptions.download_feed",
+            side_effect=requests.RequestException("feed is down"),
+        ) as mock_download:
             response = client.post(
                 "/api/subscriptions",
                 json={"url": "https://example.com/feed1.xml"},  # Already exists
@@ -171,6 +210,7 @@ class TestCreateSubscription:
 
         assert response.status_code == 400
         assert "Already subscribed" in response.json()["detail"]
+        mock_download.assert_not_called()
 
 
 class TestGetSubscription:
@@ -206,6 +246,13 @@ class TestUpdateSubscription:
         assert response.status_code == 200
         assert response.json()["is_active"] is False
 
+    def test_update_subscription_persists(self, client, sample_feeds):
+        """Test that the update is committed, not just echoed back."""
+        client.put("/api/subscriptions/1", json={"category": "research"})
+
+        response = client.get("/api/subscriptions/1")
+        assert response.json()["category"] == "research"
+
     def test_update_subscription_not_found(self, client, sample_feeds):
         """Test updating non-existent subscription."""
         response = client.put("/api/subscriptions/999", json={"title": "New Title"})
@@ -259,7 +306,7 @@ class TestRefreshAllSubscriptions:
         """Test refreshing all subscriptions."""
         mock_result = {"new_count": 3, "notifications_count": 3}
 
-        with patch("mindscout.fetchers.rss.RSSFetcher.fetch_feed", return_value=mock_result):
+        with patch("mindscout.fetchers.rss.RSSFetcher.fetch_feed_by_id", return_value=mock_result):
             response = client.post("/api/subscriptions/refresh-all")
 
         assert response.status_code == 200
@@ -503,6 +503,7 @@ class TestGetArticlesByTopic:
 
         # Should find both articles with "learning" in topics
         assert len(results) == 2
+        assert {a.title for a in results} == {"ML Article", "Deep Learning Article"}
 
     def test_get_articles_by_topic_case_insensitive(self, mock_llm, isolated_test_db):
         """Test case-insensitive topic matching."""
@@ -550,3 +551,33 @@ class TestGetArticlesByTopic:
         results = processor.get_articles_by_topic("common topic", limit=3)
 
         assert len(results) == 3
+
+    def test_get_articles_by_topic_matches_literal_text(self, mock_llm, isolated_test_db):
+        """Test that wildcards, JSON quoting and non-ASCII topics match literally."""
+        import json
+
+        from mindscout.processors.content import ContentProcessor
+
+        session = get_session()
+        for i, topics in enumerate(
+            [["100% recall"], ["1000 recall"], ["deep", "learning"], ["Café analytics"]]
+        ):
+            session.add(
+                Article(
+                    source_id=f"literal-test-{i}",
+                    title=f"Literal {i}",
+                    abstract="Test",
+                    url=f"https://example.com/literal/{i}",
+                    source="test",
+                    topics=json.dumps(topics),
+                )
+            )
+        session.commit()
+        session.close()
+
+        processor = ContentProcessor(llm_client=mock_llm)
+
+        assert [a.title for a in processor.get_articles_by_topic("100%")] == ["Literal 0"]
+        assert processor.get_articles_by_topic('deep", "learning') == []
+        assert [a.title for a in processor.get_articles_by_topic("café")] == ["Literal 3"]
+        assert [a.title for a in processor.get_articles_by_topic("CAFÉ")] == ["Literal 3"]
@@ -6,6 +6,7 @@ from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 # Skip all tests if mcp module is not available
@@ -14,7 +15,13 @@ pytest.importorskip("mcp", reason="MCP module not installed")
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from mindscout.database import Article, UserProfile, get_session  # noqa: E402
+from mindscout.database import (  # noqa: E402
+    Article,
+    UserProfile,
+    get_db_session,
+    get_session,
+    insert_articles,
+)
 
 
 @pytest.fixture
@@ -116,10 +123,40 @@ def sample_profile(isolated_test_db):
     session.close()
 
 
+class TestToolList:
+    """Tests for the cached tools/list response."""
+
+    @pytest.mark.asyncio
+    async def test_tool_list_is_built_once(self, mcp_server):
+        """Test that repeated listings reuse the same tool list."""
+        tools = await mcp_server.mcp.list_tools()
+
+        assert "search_papers" in {tool.name for tool in tools}
+        assert await mcp_server.mcp.list_tools() is tools
+
+    @pytest.mark.asyncio
+    async def test_adding_a_tool_rebuilds_the_list(self, mcp_server):
+        """Test that registering a tool drops the cached list."""
+        tools = await mcp_server.mcp.list_tools()
+
+        mcp_server.mcp.add_tool(lambda: "pong", name="ping")
+
+        rebuilt = await mcp_server.mcp.list_tools()
+        assert len(rebuilt) == len(tools) + 1
+
+
 class TestSearchPapers:
     """Tests for search_papers tool."""
 
-    def test_search_papers_basic(self, mcp_server, sample_articles):
+    @pytest.fixture
+    def query_embedding(self, mcp_server):
+        """Stub out query embedding so tests don't load the sentence-transformer model."""
+        with patch.object(
+            mcp_server, "embed_query", return_value=np.array([1.0, 0.0], dtype=np.float32)
+        ) as mock_embed:
+            yield mock_embed
+
+    def test_search_papers_basic(self, mcp_server, sample_articles, query_embedding):
         """Test basic semantic search functionality."""
         # Get sample article
         session = get_session()
@@ -140,7 +177,7 @@ class TestSearchPapers:
             assert results[0]["relevance_score"] == 85.0
             mock_instance.close.assert_called_once()
 
-    def test_search_papers_empty_results(self, mcp_server):
+    def test_search_papers_empty_results(self, mcp_server, query_embedding):
         """Test search with no results."""
         with patch.object(mcp_server, "VectorStore") as mock_vs:
             mock_instance = MagicMock()
@@ -152,14 +189,100 @@ class TestSearchPapers:
             assert results == []
             mock_instance.close.assert_called_once()
 
+    def test_search_papers_reuses_similar_query(self, mcp_server, sample_articles):
+        """Test that a near-duplicate query is answered from the semantic cache."""
+        session = get_session()
+        article = session.query(Article).first()
+        session.close()
+
+        embeddings = {
+            "transformer papers": np.array([1.0, 0.0], dtype=np.float32),
+            "papers on transformers": np.array([0.99, 0.141], dtype=np.float32),
+            "diffusion models": np.array([0.0, 1.0], dtype=np.float32),
+        }
+        with (
+            patch.object(mcp_server, "embed_query", side_effect=embeddings.get),
+            patch.object(mcp_server, "VectorStore") as mock_vs,
+        ):
+            mock_instance = mock_vs.return_value
+            mock_instance.semantic_search.return_value = [{"article": article, "relevance": 0.9}]
+
+            first = mcp_server.search_papers(query="transformer papers", limit=5)
+            second = mcp_server.search_papers(query="papers on transformers", limit=3)
+            mcp_server.search_papers(query="diffusion models", limit=5)
+
+        assert second == first
+        assert mock_instance.semantic_search.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_cache_invalidated_by_library_change(self, mcp_server, sample_articles):
+        """Test that rating an article drops cached search results."""
+        session = get_session()
+        article = session.query(Article).first()
+        session.close()
+
+        with (
+            patch.object(
+                mcp_server, "embed_query", return_value=np.array([1.0, 0.0], dtype=np.float32)
+            ),
+            patch.object(mcp_server, "VectorStore") as mock_vs,
+        ):
+            mock_instance = mock_vs.return_value
+            mock_instance.semantic_search.return_value = [{"article": article, "relevance": 0.9}]
+
+            mcp_server.search_papers(query="transformers", limit=5)
+            await mcp_server.rate_article(article_id=article.id, rating=4)
+            results = mcp_server.search_papers(query="transformers", limit=5)
+
+        assert len(results) == 1
+        assert mock_instance.semantic_search.call_count == 2
+
+
+class TestGetRecommendations:
+    """Tests for get_recommendations tool."""
+
+    @pytest.mark.asyncio
+    async def test_get_recommendations_is_memoized(self, mcp_server, sample_articles):
+        """Test that an unchanged profile and library reuse the previous ranking."""
+        session = get_session()
+        article = session.query(Article).first()
+        session.close()
+
+        with patch.object(mcp_server, "RecommendationEngine") as mock_engine:
+            mock_engine.return_value.get_recommendations.return_value = [
+                {"article": article, "score": 0.75, "reasons": ["Recent"]}
+            ]
+
+            first = await mcp_server.get_recommendations(limit=5)
+            second = await mcp_server.get_recommendations(limit=5)
+
+        assert first == second
+        assert first[0]["match_score"] == 75.0
+        assert mock_engine.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_recommendations_recomputed_after_changes(self, mcp_server, sample_articles):
+        """Test that new interests or a read article give a fresh ranking."""
+        with patch.object(mcp_server, "RecommendationEngine") as mock_engine:
+            mock_engine.return_value.get_recommendations.return_value = []
+
+            await mcp_server.get_recommendations(limit=5)
+            await mcp_server.update_interests(interests=["transformers"])
+            await mcp_server.get_recommendations(limit=5)
+            await mcp_server.mark_article_read(article_id=sample_articles[0])
+            await mcp_server.get_recommendations(limit=5)
+
+        assert mock_engine.call_count == 3
+
 
 class TestGetArticle:
     """Tests for get_article tool."""
 
-    def test_get_article_success(self, mcp_server, sample_articles):
+    @pytest.mark.asyncio
+    async def test_get_article_success(self, mcp_server, sample_articles):
         """Test getting a specific article."""
         article_id = sample_articles[0]
-        result = mcp_server.get_article(article_id=article_id)
+        result = await mcp_server.get_article(article_id=article_id)
 
         assert result["id"] == article_id
         assert "title" in result
@@ -167,9 +290,10 @@ class TestGetArticle:
         assert "abstract" in result
         assert "url" in result
 
-    def test_get_article_not_found(self, mcp_server):
+    @pytest.mark.asyncio
+    async def test_get_article_not_found(self, mcp_server):
         """Test getting a non-existent article."""
-        result = mcp_server.get_article(article_id=99999)
+        result = await mcp_server.get_article(article_id=99999)
 
         assert "error" in result
         assert "not found" in result["error"]
@@ -178,69 +302,115 @@ class TestGetArticle:
 class TestListArticles:
     """Tests for list_articles tool."""
 
-    def test_list_articles_basic(self, mcp_server, sample_articles):
+    @pytest.mark.asyncio
+    async def test_list_articles_basic(self, mcp_server, sample_articles):
         """Test listing articles with default parameters."""
-        result = mcp_server.list_articles()
+        result = await mcp_server.list_articles()
 
         assert "articles" in result
         assert "total" in result
         assert result["total"] == 3
         assert len(result["articles"]) == 3
         assert result["page"] == 1
+        dates = sorted(a["published_date"] for a in result["articles"])
+        assert dates[0] == datetime(2017, 6, 12).isoformat()
+
+    @pytest.mark.asyncio
+    async def test_list_articles_dates_match_isoformat(self, mcp_server, sample_articles):
+        """Test that fractional seconds are formatted like datetime.isoformat()."""
+        published = datetime(2020, 5, 28, 9, 30, 15, 250000)
+        session = get_session()
+        article = session.query(Article).filter_by(source_id="ss_001").one()
+        article.published_date = published
+        session.commit()
+        article_id = article.id
+        session.close()
+
+        result = await mcp_server.list_articles()
+        listed = {a["id"]: a["published_date"] for a in result["articles"]}
+        detail = await mcp_server.get_article(article_id)
 
-    def test_list_articles_pagination(self, mcp_server, sample_articles):
+        assert listed[article_id] == published.isoformat()
+        assert listed[article_id] == detail["published_date"]
+
+    @pytest.mark.asyncio
+    async def test_list_articles_pagination(self, mcp_server, sample_articles):
         """Test pagination."""
-        result = mcp_server.list_articles(page=1, page_size=2)
+        result = await mcp_server.list_articles(page=1, page_size=2)
 
         assert len(result["articles"]) == 2
         assert result["total"] == 3
         assert result["total_pages"] == 2
 
-    def test_list_articles_unread_only(self, mcp_server, sample_articles):
+    @pytest.mark.asyncio
+    async def test_list_articles_unread_only(self, mcp_server, sample_articles):
         """Test filtering by unread status."""
-        result = mcp_server.list_articles(unread_only=True)
+        result = await mcp_server.list_articles(unread_only=True)
 
         assert result["total"] == 2  # Two unread articles
         for article in result["articles"]:
             assert not article["is_read"]
 
-    def test_list_articles_filter_by_source(self, mcp_server, sample_articles):
+    @pytest.mark.asyncio
+    async def test_list_articles_filter_by_source(self, mcp_server, sample_articles):
         """Test filtering by source."""
-        result = mcp_server.list_articles(source="arxiv")
+        result = await mcp_server.list_articles(source="arxiv")
 
         assert result["total"] == 2  # Two arxiv articles
         for article in result["articles"]:
             assert article["source"] == "arxiv"
 
+    @pytest.mark.asyncio
+    async def test_list_articles_cursor(self, mcp_server, sample_articles):
+        """Test that following next_cursor walks every article once."""
+        first = await mcp_server.list_articles(page_size=2)
+        second = await mcp_server.list_articles(page_size=2, cursor=first["next_cursor"])
+
+        ids = [a["id"] for a in first["articles"] + second["articles"]]
+        assert sorted(ids) == sorted(sample_articles)
+        assert second["next_cursor"] is None
+        assert second["total"] is None
+
+    @pytest.mark.asyncio
+    async def test_list_articles_invalid_cursor(self, mcp_server, sample_articles):
+        """Test that a bad cursor or a cursor with another sort is rejected."""
+        assert "error" in await mcp_server.list_articles(cursor="not-a-cursor")
+        assert "error" in await mcp_server.list_articles(sort_by="rating", cursor="x")
+
 
 class TestRateArticle:
     """Tests for rate_article tool."""
 
-    def test_rate_article_success(self, mcp_server, sample_articles):
+    @pytest.mark.asyncio
+    async def test_rate_article_success(self, mcp_server, sample_articles):
         """Test rating an article."""
         article_id = sample_articles[0]
-        result = mcp_server.rate_article(article_id=article_id, rating=4)
+        result = await mcp_server.rate_article(article_id=article_id, rating=4)
 
         assert result["success"]
         assert result["rating"] == 4
+        assert result["title"] == "Attention Is All You Need"
         assert "message" in result
 
         # Verify in database
         session = get_session()
         article = session.query(Article).filter(Article.id == article_id).first()
         assert article.rating == 4
+        assert article.rated_date is not None
         session.close()
 
-    def test_rate_article_invalid_rating(self, mcp_server, sample_articles):
+    @pytest.mark.asyncio
+    async def test_rate_article_invalid_rating(self, mcp_server, sample_articles):
         """Test rating with invalid value."""
-        result = mcp_server.rate_article(article_id=sample_articles[0], rating=6)
+        result = await mcp_server.rate_article(article_id=sample_articles[0], rating=6)
 
         assert "error" in result
         assert "between 1 and 5" in result["error"]
 
-    def test_rate_article_not_found(self, mcp_server):
+    @pytest.mark.asyncio
+    async def test_rate_article_not_found(self, mcp_server):
         """Test rating a non-existent article."""
-        result = mcp_server.rate_article(article_id=99999, rating=5)
+        result = await mcp_server.rate_article(article_id=99999, rating=5)
 
         assert "error" in result
         assert "not found" in result["error"]
@@ -249,10 +419,11 @@ class TestRateArticle:
 class TestMarkArticleRead:
     """Tests for mark_article_read tool."""
 
-    def test_mark_article_read_success(self, mcp_server, sample_articles):
+    @pytest.mark.asyncio
+    async def test_mark_article_read_success(self, mcp_server, sample_articles):
         """Test marking an article as read."""
         article_id = sample_articles[0]
-        result = mcp_server.mark_article_read(article_id=article_id, is_read=True)
+        result = await mcp_server.mark_article_read(article_id=article_id, is_read=True)
 
         assert result["success"]
         assert result["is_read"]
@@ -263,10 +434,11 @@ class TestMarkArticleRead:
         assert article.is_read
         session.close()
 
-    def test_mark_article_unread(self, mcp_server, sample_articles):
+    @pytest.mark.asyncio
+    async def test_mark_article_unread(self, mcp_server, sample_articles):
         """Test marking an article as unread."""
         article_id = sample_articles[1]  # This one is already read
-        result = mcp_server.mark_article_read(article_id=article_id, is_read=False)
+        result = await mcp_server.mark_article_read(article_id=article_id, is_read=False)
 
         assert result["success"]
         assert not result["is_read"]
@@ -275,9 +447,10 @@ class TestMarkArticleRead:
 class TestGetProfile:
     """Tests for get_profile tool."""
 
-    def test_get_profile_with_existing(self, mcp_server, sample_articles, sample_profile):
+    @pytest.mark.asyncio
+    async def test_get_profile_with_existing(self, mcp_server, sample_articles, sample_profile):
         """Test getting existing profile with statistics."""
-        result = mcp_server.get_profile()
+        result = await mcp_server.get_profile()
 
         assert "interests" in result
         assert "transformers" in result["interests"]
@@ -286,22 +459,49 @@ class TestGetProfile:
         assert result["statistics"]["read_articles"] == 1
         assert result["statistics"]["read_percentage"] == 33.3
 
-    def test_get_profile_without_existing(self, mcp_server, sample_articles):
+    @pytest.mark.asyncio
+    async def test_get_profile_without_existing(self, mcp_server, sample_articles):
         """Test getting profile when none exists."""
-        result = mcp_server.get_profile()
+        result = await mcp_server.get_profile()
 
         assert "interests" in result
         assert isinstance(result["interests"], list)
         assert "statistics" in result
 
+    @pytest.mark.asyncio
+    async def test_get_profile_statistics_follow_library_changes(self, mcp_server, sample_articles):
+        """Test that the trigger-maintained source counts track writes to articles."""
+        await mcp_server.rate_article(article_id=sample_articles[0], rating=3)
+        await mcp_server.mark_article_read(article_id=sample_articles[2])
+
+        with get_db_session() as session:
+            insert_articles(
+                session,
+                [
+                    {"source_id": f"rss_{i}", "source": "rss", "title": f"Post {i}", "url": "u"}
+                    for i in range(3)
+                ],
+            )
+            session.query(Article).filter(Article.source_id == "arxiv_002").delete()
+            session.query(Article).filter(Article.source_id == "ss_001").update({"source": "arxiv"})
+
+        stats = (await mcp_server.get_profile())["statistics"]
+
+        assert stats["total_articles"] == 5
+        assert stats["read_articles"] == 1
+        assert stats["rated_articles"] == 1
+        assert stats["average_rating"] == 3.0
+        assert stats["articles_by_source"] == {"arxiv": 2, "rss": 3}
+
 
 class TestUpdateInterests:
     """Tests for update_interests tool."""
 
-    def test_update_interests_new_profile(self, mcp_server):
+    @pytest.mark.asyncio
+    async def test_update_interests_new_profile(self, mcp_server):
         """Test updating interests for new profile."""
         interests = ["machine learning", "computer vision"]
-        result = mcp_server.update_interests(interests=interests)
+        result = await mcp_server.update_interests(interests=interests)
 
         assert result["success"]
         assert result["interests"] == interests
@@ -312,10 +512,11 @@ class TestUpdateInterests:
         assert profile.interests == "machine learning,computer vision"
         session.close()
 
-    def test_update_interests_existing_profile(self, mcp_server, sample_profile):
+    @pytest.mark.asyncio
+    async def test_update_interests_existing_profile(self, mcp_server, sample_profile):
         """Test updating interests for existing profile."""
         new_interests = ["reinforcement learning", "robotics"]
-        result = mcp_server.update_interests(interests=new_interests)
+        result = await mcp_server.update_interests(interests=new_interests)
 
         assert result["success"]
         assert result["interests"] == new_interests
@@ -508,3 +709,71 @@ class TestExecuteResearchPlan:
 
             assert not result["success"]
             assert result["error"] == "invalid_indices"
+
+
+class TestBatchExecute:
+    """Tests for batch_execute tool."""
+
+    @pytest.mark.asyncio
+    async def test_batch_execute_runs_all_ops_in_order(self, mcp_server, sample_articles):
+        """Test that each operation's result is returned in request order."""
+        article_id = sample_articles[0]
+        results = await mcp_server.batch_execute(
+            ops=[
+                {"tool": "rate_article", "args": {"article_id": article_id, "rating": 4}},
+                {"tool": "mark_article_read", "args": {"article_id": article_id}},
+                {"tool": "get_profile"},
+            ]
+        )
+
+        assert [r["tool"] for r in results] == ["rate_article", "mark_article_read", "get_profile"]
+        assert results[0]["result"]["rating"] == 4
+        assert results[1]["result"]["is_read"]
+        assert "statistics" in results[2]["result"]
+
+    @pytest.mark.asyncio
+    async def test_batch_execute_reports_errors(self, mcp_server, sample_articles):
+        """Test that failing and unknown operations are reported per operation."""
+        results = await mcp_server.batch_execute(
+            ops=[
+                {"tool": "rate_article", "args": {"article_id": 99999, "rating": 5}},
+                {"tool": "drop_tables"},
+                {"tool": "get_article", "args": {"article_id": sample_articles[0]}},
+            ]
+        )
+
+        assert "not found" in results[0]["error"]
+        assert "Unknown tool" in results[1]["error"]
+        assert results[2]["result"]["id"] == sample_articles[0]
+
+    @pytest.mark.asyncio
+    async def test_batch_execute_stop_on_error(self, mcp_server, sample_articles):
+        """Test that stop_on_error skips the operations after a failure."""
+        results = await mcp_server.batch_execute(
+            ops=[
+                {"tool": "rate_article", "args": {"article_id": 99999, "rating": 5}},
+                {"tool": "mark_article_read", "args": {"article_id": sample_articles[0]}},
+            ],
+            stop_on_error=True,
+        )
+
+        assert len(results) == 1
+        assert "error" in results[0]
+
+    @pytest.mark.asyncio
+    async def test_batch_execute_sequential_batch_commits(self, mcp_server, sample_articles):
+        """Test that a sequential batch's shared transaction is committed."""
+        article_id = sample_articles[0]
+        await mcp_server.batch_execute(
+            ops=[
+                {"tool": "rate_article", "args": {"article_id": article_id, "rating": 2}},
+                {"tool": "mark_article_read", "args": {"article_id": article_id}},
+            ],
+            stop_on_error=True,
+        )
+
+        session = get_session()
+        article = session.query(Article).filter(Article.id == article_id).first()
+        assert article.rating == 2
+        assert article.is_read
+        session.close()
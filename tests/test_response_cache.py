@@ -0,0 +1,109 @@
+"""Tests for the in-process API response cache."""
+
+import threading
+import time
+
+import orjson
+import pytest
+
+from backend.api.cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test ResponseCache get/set/invalidate."""
+
+    def test_set_and_get(self):
+        """Test that stored payloads are returned with their ETag."""
+        cache = ResponseCache()
+        body, etag = cache.set("key", {"a": 1})
+
+        assert orjson.loads(body) == {"a": 1}
+        assert cache.get("key") == (body, etag)
+
+    def test_expired_entry_is_dropped(self):
+        """Test that entries past their TTL are treated as missing."""
+        cache = ResponseCache()
+        cache.set("key", [1], ttl=0)
+
+        time.sleep(0.01)
+        assert cache.get("key") is None
+
+    def test_invalidate_prefix(self):
+        """Test that invalidate only drops keys with the given prefix."""
+        cache = ResponseCache()
+        cache.set("articles:stats", 1)
+        cache.set("articles:sources", 2)
+        cache.set("arxiv_categories", 3)
+
+        cache.invalidate("articles:")
+
+        assert cache.get("articles:stats") is None
+        assert cache.get("articles:sources") is None
+        assert cache.get("arxiv_categories") is not None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache stays within max_entries, evicting the LRU key."""
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+
+class TestGetOrSet:
+    """Test ResponseCache.get_or_set request coalescing."""
+
+    def test_computes_once_and_caches(self):
+        """Test that a hit does not call compute again."""
+        cache = ResponseCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return ["result"]
+
+        first = cache.get_or_set("key", compute, ttl=60)
+        second = cache.get_or_set("key", compute, ttl=60)
+
+        assert first == second
+        assert len(calls) == 1
+
+    def test_concurrent_misses_are_coalesced(self):
+        """Test that simultaneous misses for one key share a single computation."""
+        cache = ResponseCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return ["result"]
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_set("key", compute)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len(set(results)) == 1
+
+    def test_failed_compute_is_not_cached(self):
+        """Test that an exception propagates and the next call retries."""
+        cache = ResponseCache()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_set("key", fail)
+
+        assert cache.get_or_set("key", lambda: [1]) == cache.get("key")
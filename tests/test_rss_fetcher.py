@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from mindscout.database import Article, RSSFeed, get_session
-from mindscout.fetchers.rss import RSSFetcher
+from mindscout.fetchers.rss import RSSFetcher, download_feed
 
 
 @pytest.fixture
@@ -74,6 +74,95 @@ def create_mock_feed_entry(
     return entry
 
 
+class TestDownloadFeed:
+    """Test downloading feeds over the shared HTTP session."""
+
+    def test_download_feed_parses_response_body(self):
+        """Test that the downloaded bytes are handed to feedparser."""
+        response = MagicMock()
+        response.content = (
+            b"<?xml version='1.0'?><rss version='2.0'><channel><title>Blog</title>"
+            b"<item><title>Post</title><link>https://example.com/post</link></item>"
+            b"</channel></rss>"
+        )
+        response.headers = {"content-type": "application/rss+xml"}
+
+        with patch("requests.Session.get", return_value=response) as mock_get:
+            feed = download_feed("https://example.com/feed.xml")
+
+        mock_get.assert_called_once()
+        assert feed.feed.title == "Blog"
+        assert feed.entries[0].title == "Post"
+
+    def test_download_feed_conditional_not_modified(self):
+        """Test that validators are sent and a 304 yields an empty feed."""
+        response = MagicMock()
+        response.status_code = 304
+        response.headers = {"ETag": '"abc"'}
+
+        with patch("requests.Session.get", return_value=response) as mock_get:
+            feed = download_feed("https://example.com/feed.xml", etag='"abc"', modified="Mon")
+
+        sent = mock_get.call_args.kwargs["headers"]
+        assert sent == {"If-None-Match": '"abc"', "If-Modified-Since": "Mon"}
+        assert feed.status == 304
+        assert feed.etag == '"abc"'
+        assert feed.entries == []
+
+    def test_download_feed_head_probe_skips_unchanged_body(self):
+        """Test that a matching Last-Modified on HEAD avoids the GET."""
+        probe = MagicMock()
+        probe.ok = True
+        probe.headers = {"Last-Modified": "Mon"}
+
+        with patch("requests.Session.head", return_value=probe):
+            with patch("requests.Session.get") as mock_get:
+                feed = download_feed("https://example.com/feed.xml", modified="Mon")
+
+        mock_get.assert_not_called()
+        assert feed.status == 304
+
+    def test_download_feed_head_probe_falls_through_when_changed(self):
+        """Test that a newer Last-Modified on HEAD still downloads the feed."""
+        probe = MagicMock()
+        probe.ok = True
+        probe.headers = {"Last-Modified": "Tue"}
+        response = MagicMock()
+        response.status_code = 200
+        response.content = b"<rss version='2.0'><channel><title>Blog</title></channel></rss>"
+        response.headers = {"Last-Modified": "Tue"}
+
+        with patch("requests.Session.head", return_value=probe):
+            with patch("requests.Session.get", return_value=response) as mock_get:
+                feed = download_feed("https://example.com/feed.xml", modified="Mon")
+
+        mock_get.assert_called_once()
+        assert feed.feed.title == "Blog"
+        assert feed.modified == "Tue"
+
+    def test_download_feed_parses_in_worker_process(self):
+        """Test that feeds parsed in the process pool come back intact."""
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        response = MagicMock()
+        response.status_code = 200
+        response.content = b"<rss version='2.0'><channel><title>Blog</title></channel><oops"
+        response.headers = {"Content-Type": "application/rss+xml"}
+
+        pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            with patch("mindscout.fetchers.rss._get_parse_pool", return_value=pool):
+                with patch("requests.Session.get", return_value=response):
+                    feed = download_feed("https://example.com/feed.xml")
+        finally:
+            pool.shutdown()
+
+        assert feed.feed.title == "Blog"
+        assert feed.bozo
+        assert isinstance(feed.bozo_exception, str)
+
+
 class TestRSSFetcherParseEntry:
     """Test RSS entry parsing."""
 
@@ -164,7 +253,7 @@ class TestRSSFetcherFetchFeed:
             ),
         ]
 
-        with patch("mindscout.fetchers.rss.feedparser.parse", return_value=mock_parsed):
+        with patch("mindscout.fetchers.rss.download_feed", return_value=mock_parsed):
             result = fetcher.fetch_feed(sample_feed)
 
         assert result["new_count"] == 2
@@ -192,7 +281,7 @@ class TestRSSFetcherFetchFeed:
             ),
         ]
 
-        with patch("mindscout.fetchers.rss.feedparser.parse", return_value=mock_parsed):
+        with patch("mindscout.fetchers.rss.download_feed", return_value=mock_parsed):
             result = fetcher.fetch_feed(sample_feed)
 
         # Should only create one article
@@ -213,7 +302,7 @@ class TestRSSFetcherFetchFeed:
             ),
         ]
 
-        with patch("mindscout.fetchers.rss.feedparser.parse", return_value=mock_parsed):
+        with patch("mindscout.fetchers.rss.download_feed", return_value=mock_parsed):
             # First fetch
             result1 = fetcher.fetch_feed(sample_feed)
             assert result1["new_count"] == 1
@@ -236,7 +325,7 @@ class TestRSSFetcherFetchFeed:
 
         assert sample_feed.last_checked is None
 
-        with patch("mindscout.fetchers.rss.feedparser.parse", return_value=mock_parsed):
+        with patch("mindscout.fetchers.rss.download_feed", return_value=mock_parsed):
             fetcher.fetch_feed(sample_feed)
 
         # Reload feed from database
@@ -245,6 +334,77 @@ class TestRSSFetcherFetchFeed:
         assert feed.last_checked is not None
         session.close()
 
+    def test_fetch_feed_sends_validators_and_skips_unchanged(
+        self, fetcher, sample_feed, isolated_test_db
+    ):
+        """Test that stored ETag/Last-Modified are sent and a 304 adds nothing."""
+        session = get_session()
+        feed = session.query(RSSFeed).filter_by(id=sample_feed.id).first()
+        feed.last_etag = '"abc"'
+        feed.last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+        session.commit()
+        session.close()
+
+        mock_parsed = MagicMock(spec=[])
+        mock_parsed.status = 304
+        mock_parsed.feed = {}
+        mock_parsed.entries = []
+
+        with patch("mindscout.fetchers.rss.download_feed", return_value=mock_parsed) as mock_parse:
+            result = fetcher.fetch_feed(sample_feed)
+
+        assert result["new_count"] == 0
+        mock_parse.assert_called_once_with(
+            sample_feed.url, etag='"abc"', modified="Mon, 01 Jan 2024 00:00:00 GMT"
+        )
+
+        session = get_session()
+        feed = session.query(RSSFeed).filter_by(id=sample_feed.id).first()
+        assert feed.last_checked is not None
+        assert feed.last_etag == '"abc"'
+        session.close()
+
+    def test_fetch_feed_survives_download_error(self, fetcher, sample_feed, isolated_test_db):
+        """Test that an unreachable feed is marked checked and adds nothing."""
+        import requests
+
+        with patch(
+            "mindscout.fetchers.rss.download_feed",
+            side_effect=requests.ConnectionError("feed down"),
+        ):
+            result = fetcher.fetch_feed(sample_feed)
+
+        assert result["new_count"] == 0
+
+        session = get_session()
+        feed = session.query(RSSFeed).filter_by(id=sample_feed.id).first()
+        assert feed.last_checked is not None
+        assert feed.consecutive_failures == 1
+        assert feed.next_retry_at > feed.last_checked
+        session.close()
+
+    def test_fetch_feed_success_resets_backoff(self, fetcher, sample_feed, isolated_test_db):
+        """Test that a successful fetch clears the failure count."""
+        session = get_session()
+        feed = session.query(RSSFeed).filter_by(id=sample_feed.id).first()
+        feed.consecutive_failures = 3
+        feed.next_retry_at = datetime(2000, 1, 1)
+        session.commit()
+        session.close()
+
+        mock_parsed = MagicMock(spec=[])
+        mock_parsed.feed = {"title": "Test Feed"}
+        mock_parsed.entries = []
+
+        with patch("mindscout.fetchers.rss.download_feed", return_value=mock_parsed):
+            fetcher.fetch_feed(sample_feed)
+
+        session = get_session()
+        feed = session.query(RSSFeed).filter_by(id=sample_feed.id).first()
+        assert feed.consecutive_failures == 0
+        assert feed.next_retry_at is None
+        session.close()
+
 
 class TestRSSFetcherRefreshAllFeeds:
     """Test refreshing all feeds."""
@@ -270,10 +430,94 @@ class TestRSSFetcherRefreshAllFeeds:
             create_mock_feed_entry(title="Article", link="https://example.com/a", entry_id="a"),
         ]
 
-        with patch("mindscout.fetchers.rss.feedparser.parse", return_value=mock_parsed):
+        with patch("mindscout.fetchers.rss.download_feed", return_value=mock_parsed):
             # Need to patch at instance level since fetch_feed creates new sessions
             with patch.object(fetcher, "fetch_feed_by_id", return_value={"new_count": 1}):
                 result = fetcher.refresh_all_feeds()
 
         assert result["feeds_checked"] == 2  # Only active feeds
         assert result["new_count"] == 2
+
+    def test_refresh_all_feeds_skips_feeds_backing_off(self, fetcher, isolated_test_db):
+        """Test that feeds whose retry time has not come are skipped."""
+        session = get_session()
+        session.add_all(
+            [
+                RSSFeed(url="https://example.com/ok.xml", is_active=True),
+                RSSFeed(
+                    url="https://example.com/retry.xml",
+                    is_active=True,
+                    consecutive_failures=1,
+                    next_retry_at=datetime(2000, 1, 1),
+                ),
+                RSSFeed(
+                    url="https://example.com/broken.xml",
+                    is_active=True,
+                    consecutive_failures=5,
+                    next_retry_at=datetime(2999, 1, 1),
+                ),
+            ]
+        )
+        session.commit()
+        session.close()
+
+        with patch.object(fetcher, "fetch_feed_by_id", return_value={"new_count": 0}) as mock:
+            result = fetcher.refresh_all_feeds()
+
+        assert result["feeds_checked"] == 2
+        assert mock.call_count == 2
+
+    def test_refresh_all_feeds_continues_after_failure(self, fetcher, isolated_test_db):
+        """Test that one failing feed doesn't stop the others."""
+        session = get_session()
+        feeds = [
+            RSSFeed(url=f"https://example.com/feed{i}.xml", title=f"Feed {i}", is_active=True)
+            for i in range(3)
+        ]
+        session.add_all(feeds)
+        session.commit()
+        failing_id = feeds[1].id
+        session.close()
+
+        def fetch_feed_by_id(feed_id):
+            if feed_id == failing_id:
+                raise ConnectionError("feed down")
+            return {"new_count": 2}
+
+        with patch.object(fetcher, "fetch_feed_by_id", side_effect=fetch_feed_by_id):
+            result = fetcher.refresh_all_feeds()
+
+        assert result["feeds_checked"] == 2
+        assert result["new_count"] == 4
+
+
+class TestStoreArticles:
+    """Test the shared BaseFetcher.store_articles storage path."""
+
+    def test_store_articles_inserts_new_and_updates_existing(self, fetcher, isolated_test_db):
+        """Test that new articles are inserted and existing ones get fresh metadata."""
+        first = [
+            {"source_id": "a", "source": "rss", "title": "A", "url": "https://example.com/a"},
+            {"source_id": "b", "source": "rss", "title": "B", "url": "https://example.com/b"},
+        ]
+        assert fetcher.store_articles(first) == 2
+
+        second = [
+            {
+                "source_id": "a",
+                "source": "rss",
+                "title": "A",
+                "url": "https://example.com/a",
+                "citation_count": 7,
+            },
+            {"source_id": "c", "source": "rss", "title": "C", "url": "https://example.com/c"},
+            {"source_id": "c", "source": "rss", "title": "C", "url": "https://example.com/c"},
+        ]
+        assert fetcher.store_articles(second) == 1
+
+        session = get_session()
+        articles = {a.source_id: a for a in session.query(Article).all()}
+        assert sorted(articles) == ["a", "b", "c"]
+        assert articles["a"].citation_count == 7
+        assert articles["c"].fetched_date is not None
+        session.close()
@@ -1,11 +1,12 @@
 """Tests for scheduler jobs and batch processing."""
 
+import importlib
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from mindscout.database import Article, PendingBatch, get_db_session, get_session
+from mindscout.database import Article, PendingBatch, UserProfile, get_db_session, get_session
 
 
 @pytest.fixture
@@ -132,6 +133,156 @@ class TestFetchAndProcessJob:
         assert result["batch_id"] is None
         assert result["batch_articles"] == 0
 
+    @pytest.mark.asyncio
+    async def test_fetch_and_process_skips_batch_without_scheduler(
+        self, isolated_test_db, sample_unprocessed_articles
+    ):
+        """Test that no batch is created when nothing would ever apply its results."""
+        from backend.scheduler.jobs import fetch_and_process_job
+
+        settings = MagicMock(scheduler_enabled=False)
+        with patch("backend.scheduler.jobs.get_user_interests", return_value=[]):
+            with patch("backend.scheduler.jobs.get_settings", return_value=settings):
+                with patch("backend.scheduler.jobs.queue_processing_batch") as mock_queue:
+                    result = await fetch_and_process_job()
+
+        mock_queue.assert_not_called()
+        assert result["batch_id"] is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_and_process_collects_all_sources(self, isolated_test_db):
+        """Test that results from the concurrent fetchers are all reported."""
+        from backend.scheduler.jobs import fetch_and_process_job
+
+        rss_result = {"feeds": 2, "articles": 3}
+
+        with patch("backend.scheduler.jobs.get_user_interests", return_value=["llm"]):
+            with patch("backend.scheduler.jobs._fetch_rss", return_value=rss_result):
+                with patch("backend.scheduler.jobs._fetch_arxiv", return_value={"articles": 4}):
+                    with patch(
+                        "backend.scheduler.jobs._fetch_semanticscholar",
+                        return_value={"articles": 5},
+                    ):
+                        result = await fetch_and_process_job()
+
+        assert result["rss"] == {"feeds": 2, "articles": 3}
+        assert result["arxiv"]["articles"] == 4
+        assert result["semanticscholar"]["articles"] == 5
+
+    @pytest.mark.asyncio
+    async def test_fetch_arxiv_skips_failed_interests(self):
+        """Test that one failing arXiv search does not drop the others."""
+        from backend.scheduler.jobs import _fetch_arxiv
+
+        def fetch_and_store(keywords, **kwargs):
+            if keywords == "bad":
+                raise RuntimeError("boom")
+            return 2
+
+        with patch(
+            "mindscout.fetchers.arxiv_advanced.ArxivAdvancedFetcher.fetch_and_store",
+            side_effect=fetch_and_store,
+        ) as mock_fetch:
+            result = await _fetch_arxiv(["llm", "bad", "agents"])
+
+        assert result["articles"] == 4
+        assert mock_fetch.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_arxiv_handles_fetcher_setup_failure(self):
+        """Test that a fetcher that cannot be created is logged, not raised."""
+        from backend.scheduler.jobs import _fetch_arxiv
+
+        with patch(
+            "mindscout.fetchers.arxiv_advanced.ArxivAdvancedFetcher",
+            side_effect=RuntimeError("boom"),
+        ):
+            result = await _fetch_arxiv(["llm"])
+
+        assert result == {"articles": 0}
+
+    @pytest.mark.asyncio
+    async def test_fetch_and_process_survives_failing_source(self, isolated_test_db):
+        """Test that one source raising does not abort the others or the job."""
+        from backend.scheduler.jobs import fetch_and_process_job
+
+        rss_result = {"feeds": 2, "articles": 3}
+
+        with patch("backend.scheduler.jobs.get_user_interests", return_value=["llm"]):
+            with patch("backend.scheduler.jobs._fetch_rss", return_value=rss_result):
+                with patch("backend.scheduler.jobs._fetch_arxiv", side_effect=RuntimeError("boom")):
+                    with patch(
+                        "backend.scheduler.jobs._fetch_semanticscholar",
+                        return_value={"articles": 5},
+                    ):
+                        result = await fetch_and_process_job()
+
+        assert result["rss"] == {"feeds": 2, "articles": 3}
+        assert result["arxiv"] == {"articles": 0}
+        assert result["semanticscholar"]["articles"] == 5
+        assert "batch_id" in result
+
+
+class TestGetUserInterests:
+    """Test reading profile interests for the daily job."""
+
+    def test_no_profile(self, isolated_test_db):
+        """Test that a missing profile yields no interests."""
+        from backend.scheduler.jobs import get_user_interests
+
+        assert get_user_interests() == []
+
+    def test_parses_comma_separated_interests(self, isolated_test_db):
+        """Test that stored interests are split and stripped."""
+        from backend.scheduler.jobs import get_user_interests
+
+        with get_db_session() as session:
+            session.add(UserProfile(interests="llm, agents,, rag "))
+
+        assert get_user_interests() == ["llm", "agents", "rag"]
+
+
+class TestQueueProcessingBatch:
+    """Test queueing unprocessed articles as a pending batch."""
+
+    def test_queue_processing_batch_caps_article_count(
+        self, isolated_test_db, sample_unprocessed_articles
+    ):
+        """Test that the recorded article count respects the limit."""
+        from backend.scheduler.jobs import queue_processing_batch
+
+        mock_processor = MagicMock()
+        mock_processor.create_async_batch.return_value = "msgbatch_queued"
+
+        with patch("mindscout.processors.content.ContentProcessor", return_value=mock_processor):
+            batch_id, article_count = queue_processing_batch(limit=3)
+
+        assert batch_id == "msgbatch_queued"
+        assert article_count == 3
+        mock_processor.create_async_batch.assert_called_once_with(limit=3)
+
+        with get_db_session() as session:
+            batch = session.query(PendingBatch).filter_by(batch_id="msgbatch_queued").first()
+            assert batch.article_count == 3
+            assert batch.status == "pending"
+
+    def test_queue_processing_batch_returns_batch_in_flight(
+        self, isolated_test_db, sample_unprocessed_articles
+    ):
+        """Test that an unfinished batch is returned instead of submitting a new one."""
+        from backend.scheduler.jobs import queue_processing_batch
+
+        with get_db_session() as session:
+            session.add(
+                PendingBatch(batch_id="msgbatch_running", article_count=5, status="processing")
+            )
+
+        mock_processor = MagicMock()
+        with patch("mindscout.processors.content.ContentProcessor", return_value=mock_processor):
+            assert queue_processing_batch(limit=3) == ("msgbatch_running", 5)
+
+        mock_processor.create_async_batch.assert_not_called()
+
 
 class TestCheckPendingBatchesJob:
     """Test the batch checking job."""
@@ -200,12 +351,16 @@ class TestCheckPendingBatchesJob:
 
         with patch("mindscout.processors.llm.LLMClient", return_value=mock_llm):
             with patch("mindscout.processors.content.ContentProcessor"):
-                result = await check_pending_batches_job()
+                with patch("backend.scheduler.jobs.schedule_batch_check") as mock_schedule:
+                    result = await check_pending_batches_job()
 
         assert result["checked"] == 1
         assert result["still_pending"] == 1
         assert result["completed"] == 0
 
+        # A fresh batch is checked again after the minimum delay
+        mock_schedule.assert_called_once_with(5)
+
         # Verify batch status updated to processing
         with get_db_session() as session:
             batch = session.query(PendingBatch).filter_by(batch_id="msgbatch_processing").first()
@@ -244,6 +399,47 @@ class TestCheckPendingBatchesJob:
             assert batch.status == "failed"
             assert "expired" in batch.error_message
 
+    @pytest.mark.asyncio
+    async def test_check_pending_batches_mixed_statuses(self, isolated_test_db):
+        """Test that each batch gets its own outcome when several are checked."""
+        from backend.scheduler.jobs import check_pending_batches_job
+
+        with get_db_session() as session:
+            for batch_id in ["msgbatch_a", "msgbatch_b", "msgbatch_c", "msgbatch_d"]:
+                session.add(PendingBatch(batch_id=batch_id, article_count=1, status="pending"))
+
+        counts = {"succeeded": 0, "processing": 0, "errored": 0, "canceled": 0, "expired": 0}
+        statuses = {
+            "msgbatch_a": {"status": "in_progress", "counts": counts},
+            "msgbatch_b": {"status": "canceled", "counts": counts},
+            "msgbatch_c": {"status": "in_progress", "counts": counts},
+        }
+
+        def get_batch_status(batch_id):
+            if batch_id not in statuses:
+                raise RuntimeError("API unavailable")
+            return statuses[batch_id]
+
+        mock_llm = MagicMock()
+        mock_llm.get_batch_status.side_effect = get_batch_status
+
+        with patch("mindscout.processors.llm.LLMClient", return_value=mock_llm):
+            with patch("mindscout.processors.content.ContentProcessor"):
+                result = await check_pending_batches_job()
+
+        assert result["checked"] == 4
+        assert result["still_pending"] == 2
+        assert result["failed"] == 2
+
+        with get_db_session() as session:
+            batches = {b.batch_id: b for b in session.query(PendingBatch).all()}
+            assert batches["msgbatch_a"].status == "processing"
+            assert batches["msgbatch_b"].status == "failed"
+            assert batches["msgbatch_c"].status == "processing"
+            # A failed status check leaves the batch to be retried next run
+            assert batches["msgbatch_d"].status == "pending"
+            assert batches["msgbatch_d"].error_message == "API unavailable"
+
     @pytest.mark.asyncio
     async def test_check_pending_batches_no_pending(self, isolated_test_db):
         """Test with no pending batches."""
@@ -256,3 +452,36 @@ class TestCheckPendingBatchesJob:
 
         assert result["checked"] == 0
         assert result["completed"] == 0
+
+
+class TestScheduleBatchCheck:
+    """Tests for one-shot batch check scheduling."""
+
+    def test_noop_when_scheduler_not_running(self):
+        """Test that nothing is scheduled when the scheduler is stopped."""
+        scheduler_module = importlib.import_module("backend.scheduler.scheduler")
+
+        with patch.object(scheduler_module, "scheduler") as mock_scheduler:
+            mock_scheduler.running = False
+            scheduler_module.schedule_batch_check(5)
+
+        mock_scheduler.add_job.assert_not_called()
+
+    def test_keeps_earlier_check(self):
+        """Test that a later check does not replace one already due sooner."""
+        scheduler_module = importlib.import_module("backend.scheduler.scheduler")
+
+        with patch.object(scheduler_module, "scheduler") as mock_scheduler:
+            mock_scheduler.running = True
+            mock_scheduler.get_job.return_value = None
+            scheduler_module.schedule_batch_check(5)
+            assert mock_scheduler.add_job.call_count == 1
+
+            mock_scheduler.get_job.return_value = MagicMock(
+                next_run_time=mock_scheduler.add_job.call_args.args[1].run_date
+            )
+            scheduler_module.schedule_batch_check(30)
+            assert mock_scheduler.add_job.call_count == 1
+
+            scheduler_module.schedule_batch_check(1)
+            assert mock_scheduler.add_job.call_count == 2